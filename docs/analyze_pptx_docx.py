@@ -1,25 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from docx import Document
 import sys
 import os
 
+from pptx_stream import count_slides, iter_slide_texts
+
 def analyze_presentation(pptx_path):
     """Analyze existing presentation structure"""
     result = []
     result.append("=== СТРУКТУРА ІСНУЮЧОЇ ПРЕЗЕНТАЦІЇ ===\n")
 
     try:
-        prs = Presentation(pptx_path)
-        result.append(f"Всього слайдів: {len(prs.slides)}\n")
+        result.append(f"Всього слайдів: {count_slides(pptx_path)}\n")
 
-        for i, slide in enumerate(prs.slides, 1):
+        for i, texts in iter_slide_texts(pptx_path):
             result.append(f"\n--- Слайд {i} ---")
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    result.append(f"  {shape.text}")
+            for text in texts:
+                result.append(f"  {text}")
 
     except Exception as e:
         result.append(f"Помилка читання презентації: {e}")
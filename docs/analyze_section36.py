@@ -2,40 +2,35 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from docx import Document
+from doc_server import fetch
 
-doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx')
+# Абзаци беруться з сервера документів (doc_server.py serve), якщо він запущений
+DOCUMENT = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx'
 
 print("=== ДЕТАЛЬНИЙ АНАЛІЗ РОЗДІЛУ 3.6 ===\n")
 
-# Знайдемо розділ 3.6
-start_36 = None
-end_36 = None
-for i, para in enumerate(doc.paragraphs):
-    text = para.text.strip()
-    if "3.6 Огляд застосунку" in text or (text.startswith("3.6") and "Огляд" in text):
-        start_36 = i
-        print(f"[{i}] ПОЧАТОК 3.6: {text}")
-    elif start_36 and (text.startswith("3.7") or text.startswith("РОЗДІЛ") or text.startswith("ВИСНОВКИ")):
-        end_36 = i
-        print(f"[{i}] КІНЕЦЬ 3.6: {text}")
-        break
+# Розділ 3.6 - від заголовка до наступного заголовка того ж або вищого рівня
+section = fetch('section', DOCUMENT, title='3.6 Огляд', empty=True)
+
+if section:
+    start_36 = section[0]['position']
+    end_36 = section[-1]['position'] + 1
+    print(f"[{start_36}] ПОЧАТОК 3.6: {section[0]['text']}")
+    print(f"[{end_36}] КІНЕЦЬ 3.6")
 
-if start_36 and end_36:
     print(f"\n=== ВСЬОГО ПАРАГРАФІВ в 3.6: {end_36 - start_36} ===\n")
     print("=== РИСУНКИ ТА ОПИСИ ===\n")
 
-    i = start_36
-    while i < end_36:
-        text = doc.paragraphs[i].text.strip()
+    for index, para in enumerate(section):
+        text = para['text']
         # Знайдемо рисунок
         if text.lower().startswith("рис"):
-            print(f"\n[{i}] РИСУНОК: {text}")
+            print(f"\n[{para['position']}] РИСУНОК: {text}")
             # Перевіримо, чи є опис після рисунка
-            if i + 1 < end_36:
-                next_text = doc.paragraphs[i+1].text.strip()
+            if index + 1 < len(section):
+                next_para = section[index + 1]
+                next_text = next_para['text']
                 if next_text and not next_text.lower().startswith("рис") and not next_text.startswith("3."):
-                    print(f"  [{i+1}] ОПИС: {next_text[:150]}...")
+                    print(f"  [{next_para['position']}] ОПИС: {next_text[:150]}...")
                 else:
                     print(f"  !!! НЕМАЄ ОПИСУ або наступний елемент: {next_text[:80] if next_text else '(пусто)'}")
-        i += 1
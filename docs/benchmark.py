@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Відтворюваний набір вимірювань продуктивності скриптів обробки роботи.
+
+Для кожного розміру синтетичної роботи (synthetic_thesis.py, той самий
+seed - той самий документ) окремо вимірюються завантаження, збереження
+та етапи, що відповідають скриптам: заміна тире і виправлення підписів
+(fix_dashes_and_captions.py), перевірка підписів (check_all_captions.py),
+форматування джерел (fix_all_final.py), злиття run, ефективні стилі,
+перевірка оформлення, експорт у SQLite, точки збереження транзакцій,
+збирання презентації (thesis_summarizer + slide_manifest) і потокове
+виправлення тире та підписів (stream_transform.py). Етапи, яким
+потрібен відкритий документ, отримують свіжу копію, і її завантаження в
+час етапу не входить.
+
+Кожен етап повторюється --repeat разів; у JSON записуються min, медіана,
+середнє, стандартне відхилення і max разом із комітом git, версіями
+Python і бібліотек та параметрами документа. --compare порівнює медіани з
+попереднім результатом; регресією вважається етап, у якого і медіана, і
+min зросли більш ніж на 10%, а різниця медіан перевищує подвійний розкид
+(stdev). Для порівняння потрібно щонайменше MIN_COMPARE_REPEAT повторів.
+
+Використання:
+    python benchmark.py [--sizes 1000,10000] [--repeat 5] [--stages load,dashes]
+                        [-o результат.json] [--compare попередній.json]
+    python benchmark.py --list
+"""
+
+from docx import Document
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic_thesis import CACHE_DIR, cached_thesis
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(CACHE_DIR, 'results')
+RESULTS_VERSION = 1
+REGRESSION = 1.10
+# Менше повторів дає медіану, що між двома запусками одного коміту гуляє на десятки відсотків
+MIN_COMPARE_REPEAT = 5
+
+# Розмір роботи -> кількість таблиць, рисунків і джерел
+SIZES = {
+    1000: (10, 10, 50),
+    10000: (40, 40, 200),
+    100000: (200, 100, 1000),
+}
+
+DASHES_RE = '[‒–—―‐‑−­]'
+CAPTION_DASH_RE = r'^((?:Таблиця|Рисунок)\s+\d+\.\d+)\.?\s*-\s*'
+SOURCES_HEADING = 'СПИСОК ВИКОРИСТАНИХ ДЖЕРЕЛ'
+
+
+# --- Етапи: setup(path) -> стан (не вимірюється), run(стан) -> лічильник ---
+
+def _load(path):
+    return Document(path)
+
+
+def _save(doc):
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.tell()
+
+
+def _coalesce(doc):
+    from run_coalescer import coalesce_document
+    return coalesce_document(doc)[1]
+
+
+def _dashes(doc):
+    from run_locator import replace_in_document
+    changed = replace_in_document(doc, DASHES_RE, '-', regex=True)
+    changed += replace_in_document(doc, CAPTION_DASH_RE, r'\1. ', regex=True)
+    return len(changed)
+
+
+def _check_captions(doc):
+    captions = 0
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if re.match(r'^(Таблиця|Рисунок)\s+\d+\.\d+', text):
+            re.search(r'\d+\.\d+\.?\s*-', text)
+            captions += 1
+    return captions
+
+
+def _format_sources(doc):
+    from run_locator import ParagraphText
+    paragraphs = doc.paragraphs
+    start = next(i for i, para in enumerate(paragraphs) if para.text.strip() == SOURCES_HEADING)
+    number = 0
+    for para in paragraphs[start + 1:]:
+        text = para.text.strip()
+        if text.startswith('ДОДАТ'):
+            break
+        if not text:
+            continue
+        number += 1
+        clean = re.sub(r'\(дата звернення:?\s*[\d\.]+\)\.?', '', re.sub(r'^\d+\.\s*', '', text)).strip().rstrip('.')
+        ParagraphText(para).rewrite(f'{number}. {clean} (дата звернення: 01.12.2025).')
+    return number
+
+
+def _resolve_styles(doc):
+    from style_resolver import iter_formatting
+    return sum(len(runs) for _, _, runs in iter_formatting(doc))
+
+
+def _format_check(doc):
+    from format_check import FormatChecker, load_profile
+    return len(FormatChecker(doc, load_profile()).check()[0])
+
+
+def _export_setup(path):
+    directory = tempfile.mkdtemp(prefix='bench-export-')
+    return path, directory
+
+
+def _export(state):
+    from doc_export import connect, export
+    path, directory = state
+    connection = connect(os.path.join(directory, f'{time.perf_counter_ns()}.sqlite'))
+    stats = export(connection, [path], workers=1)
+    connection.close()
+    return stats['paragraphs']
+
+
+def _transaction(doc):
+    from doc_transaction import DocumentTransaction
+    transaction = DocumentTransaction(doc)
+    transaction.savepoint('stage')
+    doc.paragraphs[0].text = 'changed'
+    transaction.rollback('stage')
+    return len(doc.element.body)
+
+
+def _stream_setup(path):
+    return path, tempfile.mkdtemp(prefix='bench-stream-')
+
+
+def _stream(state):
+    from stream_transform import transform_docx
+    path, directory = state
+    return transform_docx(path, os.path.join(directory, 'out.docx'))['changed']
+
+
+def _presentation_setup(path):
+    return path, tempfile.mkdtemp(prefix='bench-deck-')
+
+
+def _presentation(state):
+    from pptx import Presentation
+    from create_complete_presentation import SLIDE_BUILDERS
+    from slide_manifest import build_deck
+    from thesis_summarizer import summarize, to_slide_specs
+    path, directory = state
+    # Порожні кеші: вимірюється холодне збирання
+    cache = os.path.join(directory, str(time.perf_counter_ns()))
+    specs = to_slide_specs(summarize(path, cache_dir=os.path.join(cache, 'tfidf')))
+    prs = Presentation()
+    stats = build_deck(prs, specs, SLIDE_BUILDERS, cache_dir=os.path.join(cache, 'slides'))
+    prs.save(io.BytesIO())
+    return stats['built']
+
+
+STAGES = {
+    'load': (lambda path: path, _load),
+    'save': (_load, _save),
+    'coalesce': (_load, _coalesce),
+    'dashes': (_load, _dashes),
+    'check_captions': (_load, _check_captions),
+    'format_sources': (_load, _format_sources),
+    'resolve_styles': (_load, _resolve_styles),
+    'format_check': (_load, _format_check),
+    'export': (_export_setup, _export),
+    'transaction': (_load, _transaction),
+    'presentation': (_presentation_setup, _presentation),
+    'stream': (_stream_setup, _stream),
+}
+# Етапи, що створюють тимчасові каталоги (прибираються після вимірювання)
+TEMPORARY = {'export', 'presentation', 'stream'}
+
+
+# --- Вимірювання ---
+
+def measure(stage, path, repeat):
+    """Time one stage repeat times; returns the result entry"""
+    setup, run = STAGES[stage]
+    times = []
+    result = None
+    state = None
+    for _ in range(repeat):
+        state = setup(path)
+        start = time.perf_counter()
+        result = run(state)
+        times.append(time.perf_counter() - start)
+        if stage in TEMPORARY:
+            shutil.rmtree(state[1], ignore_errors=True)
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'max': max(times),
+        'repeat': repeat,
+        'result': result if isinstance(result, (int, float)) else None,
+    }
+
+
+def environment():
+    def version(module):
+        try:
+            return __import__(module).__version__
+        except (ImportError, AttributeError):
+            return None
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DOCS_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=DOCS_DIR,
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'libraries': {module: version(module) for module in ('docx', 'lxml', 'pptx', 'numpy', 'scipy')},
+    }
+
+
+def run_benchmarks(sizes, stages, repeat, seed=0, log=print):
+    results = {'version': RESULTS_VERSION, 'environment': environment(), 'seed': seed, 'documents': {}}
+    for size in sizes:
+        tables, images, sources = SIZES.get(size, (size // 250, size // 250, min(1000, max(50, size // 100))))
+        start = time.perf_counter()
+        path = cached_thesis(size, tables, images, sources, seed=seed)
+        log(f"\n=== {size} абзаців: {os.path.basename(path)} ({time.perf_counter() - start:.1f} с) ===")
+        entry = {
+            'parameters': {'paragraphs': size, 'tables': tables, 'images': images, 'sources': sources},
+            'file_size': os.path.getsize(path),
+            'stages': {},
+        }
+        for stage in stages:
+            stats = measure(stage, path, repeat)
+            entry['stages'][stage] = stats
+            log(f"  {stage:16} медіана {stats['median'] * 1000:10.1f} мс  "
+                f"(min {stats['min'] * 1000:.1f}, ±{stats['stdev'] * 1000:.1f})")
+        results['documents'][str(size)] = entry
+    return results
+
+
+def is_regression(before, after, threshold=REGRESSION):
+    """
+    Whether a stage got slower beyond noise: median and min both grew by
+    more than threshold and the medians differ by more than twice the
+    larger stdev.
+    """
+    if not before['median'] or not before['min']:
+        return False
+    return (after['median'] / before['median'] > threshold and after['min'] / before['min'] > threshold
+            and after['median'] - before['median'] > 2 * max(before['stdev'], after['stdev']))
+
+
+def compare(current, previous, threshold=REGRESSION):
+    """[(size, stage, previous median, current median, ratio, regression)] for stages present in both"""
+    rows = []
+    for size, entry in current['documents'].items():
+        old = previous.get('documents', {}).get(size)
+        if old is None:
+            continue
+        for stage, stats in entry['stages'].items():
+            if stage in old['stages']:
+                before = old['stages'][stage]
+                ratio = stats['median'] / before['median'] if before['median'] else None
+                rows.append((size, stage, before['median'], stats['median'], ratio,
+                             is_regression(before, stats, threshold)))
+    return rows
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Benchmark thesis processing stages on synthetic documents')
+    parser.add_argument('--sizes', default='1000,10000', help='paragraph counts, comma separated')
+    parser.add_argument('--stages', default=','.join(STAGES), help='stages, comma separated')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='results JSON (under .cache/bench/results by default)')
+    parser.add_argument('--compare', help='previous results JSON')
+    parser.add_argument('--list', action='store_true', help='list stages')
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            print(stage)
+        sys.exit(0)
+
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(',')]
+    if args.compare and args.repeat < MIN_COMPARE_REPEAT:
+        parser.error(f'--compare needs --repeat {MIN_COMPARE_REPEAT} or more')
+
+    results = run_benchmarks(sizes, stages, args.repeat, args.seed)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = results['environment']['timestamp'].replace(':', '')
+        output = os.path.join(RESULTS_DIR, f"{results['environment']['commit'] or 'nogit'}-{stamp}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nРезультати: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print(f"\n=== ПОРІВНЯННЯ З {previous['environment'].get('commit')} ===")
+        if any(stats.get('repeat', 0) < MIN_COMPARE_REPEAT
+               for entry in previous.get('documents', {}).values() for stats in entry['stages'].values()):
+            print(f"  (у попередньому результаті менше {MIN_COMPARE_REPEAT} повторів, порівняння неточне)")
+        regressions = 0
+        for size, stage, before, after, ratio, regression in compare(results, previous):
+            mark = ''
+            if regression:
+                mark = '  <- повільніше'
+                regressions += 1
+            print(f"  {size:>7} {stage:16} {before * 1000:10.1f} -> {after * 1000:10.1f} мс  "
+                  f"x{ratio:.2f}{mark}" if ratio else f"  {size:>7} {stage:16} -")
+        sys.exit(1 if regressions else 0)
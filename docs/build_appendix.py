@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Збирання Markdown та HTML документації проєкту в один docx з додатками.
+
+Кожне джерело розбирається в окремому процесі у список блоків
+(markdown_blocks / html_blocks), після чого всі блоки записуються в один
+документ: стилі беруться з одного шаблону, а нумеровані списки лише
+додають w:num з перезапуском до спільного w:abstractNum.
+
+Використання:
+    python build_appendix.py [-o output.docx] [-j workers] [джерела ...]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from docx import Document
+from docx.shared import Pt
+import argparse
+import os
+import sys
+
+from docx_builder import BodyWriter, make_page_break, make_paragraph
+from html_blocks import iter_html_blocks
+from markdown_blocks import tokenize_blocks, tokenize_inline
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SOURCES = [
+    'API.md',
+    'ARCHITECTURE.md',
+    'chapter3_implementation_tools.md',
+    'chapter4_testing.md',
+    'conclusions.html',
+    'database_tables.html',
+]
+
+DEFAULT_OUTPUT = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_ДОДАТКИ.docx'
+
+# Літери додатків за ДСТУ 3008 (без Ґ, Є, З, І, Ї, Й, О, Ч, Ь)
+APPENDIX_LETTERS = 'АБВГДЕЖКЛМНПРСТУФХЦШЩЮЯ'
+
+
+def resolve_sources(paths):
+    """Absolute source paths; when name.md and name.html are both given, keep the .md"""
+    by_stem = {}
+    for path in paths:
+        if not os.path.exists(path):
+            path = os.path.join(DOCS_DIR, path)
+        path = os.path.abspath(path)
+        stem, ext = os.path.splitext(path)
+        if stem not in by_stem or ext.lower() == '.md':
+            by_stem[stem] = path
+    return list(by_stem.values())
+
+
+def parse_source(path):
+    """Parse one source file into a list of blocks with inline fragments"""
+    if path.lower().endswith(('.html', '.htm')):
+        return list(iter_html_blocks(path))
+
+    with open(path, 'r', encoding='utf-8') as f:
+        blocks = list(tokenize_blocks(f))
+    for block in blocks:
+        if 'text' in block:
+            block['fragments'] = tokenize_inline(block.pop('text'))
+        if block['type'] == 'table':
+            block['header'] = [tokenize_inline(cell) for cell in block['header']]
+            block['rows'] = [[tokenize_inline(cell) for cell in row] for row in block['rows']]
+    return blocks
+
+
+def build_appendix(sources, output_path, workers=None):
+    """Parse sources in parallel and assemble them into one docx"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parsed = list(pool.map(parse_source, sources))
+
+    doc = Document()
+    style = doc.styles['Normal']
+    style.font.name = 'Times New Roman'
+    style.font.size = Pt(14)
+
+    writer = BodyWriter(doc)
+    for index, (path, blocks) in enumerate(zip(sources, parsed)):
+        if index:
+            writer.append(make_page_break())
+        letter = APPENDIX_LETTERS[index % len(APPENDIX_LETTERS)]
+        writer.append(make_paragraph(
+            [(f'ДОДАТОК {letter}', {'bold': True})],
+            style_id=writer.style_id('Heading 1'), alignment='center',
+            font='Times New Roman', color='000000',
+        ))
+        writer.previous = None
+        writer.write_blocks(blocks)
+        print(f"  {letter}: {os.path.basename(path)} - {len(blocks)} блоків")
+
+    doc.save(output_path)
+    return output_path
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Build the documentation appendix docx')
+    parser.add_argument('sources', nargs='*', default=DEFAULT_SOURCES)
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes')
+    args = parser.parse_args()
+
+    sources = resolve_sources(args.sources)
+    print(f"=== ЗБИРАННЯ ДОДАТКІВ: {len(sources)} файлів ===\n")
+    output = build_appendix(sources, args.output, args.jobs)
+    print(f"\nДокумент збережено: {output}")
@@ -2,15 +2,13 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from docx import Document
+from doc_server import fetch
 
-doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL.docx')
+# Абзаци беруться з сервера документів (doc_server.py serve), якщо він запущений
+DOCUMENT = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL.docx'
 
 print("=== СТРУКТУРА ДІАГРАМ ===\n")
 
 # Показуємо параграфи 605-630
-for i in range(605, 630):
-    if i < len(doc.paragraphs):
-        text = doc.paragraphs[i].text.strip()
-        if text:
-            print(f"[{i}] {text[:100]}")
+for para in fetch('range', DOCUMENT, start=605, end=630):
+    print(f"[{para['position']}] {para['text'][:100]}")
@@ -6,9 +6,14 @@
 from docx import Document
 import re
 
+from run_coalescer import coalesce_document, report
+
 output_file = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL3.docx'
 doc = Document(output_file)
 
+# Текст абзацу збирається з менших за кількістю run
+print(report(*coalesce_document(doc)))
+
 # Різні види тире
 dash_chars = {
     '\u2013': 'en dash',
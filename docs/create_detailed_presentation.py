@@ -8,6 +8,8 @@ from pptx.dml.color import RGBColor
 from docx import Document
 import os
 
+from slide_layout import content_area, place_pictures
+
 def add_title_slide(prs, title, subtitle):
     """Add title slide"""
     slide_layout = prs.slide_layouts[0]
@@ -81,16 +83,7 @@ def add_image_slide(prs, title, image_path, caption=None):
 
     # Add image
     if os.path.exists(image_path):
-        left = Inches(1)
-        top = Inches(1.2)
-        max_width = Inches(8)
-        max_height = Inches(5.5)
-
-        pic = slide.shapes.add_picture(image_path, left, top, width=max_width)
-
-        # Center the image
-        left = (prs.slide_width - pic.width) / 2
-        pic.left = int(left)
+        place_pictures(slide, [image_path], content_area(prs, caption=bool(caption)))
 
     # Add caption if provided
     if caption:
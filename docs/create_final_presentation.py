@@ -7,6 +7,8 @@ from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 import os
 
+from slide_layout import content_area, place_pictures
+
 def add_title_slide(prs, title, subtitle):
     """Add title slide"""
     slide_layout = prs.slide_layouts[0]
@@ -78,16 +80,7 @@ def add_image_slide(prs, title, image_path, caption=None):
 
     # Add image
     if os.path.exists(image_path):
-        left = Inches(1)
-        top = Inches(1.2)
-        max_width = Inches(8)
-        max_height = Inches(5.5)
-
-        pic = slide.shapes.add_picture(image_path, left, top, width=max_width)
-
-        # Center the image
-        left = (prs.slide_width - pic.width) / 2
-        pic.left = int(left)
+        place_pictures(slide, [image_path], content_area(prs, caption=bool(caption)))
 
     # Add caption if provided
     if caption:
@@ -126,21 +119,15 @@ def add_two_images_slide(prs, title, image1_path, image2_path, caption1=None, ca
     p.font.color.rgb = RGBColor(31, 73, 125)
     p.alignment = PP_ALIGN.CENTER
 
-    # Add first image (left)
-    if os.path.exists(image1_path):
-        left = Inches(0.5)
-        top = Inches(1.3)
-        max_height = Inches(5)
-
-        pic1 = slide.shapes.add_picture(image1_path, left, top, height=max_height)
-
-    # Add second image (right)
-    if os.path.exists(image2_path):
-        left = Inches(5.5)
-        top = Inches(1.3)
-        max_height = Inches(5)
-
-        pic2 = slide.shapes.add_picture(image2_path, left, top, height=max_height)
+    # Add both images in the grid that fits them best
+    images = []
+    captions = []
+    for path, image_caption in ((image1_path, caption1), (image2_path, caption2)):
+        if os.path.exists(path):
+            images.append(path)
+            captions.append(image_caption)
+    if images:
+        place_pictures(slide, images, content_area(prs, top=Inches(1.3)), captions)
 
     return slide
 
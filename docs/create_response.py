@@ -2,22 +2,38 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from docx import Document
-from docx.shared import Pt, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from mail_merge import MergeTemplate, load_roster, render_roster
 
-# Створюємо новий документ на основі зразка
-doc = Document(r'C:\magister_work\docs\response\Відгук_Зразок (1).docx')
+TEMPLATE_PATH = r'C:\magister_work\docs\response\Відгук_Зразок (1).docx'
 
-# Текст для заміни
-replacements = {
-    'Луцик О.Р.': 'Хоменко Ю.Ю.',
-    'Луцика О.Р.': 'Хоменка Ю.Ю.',
-    'Луцик Олександр Романович': 'Хоменко Юрій Юрійович',
-    'Луцика Олександра Романовича': 'Хоменка Юрія Юрійовича',
-    '«Методологічні засади розробки мультимедійних тезаурусів»': '«Методика та застосунок багатоплатформенної системи онлайн-магазину»',
-    'Методологічні засади розробки мультимедійних тезаурусів': 'Методика та застосунок багатоплатформенної системи онлайн-магазину',
-    '2023': '2025',
+# Фрази зразка -> поля запису
+phrases = {
+    'Луцик О.Р.': 'short_name',
+    'Луцика О.Р.': 'short_name_genitive',
+    'Луцик Олександр Романович': 'full_name',
+    'Луцика Олександра Романовича': 'full_name_genitive',
+    'Методологічні засади розробки мультимедійних тезаурусів': 'topic',
+    '2023': 'year',
+}
+
+# Абзаци, що замінюються повністю (номер непорожнього абзацу -> поле)
+paragraph_fields = {
+    8: 'topic_paragraph',
+    9: 'goal_paragraph',
+    10: 'done_paragraph',
+    13: 'skills_paragraph',
+    15: 'review_paragraph',
+    16: 'practice_paragraph',
+    19: 'conclusion_paragraph',
+}
+
+student = {
+    'short_name': 'Хоменко Ю.Ю.',
+    'short_name_genitive': 'Хоменка Ю.Ю.',
+    'full_name': 'Хоменко Юрій Юрійович',
+    'full_name_genitive': 'Хоменка Юрія Юрійовича',
+    'topic': 'Методика та застосунок багатоплатформенної системи онлайн-магазину',
+    'year': '2025',
 }
 
 # Новий текст для параграфів (індекси відповідають порядку в документі)
@@ -44,35 +60,18 @@ new_paragraphs = {
     19: 'Рівень підготовки кваліфікаційної роботи «Методика та застосунок багатоплатформенної системи онлайн-магазину» та виявлений рівень знань, умінь та навичок свідчить про те, що Хоменко Юрій Юрійович заслуговує присвоєння освітньо-кваліфікаційного рівня «Магістр» за спеціальністю «Інженерія програмного забезпечення».',
 }
 
-# Замінюємо текст у параграфах
-para_count = 0
-for para in doc.paragraphs:
-    if para.text.strip():
-        para_count += 1
-
-        # Якщо є повна заміна параграфа
-        if para_count in new_paragraphs:
-            # Зберігаємо форматування першого run
-            if para.runs:
-                font_name = para.runs[0].font.name
-                font_size = para.runs[0].font.size
-                bold = para.runs[0].bold
+for number, field in paragraph_fields.items():
+    student[field] = new_paragraphs[number]
 
-            para.clear()
-            run = para.add_run(new_paragraphs[para_count])
-            if font_name:
-                run.font.name = font_name
-            if font_size:
-                run.font.size = font_size
-        else:
-            # Простa заміна тексту
-            for old, new in replacements.items():
-                if old in para.text:
-                    for run in para.runs:
-                        if old in run.text:
-                            run.text = run.text.replace(old, new)
+if __name__ == "__main__":
+    template = MergeTemplate(TEMPLATE_PATH, phrases=phrases, paragraphs=paragraph_fields)
 
-# Зберігаємо документ
-output_path = r'C:\Users\Iurii\Downloads\ВІДГУК_ХОМЕНКО.docx'
-doc.save(output_path)
-print(f'Документ збережено: {output_path}')
+    if len(sys.argv) > 1:
+        # Список студентів (CSV/JSON з тими самими полями) -> окремий відгук для кожного
+        output_dir = sys.argv[2] if len(sys.argv) > 2 else r'C:\Users\Iurii\Downloads\Відгуки'
+        paths = render_roster(template, load_roster(sys.argv[1]), output_dir, 'ВІДГУК_{full_name}.docx')
+        print(f'Створено відгуків: {len(paths)} у {output_dir}')
+    else:
+        output_path = r'C:\Users\Iurii\Downloads\ВІДГУК_ХОМЕНКО.docx'
+        template.render(student, output_path)
+        print(f'Документ збережено: {output_path}')
@@ -3,13 +3,10 @@ from docx import Document
 from docx.shared import Pt, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
+from io import BytesIO
+import sys
 
-# Open template
-doc = Document(r'C:\Users\Iurii\Music\ПРИКЛАД_Рецензія_кваліф.робота_магістр (2).docx')
-
-# Clear existing content
-for para in doc.paragraphs:
-    para.clear()
+from mail_merge import MergeTemplate, load_roster, render_roster
 
 # Create new document with updated content
 new_doc = Document()
@@ -76,7 +73,25 @@ add_paragraph("З рецензією ознайомлений 			  _____________
 add_paragraph("                                                                                                                   Власне ім'я ПРІЗВИЩЕ здобувача")
 add_paragraph("«___  » грудня 2025 р.")
 
-# Save
-output_path = r'C:\Users\Iurii\Music\Review_Khomenko_FullMag.docx'
-new_doc.save(output_path)
-print("Review saved successfully!")
+# Phrases of the built review that change per student in a roster
+review_phrases = {
+    'Хоменко Юрія Сергійовича': 'full_name_genitive',
+    'Хоменка Ю.С.': 'short_name_genitive',
+    'Хоменко Юрій Сергійович': 'full_name',
+    '«Багатоплатформенний програмний засіб для онлайн-магазину»': 'topic',
+    '90/Відмінно/А': 'grade',
+}
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Roster (CSV/JSON with the fields above) -> one review per student
+        buffer = BytesIO()
+        new_doc.save(buffer)
+        template = MergeTemplate(buffer, phrases=review_phrases)
+        output_dir = sys.argv[2] if len(sys.argv) > 2 else r'C:\Users\Iurii\Music\Reviews'
+        paths = render_roster(template, load_roster(sys.argv[1]), output_dir, 'Review_{full_name}.docx')
+        print(f"Reviews saved: {len(paths)} in {output_dir}")
+    else:
+        output_path = r'C:\Users\Iurii\Music\Review_Khomenko_FullMag.docx'
+        new_doc.save(output_path)
+        print("Review saved successfully!")
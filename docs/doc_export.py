@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Експорт моделі документа Word у SQLite для SQL- і FTS-запитів.
+
+Скрипти аналізу друкували довільні зрізи у текстові файли
+(analysis_result.txt, thesis_info.txt, presentation_analysis.txt).
+Тут абзаци, run (з ефективним форматуванням зі style_resolver), таблиці
+й клітинки (docx_tables), підписи рисунків і таблиць, джерела зі списку
+літератури та медіафайли однієї або кількох версій роботи записуються в
+нормалізовану базу з індексами і FTS5-таблицею по тексту абзаців. Рядки
+вставляються executemany в одній транзакції на документ, тож уся робота
+завантажується значно швидше за секунду. Повторний експорт пропускає
+файли з незмінними розміром і mtime (або хешем) і переписує лише змінені
+версії; кілька змінених файлів розбираються паралельно.
+
+Приклади запитів:
+    SELECT position, text FROM paragraphs WHERE document_id = 1 AND section LIKE '3.6%';
+    SELECT font, size, COUNT(*) FROM runs GROUP BY font, size ORDER BY 3 DESC;
+    SELECT p.position, p.text FROM paragraphs_fts f JOIN paragraphs p ON p.id = f.rowid
+        WHERE paragraphs_fts MATCH 'кошик';
+
+Використання:
+    python doc_export.py export [файли.docx ...] [--force] [--prune] [-j 4]
+    python doc_export.py sql "SELECT ..."
+    python doc_export.py search "запит" [-n 20]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from docx import Document
+import argparse
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from doc_server import heading_level
+from docx_tables import TableGrid, cell_text
+from hashing import file_hash
+from run_locator import paragraph_text
+from style_resolver import W, W_P, StyleResolver
+from thesis_index import OPERATORS, QUERY_RE, THESIS_GLOBS, join_expression, version_name
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(DOCS_DIR, '.cache', 'thesis.sqlite')
+
+W_TBL = W + 'tbl'
+A_BLIP = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+
+CAPTION_RE = re.compile(r'^(Рисунок|Рис\.|Таблиця)\s*(\d+(?:\.\d+)*)\.?\s*[-–—.]?\s*(.*)$')
+SOURCES_RE = re.compile(r'^СПИСОК (ВИКОРИСТАНИХ|ЛІТЕРАТУРИ)', re.IGNORECASE)
+APPENDIX_RE = re.compile(r'^ДОДАТ', re.IGNORECASE)
+SOURCE_NUMBER_RE = re.compile(r'^\(?(\d+)[.)]\s*')
+URL_RE = re.compile(r'(https?://[^\s\)\]]+|www\.[^\s\)\]]+)')
+
+# Збільшується при зміні того, як з документа дістаються рядки; старіші документи експортуються заново
+EXPORT_VERSION = 3
+
+SCHEMA = """
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    version TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    paragraph_count INTEGER NOT NULL,
+    exported_at REAL NOT NULL,
+    export_version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS paragraphs (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,          -- порядок серед усіх абзаців, з таблицями
+    position INTEGER,                  -- як doc.paragraphs[i]; NULL у клітинках
+    style TEXT,
+    section TEXT,
+    level INTEGER,                     -- рівень заголовка, NULL для тексту
+    alignment TEXT,
+    text TEXT NOT NULL,
+    table_id INTEGER,
+    row INTEGER,
+    col INTEGER
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    paragraph_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    font TEXT,
+    size REAL,
+    bold INTEGER,
+    italic INTEGER
+);
+CREATE TABLE IF NOT EXISTS tables (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,         -- як doc.tables[i]
+    rows INTEGER NOT NULL,
+    cols INTEGER NOT NULL,
+    caption TEXT
+);
+CREATE TABLE IF NOT EXISTS cells (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    table_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS captions (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    paragraph_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,                -- figure | table
+    number TEXT NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    paragraph_id INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS media (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    paragraph_id INTEGER                -- перший абзац, де використано
+);
+CREATE INDEX IF NOT EXISTS paragraphs_position ON paragraphs(document_id, position);
+CREATE INDEX IF NOT EXISTS paragraphs_section ON paragraphs(document_id, section);
+CREATE INDEX IF NOT EXISTS runs_paragraph ON runs(paragraph_id);
+CREATE INDEX IF NOT EXISTS runs_document ON runs(document_id);
+CREATE INDEX IF NOT EXISTS tables_document ON tables(document_id);
+CREATE INDEX IF NOT EXISTS cells_table ON cells(table_id);
+CREATE INDEX IF NOT EXISTS cells_document ON cells(document_id);
+CREATE INDEX IF NOT EXISTS captions_document ON captions(document_id);
+CREATE INDEX IF NOT EXISTS sources_document ON sources(document_id);
+CREATE INDEX IF NOT EXISTS media_document ON media(document_id);
+CREATE INDEX IF NOT EXISTS media_sha256 ON media(sha256);
+CREATE VIRTUAL TABLE IF NOT EXISTS paragraphs_fts USING fts5(
+    text,
+    content = 'paragraphs',
+    content_rowid = 'id',
+    tokenize = "unicode61 tokenchars ''''"
+);
+"""
+
+
+# --- Розбір документа ---
+
+def parse_document(path):
+    """
+    Rows of one docx for every table of the schema.
+
+    Paragraph references are local ordinals and table references are local
+    table indices; export() turns them into database ids.
+    """
+    doc = Document(path)
+    resolver = StyleResolver(doc)
+    style_names = {}
+    rows = {name: [] for name in ('paragraphs', 'runs', 'tables', 'cells', 'captions', 'sources', 'media')}
+    first_use = {}
+    state = {'ordinal': 0, 'position': 0, 'section': '', 'sources': False, 'previous': ''}
+
+    def add_paragraph(p, table=None, row=None, col=None):
+        ordinal = state['ordinal']
+        state['ordinal'] += 1
+        position = None
+        if table is None:
+            position = state['position']
+            state['position'] += 1
+        text = paragraph_text(p).strip()
+        props = resolver.paragraph(p)
+        style_id = props['style']
+        if style_id not in style_names:
+            style_names[style_id] = resolver.style_name(style_id)
+        level = heading_level(text, style_names[style_id]) if text and table is None else None
+
+        if level:
+            state['section'] = text
+            state['sources'] = bool(SOURCES_RE.match(text))
+        elif state['sources'] and APPENDIX_RE.match(text):
+            state['sources'] = False
+
+        rows['paragraphs'].append((ordinal, position, style_names[style_id], state['section'], level,
+                                   props.get('alignment'), text, table, row, col))
+        for index, (r, run_props) in enumerate(resolver.runs(p)):
+            run_text = r.text
+            if run_text:
+                rows['runs'].append((ordinal, index, run_text, run_props.get('font'), run_props.get('size'),
+                                     int(run_props.get('bold', False)), int(run_props.get('italic', False))))
+        for blip in p.iter(A_BLIP):
+            first_use.setdefault(blip.get(R_EMBED), ordinal)
+
+        caption = CAPTION_RE.match(text) if table is None else None
+        if caption:
+            kind = 'table' if caption.group(1) == 'Таблиця' else 'figure'
+            rows['captions'].append((ordinal, kind, caption.group(2), caption.group(3)))
+        elif state['sources'] and not level and text:
+            number = SOURCE_NUMBER_RE.match(text)
+            url = URL_RE.search(text)
+            rows['sources'].append((ordinal, int(number.group(1)) if number else len(rows['sources']) + 1,
+                                    text, url.group(0).rstrip('.,') if url else None))
+        if text:
+            state['previous'] = text
+
+    for child in doc.element.body.iterchildren(W_P, W_TBL):
+        if child.tag == W_P:
+            add_paragraph(child)
+            continue
+        table = len(rows['tables'])
+        grid = TableGrid(child)
+        previous = CAPTION_RE.match(state['previous'])
+        caption = state['previous'] if previous and previous.group(1) == 'Таблиця' else None
+        rows['tables'].append((table, grid.height, grid.width, caption))
+        seen = set()
+        for r, row in enumerate(grid.cells):
+            for c, tc in enumerate(row):
+                if tc is None or id(tc) in seen:
+                    continue
+                seen.add(id(tc))
+                rows['cells'].append((table, r, c, cell_text(tc)))
+                for p in tc.iterchildren(W_P):
+                    add_paragraph(p, table, r, c)
+
+    for rel_id, rel in doc.part.rels.items():
+        if rel.is_external or not rel.reltype.endswith('/image'):
+            continue
+        part = rel.target_part
+        blob = part.blob
+        rows['media'].append((os.path.basename(part.partname), part.content_type, len(blob),
+                              hashlib.sha256(blob).hexdigest(), first_use.get(rel_id)))
+    return path, rows
+
+
+# --- База ---
+
+def connect(db_path=DB_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.execute('PRAGMA journal_mode = WAL')
+    connection.execute('PRAGMA synchronous = NORMAL')
+    connection.executescript(SCHEMA)
+    columns = {row[1] for row in connection.execute('PRAGMA table_info(documents)')}
+    if 'export_version' not in columns:
+        # База, створена до EXPORT_VERSION: усі документи вважаються застарілими
+        connection.execute('ALTER TABLE documents ADD COLUMN export_version INTEGER NOT NULL DEFAULT 0')
+    return connection
+
+
+def _delete_document(connection, document_id):
+    # Зовнішній вміст FTS5 видаляється явно, до самих абзаців
+    connection.execute(
+        "INSERT INTO paragraphs_fts (paragraphs_fts, rowid, text) "
+        "SELECT 'delete', id, text FROM paragraphs WHERE document_id = ?", (document_id,))
+    for table in ('runs', 'cells', 'captions', 'sources', 'media', 'paragraphs', 'tables'):
+        connection.execute(f'DELETE FROM {table} WHERE document_id = ?', (document_id,))
+
+
+def _next_id(connection, table):
+    return connection.execute(f'SELECT COALESCE(MAX(id), 0) + 1 FROM {table}').fetchone()[0]
+
+
+def _insert(connection, path, digest, stat, rows, document_id=None):
+    paragraphs = rows['paragraphs']
+    values = (path, version_name(path), digest, stat.st_size, stat.st_mtime_ns, len(paragraphs), time.time(),
+              EXPORT_VERSION)
+    if document_id is None:
+        document_id = connection.execute(
+            'INSERT INTO documents (path, version, hash, size, mtime_ns, paragraph_count, exported_at, '
+            'export_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', values).lastrowid
+    else:
+        connection.execute(
+            'UPDATE documents SET path = ?, version = ?, hash = ?, size = ?, mtime_ns = ?, '
+            'paragraph_count = ?, exported_at = ?, export_version = ? WHERE id = ?', (*values, document_id))
+
+    # Id абзаців і таблиць призначаються наперед, щоб зв'язки вставлялися тим самим executemany
+    paragraph_base = _next_id(connection, 'paragraphs')
+    table_base = _next_id(connection, 'tables')
+
+    def table_id(index):
+        return None if index is None else table_base + index
+
+    connection.executemany(
+        'INSERT INTO tables (id, document_id, position, rows, cols, caption) VALUES (?, ?, ?, ?, ?, ?)',
+        [(table_base + index, document_id, index, height, width, caption)
+         for index, height, width, caption in rows['tables']])
+    connection.executemany(
+        'INSERT INTO paragraphs (id, document_id, ordinal, position, style, section, level, alignment, text, '
+        'table_id, row, col) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(paragraph_base + ordinal, document_id, ordinal, position, style, section, level, alignment, text,
+          table_id(table), row, col)
+         for ordinal, position, style, section, level, alignment, text, table, row, col in paragraphs])
+    connection.executemany(
+        'INSERT INTO runs (document_id, paragraph_id, position, text, font, size, bold, italic) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        [(document_id, paragraph_base + ordinal, *rest) for ordinal, *rest in rows['runs']])
+    connection.executemany(
+        'INSERT INTO cells (document_id, table_id, row, col, text) VALUES (?, ?, ?, ?, ?)',
+        [(document_id, table_base + table, row, col, text) for table, row, col, text in rows['cells']])
+    connection.executemany(
+        'INSERT INTO captions (document_id, paragraph_id, kind, number, title) VALUES (?, ?, ?, ?, ?)',
+        [(document_id, paragraph_base + ordinal, *rest) for ordinal, *rest in rows['captions']])
+    connection.executemany(
+        'INSERT INTO sources (document_id, paragraph_id, number, text, url) VALUES (?, ?, ?, ?, ?)',
+        [(document_id, paragraph_base + ordinal, *rest) for ordinal, *rest in rows['sources']])
+    connection.executemany(
+        'INSERT INTO media (document_id, name, content_type, size, sha256, paragraph_id) VALUES (?, ?, ?, ?, ?, ?)',
+        [(document_id, name, content_type, size, sha256, None if ordinal is None else paragraph_base + ordinal)
+         for name, content_type, size, sha256, ordinal in rows['media']])
+    connection.execute(
+        'INSERT INTO paragraphs_fts (rowid, text) SELECT id, text FROM paragraphs WHERE document_id = ?',
+        (document_id,))
+
+
+def export(connection, paths, force=False, prune=False, workers=None):
+    """
+    Export new and changed documents; unchanged ones are skipped unless
+    they were exported by an older EXPORT_VERSION.
+
+    Returns {'added': n, 'updated': n, 'skipped': n, 'removed': n, 'paragraphs': n}.
+    """
+    stats = {'added': 0, 'updated': 0, 'skipped': 0, 'removed': 0, 'paragraphs': 0}
+    known = {path: entry for path, *entry in connection.execute(
+        'SELECT path, id, hash, size, mtime_ns, export_version FROM documents')}
+
+    changed = []
+    for path in dict.fromkeys(os.path.abspath(path) for path in paths):
+        if not os.path.exists(path):
+            continue
+        stat = os.stat(path)
+        entry = known.get(path)
+        current = entry and not force and entry[4] == EXPORT_VERSION
+        if current and (entry[2], entry[3]) == (stat.st_size, stat.st_mtime_ns):
+            stats['skipped'] += 1
+            continue
+        digest = file_hash(path)
+        if current and entry[1] == digest:
+            with connection:
+                connection.execute('UPDATE documents SET size = ?, mtime_ns = ? WHERE id = ?',
+                                   (stat.st_size, stat.st_mtime_ns, entry[0]))
+            stats['skipped'] += 1
+            continue
+        changed.append((path, digest, stat))
+
+    if len(changed) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_document, [path for path, _, _ in changed]))
+    else:
+        parsed = [parse_document(path) for path, _, _ in changed]
+
+    for (path, digest, stat), (_, rows) in zip(changed, parsed):
+        entry = known.get(path)
+        with connection:
+            if entry:
+                _delete_document(connection, entry[0])
+                _insert(connection, path, digest, stat, rows, entry[0])
+                stats['updated'] += 1
+            else:
+                _insert(connection, path, digest, stat, rows)
+                stats['added'] += 1
+        stats['paragraphs'] += len(rows['paragraphs'])
+
+    if prune:
+        for path, (document_id, *_) in known.items():
+            if not os.path.exists(path):
+                with connection:
+                    _delete_document(connection, document_id)
+                    connection.execute('DELETE FROM documents WHERE id = ?', (document_id,))
+                stats['removed'] += 1
+    return stats
+
+
+def match_expression(query):
+    """
+    FTS5 MATCH expression for a user query: every word or "phrase" is quoted
+    (so '-', ':' and the like are plain text), word* stays a prefix search,
+    OR / NOT / AND are kept between terms.
+    """
+    parts = []
+    for phrase, word in QUERY_RE.findall(query):
+        if word in OPERATORS:
+            parts.append(word)
+            continue
+        prefix = not phrase and word.endswith('*')
+        term = (phrase or word).rstrip('*') if prefix else phrase or word
+        if term.strip():
+            parts.append('"' + term.replace('"', '""') + '"' + ('*' if prefix else ''))
+    return join_expression(parts)
+
+
+def default_documents():
+    paths = []
+    for pattern in THESIS_GLOBS:
+        paths.extend(sorted(glob.glob(pattern)))
+    return paths
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Export docx versions into SQLite with FTS5')
+    parser.add_argument('--db', default=DB_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help='export new or changed documents')
+    export_parser.add_argument('documents', nargs='*')
+    export_parser.add_argument('--force', action='store_true', help='re-export unchanged documents')
+    export_parser.add_argument('--prune', action='store_true', help='drop documents missing on disk')
+    export_parser.add_argument('-j', '--jobs', type=int, default=None)
+
+    sql_parser = commands.add_parser('sql', help='run an SQL query')
+    sql_parser.add_argument('query')
+
+    search_parser = commands.add_parser('search', help='full-text search over paragraphs')
+    search_parser.add_argument('query')
+    search_parser.add_argument('-n', '--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    connection = connect(args.db)
+
+    if args.command == 'export':
+        start = time.perf_counter()
+        stats = export(connection, args.documents or default_documents(), args.force, args.prune, args.jobs)
+        print(f"Додано: {stats['added']}, оновлено: {stats['updated']}, без змін: {stats['skipped']}, "
+              f"видалено: {stats['removed']}, абзаців: {stats['paragraphs']} "
+              f"за {time.perf_counter() - start:.2f} с")
+
+    elif args.command == 'sql':
+        cursor = connection.execute(args.query)
+        if cursor.description:
+            print('\t'.join(column[0] for column in cursor.description))
+            for row in cursor:
+                print('\t'.join('' if value is None else str(value) for value in row))
+
+    else:
+        try:
+            expression = match_expression(args.query)
+        except ValueError as e:
+            parser.error(str(e))
+        if not expression:
+            parser.error('empty query')
+        start = time.perf_counter()
+        hits = connection.execute(
+            "SELECT d.version, p.position, p.section, snippet(paragraphs_fts, 0, '[', ']', '...', 16) "
+            "FROM paragraphs_fts JOIN paragraphs p ON p.id = paragraphs_fts.rowid "
+            "JOIN documents d ON d.id = p.document_id "
+            "WHERE paragraphs_fts MATCH ? ORDER BY bm25(paragraphs_fts) LIMIT ?",
+            (expression, args.limit)).fetchall()
+        for version, position, section, snippet in hits:
+            print(f"[{version}] [{position}] {(section or '')[:60]}")
+            print(f"    {snippet}\n")
+        print(f"Знайдено: {len(hits)} за {(time.perf_counter() - start) * 1000:.1f} мс")
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Резидентний сервер документа: docx розбирається один раз і тримається в
+пам'яті для скриптів-запитів.
+
+find_sources.py, analyze_section36.py, check_diagram_structure.py,
+read_thesis_info.py щоразу робили Document() того самого файлу, щоб
+надрукувати кілька абзаців. Сервер (localhost, JSON-рядок на запит)
+тримає індекс абзаців (номер як у doc.paragraphs[i], текст, стиль,
+розділ), зміст і список підписів рисунків і таблиць. Перед кожним
+запитом перевіряються mtime і розмір файлу, а якщо вони змінилися - хеш;
+змінений документ перечитується автоматично. Запит до запущеного
+сервера триває мілісекунди.
+
+Запити: range (діапазон абзаців), section (розділ за номером або
+назвою), search (регулярний вираз), captions, outline, info.
+Якщо сервер не запущено, fetch() виконує запит локально (один раз
+завантаживши документ), тож скрипти працюють і без нього.
+
+Використання:
+    python doc_server.py serve [документ.docx ...] [--port 8765]
+    python doc_server.py range 605 630 [--path документ.docx]
+    python doc_server.py section 3.6
+    python doc_server.py search "Рисунок 3\\.\\d+" [-n 20]
+    python doc_server.py captions | outline | info
+"""
+
+from docx import Document
+import argparse
+import json
+import os
+import re
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from hashing import file_hash
+from run_locator import iter_paragraphs, paragraph_text
+from style_resolver import StyleResolver
+from thesis_index import MAX_SECTION_LENGTH, SECTION_RE
+
+DEFAULT_DOCUMENT = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL3.docx'
+HOST = '127.0.0.1'
+PORT = 8765
+TIMEOUT = 60
+
+CAPTION_RE = re.compile(r'^(Рисунок|Рис\.|Таблиця)\s*\d+(\.\d+)*')
+HEADING_STYLE_RE = re.compile(r'^(Heading|Заголовок)\s*(\d)')
+NUMBER_RE = re.compile(r'^(\d+(?:\.\d+)*)\.?\s')
+
+
+def heading_level(text, style_name):
+    """Outline level of a paragraph (1 - chapter), None for ordinary paragraphs"""
+    match = HEADING_STYLE_RE.match(style_name or '')
+    if match:
+        return int(match.group(2))
+    if len(text) >= MAX_SECTION_LENGTH or not SECTION_RE.match(text):
+        return None
+    number = NUMBER_RE.match(text)
+    return number.group(1).count('.') + 1 if number else 1
+
+
+class DocumentState:
+    """Paragraph index, outline and captions of one docx, reloaded when the file changes"""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.stamp = None
+        self.hash = None
+        self.loads = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Reload if the file changed (mtime/size first, then the content hash)"""
+        with self._lock:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self.stamp:
+                return False
+            digest = file_hash(self.path)
+            self.stamp = stamp
+            if digest == self.hash:
+                return False
+            self._load()
+            self.hash = digest
+            return True
+
+    def _load(self):
+        start = time.perf_counter()
+        doc = Document(self.path)
+        resolver = StyleResolver(doc)
+        style_names = {}
+        # Індекс будується в локальних списках і підміняється цілим: запити не бачать його наполовину
+        paragraphs = []
+        outline = []
+        captions = []
+        section = ''
+        for position, p in enumerate(iter_paragraphs(doc, tables=False)):
+            text = paragraph_text(p).strip()
+            style_id = resolver.paragraph_style_id(p)
+            if style_id not in style_names:
+                style_names[style_id] = resolver.style_name(style_id)
+            style = style_names[style_id]
+            level = heading_level(text, style) if text else None
+            if level:
+                section = text
+                outline.append({'position': position, 'level': level, 'text': text})
+            elif CAPTION_RE.match(text):
+                captions.append({'position': position, 'text': text, 'section': section})
+            paragraphs.append({'position': position, 'text': text, 'style': style, 'section': section})
+        self.paragraphs, self.outline, self.captions = paragraphs, outline, captions
+        self.loads += 1
+        self.load_time = time.perf_counter() - start
+
+    # --- Запити ---
+
+    def range(self, start=0, end=None, empty=False):
+        """Paragraphs start..end-1 (like doc.paragraphs[start:end])"""
+        return [p for p in self.paragraphs[start:end] if empty or p['text']]
+
+    def section(self, title, empty=False):
+        """Paragraphs of the first section whose heading starts with (or contains) title"""
+        headings = ([h for h in self.outline if h['text'].startswith(title)]
+                    or [h for h in self.outline if title.lower() in h['text'].lower()])
+        if not headings:
+            return []
+        heading = headings[0]
+        end = next((h['position'] for h in self.outline
+                    if h['position'] > heading['position'] and h['level'] <= heading['level']), None)
+        return self.range(heading['position'], end, empty)
+
+    def search(self, pattern, limit=50, ignore_case=True):
+        compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        found = []
+        for p in self.paragraphs:
+            if p['text'] and compiled.search(p['text']):
+                found.append(p)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def info(self):
+        return {
+            'path': self.path, 'hash': self.hash, 'paragraphs': len(self.paragraphs),
+            'headings': len(self.outline), 'captions': len(self.captions),
+            'loads': self.loads, 'load_time': round(self.load_time, 3),
+        }
+
+    def query(self, op, **params):
+        # Під замком: перезавантаження з іншого потоку не підмінить індекс посеред запиту
+        with self._lock:
+            return self._query(op, **params)
+
+    def _query(self, op, **params):
+        if op == 'range':
+            return self.range(params.get('start', 0), params.get('end'), params.get('empty', False))
+        if op == 'section':
+            return self.section(params['title'], params.get('empty', False))
+        if op == 'search':
+            return self.search(params['pattern'], params.get('limit', 50), params.get('ignore_case', True))
+        if op == 'captions':
+            return self.captions
+        if op == 'outline':
+            return self.outline
+        if op == 'info':
+            return self.info()
+        raise ValueError(f'Невідомий запит: {op}')
+
+
+class DocumentStore:
+    """DocumentState per path, created on first use"""
+
+    def __init__(self, default=DEFAULT_DOCUMENT):
+        self.default = os.path.abspath(default)
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def get(self, path=None):
+        path = os.path.abspath(path or self.default)
+        with self._lock:
+            state = self._documents.get(path)
+            if state is None:
+                state = self._documents[path] = DocumentState(path)
+                return state
+        state.refresh()
+        return state
+
+    def handle(self, request):
+        """Answer one request dict: {'op': ..., 'path': ..., params}"""
+        request = dict(request)
+        op = request.pop('op')
+        path = request.pop('path', None)
+        return self.get(path).query(op, **request)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = {'ok': True, 'result': self.server.store.handle(json.loads(line))}
+            except Exception as error:
+                response = {'ok': False, 'error': f'{type(error).__name__}: {error}'}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class DocumentServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, store, host=HOST, port=PORT):
+        super().__init__((host, port), _Handler)
+        self.store = store
+
+
+# --- Клієнт ---
+
+def query(op, path=None, host=HOST, port=PORT, **params):
+    """Send one request to a running server; raises ConnectionError if none is running"""
+    request = {'op': op, **params}
+    if path:
+        request['path'] = os.path.abspath(path)
+    with socket.create_connection((host, port), timeout=TIMEOUT) as connection:
+        connection.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+        with connection.makefile('rb') as reader:
+            response = json.loads(reader.readline())
+    if not response['ok']:
+        raise RuntimeError(response['error'])
+    return response['result']
+
+
+_local_store = None
+
+
+def fetch(op, path=None, host=HOST, port=PORT, **params):
+    """query() through the server if it is running, otherwise in this process"""
+    global _local_store
+    try:
+        return query(op, path, host, port, **params)
+    except (ConnectionError, socket.timeout):
+        if _local_store is None:
+            _local_store = DocumentStore()
+        return _local_store.handle({'op': op, 'path': path, **params})
+
+
+def print_paragraphs(paragraphs, width=200):
+    for p in paragraphs:
+        text = p['text']
+        print(f"[{p['position']}] {text[:width] + '...' if len(text) > width else text}")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--port', type=int, default=PORT)
+    common.add_argument('--path', help='document (the server default if omitted)')
+
+    parser = argparse.ArgumentParser(description='Resident docx query server and client')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', parents=[common], help='load documents and answer queries')
+    serve_parser.add_argument('documents', nargs='*')
+
+    range_parser = commands.add_parser('range', parents=[common], help='paragraphs start..end-1')
+    range_parser.add_argument('start', type=int)
+    range_parser.add_argument('end', type=int, nargs='?')
+
+    section_parser = commands.add_parser('section', parents=[common], help='paragraphs of a section')
+    section_parser.add_argument('title')
+
+    search_parser = commands.add_parser('search', parents=[common], help='regex search')
+    search_parser.add_argument('pattern')
+    search_parser.add_argument('-n', '--limit', type=int, default=50)
+
+    for name in ('captions', 'outline', 'info'):
+        commands.add_parser(name, parents=[common])
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        documents = args.documents or [DEFAULT_DOCUMENT]
+        store = DocumentStore(documents[0])
+        for path in documents:
+            state = store.get(path)
+            print(f"Завантажено {path}: {len(state.paragraphs)} абзаців за {state.load_time:.2f} с")
+        with DocumentServer(store, port=args.port) as server:
+            print(f"Сервер документів: {HOST}:{args.port} (Ctrl+C - зупинити)")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        sys.exit(0)
+
+    start = time.perf_counter()
+    if args.command == 'range':
+        print_paragraphs(fetch('range', args.path, port=args.port, start=args.start, end=args.end))
+    elif args.command == 'section':
+        print_paragraphs(fetch('section', args.path, port=args.port, title=args.title))
+    elif args.command == 'search':
+        print_paragraphs(fetch('search', args.path, port=args.port, pattern=args.pattern, limit=args.limit))
+    elif args.command == 'captions':
+        for caption in fetch('captions', args.path, port=args.port):
+            print(f"[{caption['position']}] {caption['text']}")
+    elif args.command == 'outline':
+        for heading in fetch('outline', args.path, port=args.port):
+            print(f"[{heading['position']}] {'  ' * (heading['level'] - 1)}{heading['text']}")
+    else:
+        for key, value in fetch('info', args.path, port=args.port).items():
+            print(f"{key}: {value}")
+    print(f"\n({(time.perf_counter() - start) * 1000:.1f} мс)", file=sys.stderr)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Транзакції редагування документа Word у пам'яті: точки збереження,
+відкат і фіксація без проміжних файлів.
+
+Скрипти правок зберігали ..._TEMP.docx і одразу відкривали його знову, а
+копії UPDATEDn писали лише для того, щоб мати куди повернутися. Тут
+точка збереження - це знімок XML-частин документа (document.xml,
+styles.xml, numbering.xml, колонтитули...) у пам'яті разом зі зв'язками
+частин. Відкат підставляє в частини копії знімків (об'єкти Document і
+частин лишаються тими самими), тож повернення до попереднього етапу
+займає мілісекунди замість перечитування файлу з диска. На диск
+документ записується один раз - у commit().
+
+Після відкату раніше отримані об'єкти Paragraph / Table вказують на
+старі елементи - їх треба отримати заново (doc.paragraphs, doc.tables).
+
+Використання:
+    with DocumentTransaction(doc) as transaction:
+        with transaction.stage('підписи'):
+            ...                       # помилка - відкат лише цього етапу
+        transaction.savepoint('перед висновками')
+        ...
+        transaction.rollback('перед висновками')
+        transaction.commit(output_path)
+"""
+
+from contextlib import contextmanager
+from copy import deepcopy
+import time
+
+
+class TransactionError(Exception):
+    """Unknown savepoint or operation on a finished transaction"""
+
+
+class DocumentTransaction:
+    """In-memory savepoints of the XML parts of a python-docx Document"""
+
+    BEGIN = '<begin>'
+
+    def __init__(self, doc, verbose=False):
+        self.doc = doc
+        self.verbose = verbose
+        self._savepoints = {}
+        self._order = []
+        self.finished = False
+        self.savepoint(self.BEGIN)
+
+    def _parts(self):
+        # XmlPart має розібраний _element; решта частин (зображення, тема) - бінарні і не змінюються на місці
+        return [part for part in self.doc.part.package.iter_parts() if getattr(part, '_element', None) is not None]
+
+    def _check(self):
+        if self.finished:
+            raise TransactionError('Транзакцію вже завершено')
+
+    # --- Точки збереження ---
+
+    def savepoint(self, name):
+        """Snapshot every XML part under name (replaces an existing savepoint with this name)"""
+        self._check()
+        start = time.perf_counter()
+        snapshot = [(part, deepcopy(part._element), dict(part.rels), dict(part.rels.related_parts))
+                    for part in self._parts()]
+        if name in self._savepoints:
+            self._order.remove(name)
+        self._savepoints[name] = snapshot
+        self._order.append(name)
+        if self.verbose:
+            print(f"  [транзакція] точка '{name}' за {(time.perf_counter() - start) * 1000:.1f} мс")
+        return name
+
+    def release(self, name):
+        """Forget a savepoint and all savepoints taken after it"""
+        self._check()
+        if name not in self._savepoints:
+            raise TransactionError(f'Невідома точка збереження: {name}')
+        for later in self._order[self._order.index(name):]:
+            del self._savepoints[later]
+        del self._order[self._order.index(name):]
+
+    def rollback(self, name=BEGIN):
+        """
+        Restore the document to savepoint name (the start of the transaction by default).
+
+        The savepoint stays available; savepoints taken after it are released.
+        """
+        self._check()
+        if name not in self._savepoints:
+            raise TransactionError(f'Невідома точка збереження: {name}')
+        start = time.perf_counter()
+        for part, element, rels, related in self._savepoints[name]:
+            # Корінь замінюється цілком: перенесення дітей між деревами lxml
+            # перевизначає простори імен кожного вузла і на дипломі триває секунди
+            part._element = deepcopy(element)
+            part.rels.clear()
+            part.rels.update(rels)
+            part.rels.related_parts.clear()
+            part.rels.related_parts.update(related)
+        # Document тримає корінь document.xml і кешує проксі w:body
+        self.doc._element = self.doc.part._element
+        self.doc._Document__body = None
+        index = self._order.index(name) + 1
+        for later in self._order[index:]:
+            del self._savepoints[later]
+        del self._order[index:]
+        if self.verbose:
+            print(f"  [транзакція] відкат до '{name}' за {(time.perf_counter() - start) * 1000:.1f} мс")
+
+    @contextmanager
+    def stage(self, name, suppress=False):
+        """
+        Savepoint around one editing stage: an exception inside rolls it back.
+
+        With suppress=True the error is reported and the transaction goes on
+        with the document as it was before the stage; otherwise it is re-raised.
+        """
+        self.savepoint(name)
+        try:
+            yield self
+        except Exception as error:
+            self.rollback(name)
+            self.release(name)
+            if not suppress:
+                raise
+            print(f"  Етап '{name}' скасовано: {error}")
+        else:
+            self.release(name)
+
+    # --- Завершення ---
+
+    def commit(self, path):
+        """Serialize the document once and finish the transaction"""
+        self._check()
+        self.doc.save(path)
+        self.finished = True
+        self._savepoints.clear()
+        self._order.clear()
+
+    def abort(self):
+        """Roll back to the start and finish without saving"""
+        self.rollback()
+        self.finished = True
+        self._savepoints.clear()
+        self._order.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if not self.finished and exc_type is not None:
+            self.abort()
+        return False
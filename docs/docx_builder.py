@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пряме створення елементів w:p / w:tbl для python-docx документів.
+
+doc.add_paragraph() / paragraph.style = ... / cell.text = ... кожного разу
+шукають стиль за назвою та перебудовують проксі-об'єкти. BodyWriter один раз
+визначає style_id, будує XML абзаців і таблиць напряму та вставляє їх перед
+w:sectPr, тож великі файли збираються за лінійний час.
+"""
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from markdown_blocks import tokenize_inline
+
+CODE_FONT = 'Courier New'
+HEADING_FONT = 'Times New Roman'
+
+LIST_STYLES = {False: 'List Bullet', True: 'List Number'}
+
+
+def _set(parent, tag, **attrs):
+    """Append child tag with w:-namespaced attributes"""
+    child = OxmlElement(tag)
+    for name, value in attrs.items():
+        child.set(qn('w:' + name), str(value))
+    parent.append(child)
+    return child
+
+
+def make_run(text, bold=False, italic=False, code=False, font=None, size=None, color=None):
+    """Build w:r; newlines become w:br"""
+    r = OxmlElement('w:r')
+    if bold or italic or code or font or size or color:
+        rPr = _set(r, 'w:rPr')
+        font = CODE_FONT if code else font
+        if font:
+            _set(rPr, 'w:rFonts', ascii=font, hAnsi=font, cs=font, eastAsia=font)
+        if bold:
+            _set(rPr, 'w:b')
+        if italic:
+            _set(rPr, 'w:i')
+        if color:
+            _set(rPr, 'w:color', val=color)
+        if size:
+            _set(rPr, 'w:sz', val=int(size * 2))
+            _set(rPr, 'w:szCs', val=int(size * 2))
+
+    for index, line in enumerate(text.split('\n')):
+        if index:
+            _set(r, 'w:br')
+        t = _set(r, 'w:t')
+        t.text = line
+        if line != line.strip():
+            t.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+    return r
+
+
+def make_paragraph(fragments=(), style_id=None, alignment=None, num_id=None, **run_format):
+    """
+    Build w:p from [(text, format_dict)] fragments.
+
+    run_format is applied to every run (e.g. font='Times New Roman').
+    """
+    p = OxmlElement('w:p')
+    if style_id or alignment or num_id:
+        pPr = _set(p, 'w:pPr')
+        if style_id:
+            _set(pPr, 'w:pStyle', val=style_id)
+        if num_id:
+            numPr = _set(pPr, 'w:numPr')
+            _set(numPr, 'w:ilvl', val=0)
+            _set(numPr, 'w:numId', val=num_id)
+        if alignment:
+            _set(pPr, 'w:jc', val=alignment)
+    for text, fmt in fragments:
+        p.append(make_run(text, **{**run_format, **fmt}))
+    return p
+
+
+def make_page_break():
+    """Paragraph that holds a single page break"""
+    p = OxmlElement('w:p')
+    _set(_set(p, 'w:r'), 'w:br', type='page')
+    return p
+
+
+def make_table(rows, style_id=None, header_rows=1, cell_style_id=None, widths=None, **run_format):
+    """
+    Build w:tbl from rows of cells.
+
+    A cell is either plain text or a list of (text, format_dict) fragments.
+    Header rows are bold and repeat on every page. run_format is applied to
+    every cell run.
+    """
+    column_count = max((len(row) for row in rows), default=0)
+
+    tbl = OxmlElement('w:tbl')
+    tblPr = _set(tbl, 'w:tblPr')
+    if style_id:
+        _set(tblPr, 'w:tblStyle', val=style_id)
+    _set(tblPr, 'w:tblW', w=0, type='auto')
+    _set(tblPr, 'w:tblLook', val='04A0', firstRow=1, lastRow=0, firstColumn=1,
+         lastColumn=0, noHBand=0, noVBand=1)
+
+    tblGrid = _set(tbl, 'w:tblGrid')
+    for column in range(column_count):
+        if widths:
+            _set(tblGrid, 'w:gridCol', w=widths[column])
+        else:
+            _set(tblGrid, 'w:gridCol')
+
+    for row_index, row in enumerate(rows):
+        is_header = row_index < header_rows
+        tr = _set(tbl, 'w:tr')
+        if is_header:
+            _set(_set(tr, 'w:trPr'), 'w:tblHeader')
+        for column in range(column_count):
+            cell = row[column] if column < len(row) else ''
+            fragments = [(cell, {})] if isinstance(cell, str) else cell
+            if is_header:
+                fragments = [(text, {**fmt, 'bold': True}) for text, fmt in fragments]
+
+            tc = _set(tr, 'w:tc')
+            tcPr = _set(tc, 'w:tcPr')
+            if widths:
+                _set(tcPr, 'w:tcW', w=widths[column], type='dxa')
+            else:
+                _set(tcPr, 'w:tcW', w=0, type='auto')
+            tc.append(make_paragraph(fragments, style_id=cell_style_id, **run_format))
+    return tbl
+
+
+class BodyWriter:
+    """
+    Append prebuilt block elements to a document body in order.
+
+    By default elements go to the end of the body; with after=<element>
+    they are inserted one after another following that element.
+    """
+
+    def __init__(self, doc, after=None):
+        self.doc = doc
+        self.body = doc.element.body
+        self._style_ids = {style.name: style.style_id for style in doc.styles}
+        self._anchor = self.body.find(qn('w:sectPr'))
+        self._cursor = after
+        self._abstract_nums = {}
+        self._list_num = None
+        self.previous = None
+
+    def style_id(self, name):
+        """Style id for a style name, or None if the document lacks it"""
+        return self._style_ids.get(name)
+
+    def restart_numbering(self, style_id):
+        """
+        New w:num restarting the numbering of a list style at 1.
+
+        All lists share the style's w:abstractNum, each list only adds a
+        small w:num with a startOverride.
+        """
+        numbering = self.doc.part.numbering_part.element
+        if style_id not in self._abstract_nums:
+            style = self.doc.styles.element.get_by_id(style_id)
+            numPr = style.pPr.numPr if style is not None and style.pPr is not None else None
+            if numPr is None or numPr.numId is None:
+                self._abstract_nums[style_id] = None
+            else:
+                num = numbering.num_having_numId(numPr.numId.val)
+                self._abstract_nums[style_id] = num.abstractNumId.val
+        abstract_num_id = self._abstract_nums[style_id]
+        if abstract_num_id is None:
+            return None
+
+        num = numbering.add_num(abstract_num_id)
+        num.add_lvlOverride(ilvl=0).add_startOverride(1)
+        return num.numId
+
+    def list_style_id(self, ordered, level):
+        """'List Bullet', 'List Bullet 2', ... - nested levels up to the third"""
+        name = LIST_STYLES[ordered]
+        if level:
+            name += f' {min(level, 2) + 1}'
+        return self.style_id(name) or self.style_id(LIST_STYLES[ordered])
+
+    def append(self, element):
+        """Insert element at the end of the body, before the section properties"""
+        if self._cursor is not None:
+            self._cursor.addnext(element)
+            self._cursor = element
+        elif self._anchor is not None:
+            self._anchor.addprevious(element)
+        else:
+            self.body.append(element)
+        return element
+
+    def extend(self, elements):
+        for element in elements:
+            self.append(element)
+
+    def write_blocks(self, blocks):
+        """Append markdown_blocks / html_blocks blocks to the body"""
+        for block in blocks:
+            self.append(block_element(self, block))
+            self.previous = block
+
+
+def _fragments(block):
+    """Inline fragments of a block given either as fragments or Markdown text"""
+    if 'fragments' in block:
+        return block['fragments']
+    return tokenize_inline(block['text'])
+
+
+def _cell_fragments(cell):
+    return tokenize_inline(cell) if isinstance(cell, str) else cell
+
+
+def block_element(writer, block):
+    """Build the w:p / w:tbl element for one block"""
+    kind = block['type']
+    if kind == 'heading':
+        # Заголовки: Times New Roman, чорний колір
+        return make_paragraph(
+            _fragments(block),
+            style_id=writer.style_id(f"Heading {min(block['level'], 9)}"),
+            font=HEADING_FONT, color='000000',
+        )
+    if kind == 'list_item':
+        style_id = writer.list_style_id(block['ordered'], block['level'])
+        num_id = None
+        if block['ordered'] and block['level'] == 0:
+            # Новий нумерований список починається з 1
+            previous = writer.previous
+            if previous is None or previous['type'] != 'list_item' or writer._list_num is None:
+                writer._list_num = writer.restart_numbering(style_id)
+            num_id = writer._list_num
+        elif block['level'] == 0:
+            writer._list_num = None
+        return make_paragraph(_fragments(block), style_id=style_id, num_id=num_id)
+    if kind == 'quote':
+        return make_paragraph(_fragments(block), style_id=writer.style_id('Quote'))
+    if kind == 'code':
+        p = make_paragraph(style_id=writer.style_id('Normal'))
+        p.append(make_run('\n'.join(block['lines']), font=CODE_FONT, size=10))
+        return p
+    if kind == 'table':
+        rows = ([block['header']] if block.get('header') else []) + block['rows']
+        return make_table([[_cell_fragments(cell) for cell in row] for row in rows],
+                          style_id=writer.style_id('Table Grid'),
+                          header_rows=1 if block.get('header') else 0)
+    if kind == 'rule':
+        return make_paragraph([('─' * 50, {})])
+    return make_paragraph(_fragments(block))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Швидке читання таблиць docx з урахуванням об'єднаних клітинок.
+
+python-docx у table.rows -> row.cells перебудовує сітку таблиці для кожного
+рядка і повторює об'єднані клітинки. TableGrid один раз проходить по w:tr /
+w:tc, розгортає gridSpan та vMerge у щільний 2-D масив посилань на w:tc і
+текстів, після чого таблицю можна віддати в CSV, NumPy чи pandas.
+"""
+
+from docx.oxml.ns import qn
+from docx.table import _Cell
+import csv
+import sys
+
+from run_locator import paragraph_text
+
+W_TR = qn('w:tr')
+W_TC = qn('w:tc')
+W_P = qn('w:p')
+W_TBL = qn('w:tbl')
+
+
+def cell_text(tc):
+    """Text of a w:tc: its own paragraphs joined by newlines"""
+    return '\n'.join(paragraph_text(p) for p in tc.iterchildren(W_P))
+
+
+def _int_attr(parent, path, default):
+    el = parent.find(path)
+    if el is None:
+        return default
+    return int(el.get(qn('w:val'), default))
+
+
+class TableGrid:
+    """Dense grid of a w:tbl: cells[r][c] is the origin w:tc covering that slot"""
+
+    def __init__(self, table):
+        self.table = table
+        self.tbl = getattr(table, '_tbl', table)
+
+        grid_cols = self.tbl.findall(qn('w:tblGrid') + '/' + qn('w:gridCol'))
+        rows = []
+        width = len(grid_cols)
+
+        for tr in self.tbl.iterchildren(W_TR):
+            row = [None] * _int_attr(tr, qn('w:trPr') + '/' + qn('w:gridBefore'), 0)
+            for tc in tr.iterchildren(W_TC):
+                tcPr = tc.find(qn('w:tcPr'))
+                span = 1
+                origin = tc
+                if tcPr is not None:
+                    span = _int_attr(tcPr, qn('w:gridSpan'), 1)
+                    v_merge = tcPr.find(qn('w:vMerge'))
+                    # vMerge без val (або val="continue") продовжує клітинку зверху
+                    if v_merge is not None and v_merge.get(qn('w:val'), 'continue') == 'continue' and rows:
+                        above = rows[-1]
+                        column = len(row)
+                        if column < len(above) and above[column] is not None:
+                            origin = above[column]
+                row.extend([origin] * span)
+            width = max(width, len(row))
+            rows.append(row)
+
+        for row in rows:
+            row.extend([None] * (width - len(row)))
+
+        self.cells = rows
+        self.width = width
+        self.height = len(rows)
+
+        text_cache = {}
+        self.texts = []
+        for row in rows:
+            texts = []
+            for tc in row:
+                if tc is None:
+                    texts.append('')
+                    continue
+                if id(tc) not in text_cache:
+                    text_cache[id(tc)] = cell_text(tc)
+                texts.append(text_cache[id(tc)])
+            self.texts.append(texts)
+
+    def unique_cells(self):
+        """Distinct w:tc elements in reading order (each merged cell once)"""
+        seen = set()
+        result = []
+        for row in self.cells:
+            for tc in row:
+                if tc is not None and id(tc) not in seen:
+                    seen.add(id(tc))
+                    result.append(tc)
+        return result
+
+    def cell_objects(self):
+        """python-docx _Cell proxies for unique_cells(), for run-level edits"""
+        parent = self.table if hasattr(self.table, '_tbl') else None
+        return [_Cell(tc, parent) for tc in self.unique_cells()]
+
+    def row_texts(self, index, unique=True):
+        """Texts of one row; horizontally merged slots are reported once"""
+        texts = []
+        previous = None
+        for tc, text in zip(self.cells[index], self.texts[index]):
+            if unique and tc is not None and tc is previous:
+                continue
+            texts.append(text)
+            previous = tc
+        return texts
+
+    def to_rows(self):
+        """List of lists of cell texts (dense, merged cells repeated)"""
+        return [list(row) for row in self.texts]
+
+    def to_csv(self, target):
+        """Write the dense grid as CSV to a path or an open file"""
+        if hasattr(target, 'write'):
+            csv.writer(target).writerows(self.texts)
+            return
+        with open(target, 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f).writerows(self.texts)
+
+    def to_array(self):
+        """NumPy object array of cell texts"""
+        import numpy as np
+        array = np.empty((self.height, self.width), dtype=object)
+        for r, row in enumerate(self.texts):
+            array[r, :] = row
+        return array
+
+    def to_dataframe(self, header=True):
+        """pandas DataFrame; the first row becomes column names when header=True"""
+        import pandas as pd
+        if header and self.texts:
+            return pd.DataFrame(self.texts[1:], columns=self.texts[0])
+        return pd.DataFrame(self.texts)
+
+
+def iter_tables(doc, nested=False):
+    """Yield TableGrid for every body table (and tables inside cells when nested=True)"""
+    if nested:
+        for tbl in doc.element.body.iter(W_TBL):
+            yield TableGrid(tbl)
+    else:
+        for table in doc.tables:
+            yield TableGrid(table)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    from docx import Document
+    import os
+    import time
+
+    docx_path = sys.argv[1] if len(sys.argv) > 1 else r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL3.docx'
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+
+    doc = Document(docx_path)
+    start = time.perf_counter()
+    grids = list(iter_tables(doc))
+    elapsed = time.perf_counter() - start
+
+    for index, grid in enumerate(grids, 1):
+        print(f"Таблиця {index}: {grid.height}x{grid.width}")
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            grid.to_csv(os.path.join(output_dir, f"table_{index:03}.csv"))
+
+    print(f"\nВсього таблиць: {len(grids)}, час: {elapsed * 1000:.1f} мс")
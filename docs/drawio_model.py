@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Модель діаграм draw.io (mxGraph) і текстові описи, згенеровані з неї.
+
+Файли .drawio читаються потоково (lxml.iterparse по mxCell); стиснуті
+діаграми (base64 + raw deflate + URL-кодування всередині <diagram>)
+розпаковуються на льоту. З комірок будується граф: актори, прецеденти,
+класи/таблиці з полями, пакети з вкладеністю та зв'язки між ними
+(асоціація, композиція, агрегація, успадкування, include/extend,
+залежність). З графа за шаблонами генеруються описи для роботи, тож
+вони не розходяться з діаграмами. Розібрані моделі кешуються за хешем
+файлу.
+
+Використання:
+    python drawio_model.py [файл.drawio ...]
+"""
+
+from html import unescape
+from lxml import etree
+from urllib.parse import unquote
+import base64
+import glob
+import json
+import os
+import re
+import sys
+import zlib
+
+from hashing import file_hash
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+DIAGRAMS_DIR = os.path.join(DOCS_DIR, 'diagrams')
+CACHE_DIR = os.path.join(DOCS_DIR, '.cache', 'drawio')
+CACHE_VERSION = 1
+
+HTML_TAG_RE = re.compile(r'<(/?)(b|i|u|br|div|span|font|p|strong|em|sup|sub|hr)\b[^>]*>', re.IGNORECASE)
+BREAK_TAG_RE = re.compile(r'<(br|/div|/p)\b[^>]*>', re.IGNORECASE)
+LEGEND_RE = re.compile(r'^(легенда|legend)$', re.IGNORECASE)
+STEREOTYPE_RE = re.compile(r'^\s*(?:<<|«)\s*([^>»]+?)\s*(?:>>|»)\s*')
+MEMBER_RE = re.compile(r'^\s*(?:(PK|FK|UK|PK,\s*FK)\s+)?([+\-#~])?\s*([^:(]+?)\s*(\([^)]*\))?\s*(?::\s*(.+?))?\s*$')
+
+# Вузли, до яких зводяться кінці зв'язків (рядок атрибута -> його клас)
+OWNER_KINDS = {'class', 'actor', 'use_case', 'package'}
+
+
+# --- Читання mxGraph ---
+
+def parse_style(style):
+    """'swimlane;fontStyle=1;' -> {'swimlane': '', 'fontStyle': '1'}"""
+    result = {}
+    for item in (style or '').split(';'):
+        if not item:
+            continue
+        key, _, value = item.partition('=')
+        result[key] = value
+    return result
+
+
+def clean_label(value, style):
+    """Plain-text label: HTML labels lose their tags, <br> becomes a newline"""
+    if not value:
+        return ''
+    if style.get('html') == '1':
+        value = BREAK_TAG_RE.sub('\n', value)
+        value = HTML_TAG_RE.sub('', value)
+        value = unescape(value).replace('\xa0', ' ')
+    return value.strip()
+
+
+def decompress_diagram(text):
+    """Inner XML of a compressed <diagram>: base64 -> raw deflate -> URL-decoding"""
+    data = base64.b64decode(text.strip())
+    return unquote(zlib.decompress(data, -zlib.MAX_WBITS).decode('utf-8'))
+
+
+def _cell_record(element, diagram):
+    style = parse_style(element.get('style'))
+    cell = {
+        'id': element.get('id'),
+        'diagram': diagram,
+        'parent': element.get('parent'),
+        'label': clean_label(element.get('value', ''), style),
+        'style': style,
+        'vertex': element.get('vertex') == '1',
+        'edge': element.get('edge') == '1',
+        'source': element.get('source'),
+        'target': element.get('target'),
+    }
+    geometry = element.find('mxGeometry')
+    if geometry is not None:
+        cell['geometry'] = {
+            key: float(geometry.get(key, 0)) for key in ('x', 'y', 'width', 'height')
+        }
+        cell['geometry']['relative'] = geometry.get('relative') == '1'
+        points = geometry.find('Array')
+        if points is not None:
+            cell['geometry']['points'] = [
+                (float(p.get('x', 0)), float(p.get('y', 0))) for p in points.iter('mxPoint')
+            ]
+        for point in geometry.iterchildren('mxPoint'):
+            role = point.get('as')
+            if role in ('sourcePoint', 'targetPoint', 'offset'):
+                cell['geometry'][role] = (float(point.get('x', 0)), float(point.get('y', 0)))
+    return cell
+
+
+def _cells_of_tree(root, diagram):
+    for element in root.iter('mxCell'):
+        parent = element.getparent()
+        if parent is None or parent.tag not in ('UserObject', 'object'):
+            yield _cell_record(element, diagram)
+    # UserObject / object обгортають mxCell і тримають label в атрибуті
+    for wrapper in root.iter('UserObject', 'object'):
+        inner = wrapper.find('mxCell')
+        if inner is not None:
+            record = _cell_record(inner, diagram)
+            record['id'] = wrapper.get('id')
+            record['label'] = clean_label(wrapper.get('label', ''), record['style'])
+            yield record
+
+
+def iter_cells(path):
+    """Yield cell dicts of every diagram page of a .drawio file"""
+    diagram = None
+    for event, element in etree.iterparse(path, events=('start', 'end'), tag=('diagram', 'mxCell', 'UserObject', 'object')):
+        if element.tag == 'diagram':
+            if event == 'start':
+                diagram = element.get('name') or element.get('id')
+                continue
+            # Стиснута сторінка: текст замість дочірнього mxGraphModel
+            if len(element) == 0 and (element.text or '').strip():
+                inner = etree.fromstring(decompress_diagram(element.text).encode('utf-8'))
+                yield from _cells_of_tree(inner, diagram)
+            element.clear()
+            continue
+        if event != 'end':
+            continue
+        if element.tag == 'mxCell':
+            parent = element.getparent()
+            if parent is not None and parent.tag in ('UserObject', 'object'):
+                continue
+            yield _cell_record(element, diagram)
+        else:
+            inner = element.find('mxCell')
+            if inner is not None:
+                record = _cell_record(inner, diagram)
+                record['id'] = element.get('id')
+                record['label'] = clean_label(element.get('label', ''), record['style'])
+                yield record
+        element.clear()
+        # Звільняємо вже оброблені сусідні елементи
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+# --- Класифікація ---
+
+def cell_kind(cell):
+    style = cell['style']
+    if cell['edge']:
+        return 'edge'
+    shape = style.get('shape', '')
+    if shape == 'umlActor':
+        return 'actor'
+    if shape == 'folder' or shape == 'module' or shape == 'package':
+        return 'package'
+    if shape == 'umlFrame':
+        return 'frame'
+    if 'edgeLabel' in style:
+        return 'edge_label'
+    if 'ellipse' in style:
+        return 'use_case'
+    if 'swimlane' in style:
+        return 'legend' if LEGEND_RE.match(cell['label']) else 'class'
+    if 'line' in style and not cell['label']:
+        return 'separator'
+    if 'text' in style:
+        return 'text'
+    return 'shape'
+
+
+def edge_kind(cell):
+    style = cell['style']
+    label = cell['label'].lower()
+    if 'include' in label:
+        return 'include'
+    if 'extend' in label:
+        return 'extend'
+    end_arrow = style.get('endArrow', '')
+    start_arrow = style.get('startArrow', '')
+    if end_arrow == 'block' and style.get('endFill') == '0':
+        return 'generalization'
+    if start_arrow.startswith('diamond') or end_arrow.startswith('diamond'):
+        filled = style.get('startFill' if start_arrow.startswith('diamond') else 'endFill', '1')
+        return 'composition' if filled != '0' else 'aggregation'
+    if style.get('dashed') == '1':
+        return 'dependency'
+    return 'association'
+
+
+def parse_member(line):
+    """'+ email: string' / 'PK  id : VARCHAR(36)' -> member dict"""
+    match = MEMBER_RE.match(line)
+    if not match or not match.group(3).strip():
+        return None
+    key, _, name, arguments, kind = match.groups()
+    flags = []
+    if key:
+        flags = [flag.strip() for flag in key.split(',')]
+    type_name = (kind or '').strip()
+    for marker in ('UNIQUE', 'NOT NULL'):
+        if marker in type_name.upper():
+            flags.append(marker)
+    return {
+        'name': name.strip(),
+        'type': type_name,
+        'flags': flags,
+        'method': arguments is not None,
+    }
+
+
+def split_stereotype(label):
+    """'<<Entity>>\\nUser' -> ('Entity', 'User')"""
+    match = STEREOTYPE_RE.match(label)
+    if not match:
+        return None, label.strip()
+    return match.group(1).strip(), label[match.end():].strip()
+
+
+class DiagramModel:
+    """Graph of one .drawio file: nodes by kind, members, containment, relations"""
+
+    def __init__(self, cells, path=None):
+        self.path = path
+        self.cells = {cell['id']: cell for cell in cells}
+        self.children = {}
+        for cell in cells:
+            self.children.setdefault(cell['parent'], []).append(cell['id'])
+        for cell in cells:
+            cell['kind'] = cell_kind(cell)
+
+        self.nodes = {}
+        for cell in cells:
+            if cell['kind'] in OWNER_KINDS or cell['kind'] == 'frame':
+                stereotype, name = split_stereotype(cell['label'])
+                self.nodes[cell['id']] = {
+                    'id': cell['id'],
+                    'kind': cell['kind'],
+                    'name': name.replace('\n', ' '),
+                    'stereotype': stereotype,
+                    'parent': self._owner(cell['parent']),
+                    'members': self._members(cell) if cell['kind'] == 'class' else [],
+                    'notes': self._notes(cell) if cell['kind'] == 'package' else [],
+                }
+
+        self.relations = []
+        for cell in cells:
+            if cell['kind'] != 'edge':
+                continue
+            labels = [self.cells[child]['label'] for child in self.children.get(cell['id'], [])
+                      if self.cells[child]['label']]
+            self.relations.append({
+                'id': cell['id'],
+                'kind': edge_kind(cell),
+                'source': self._owner(cell['source']),
+                'target': self._owner(cell['target']),
+                'label': cell['label'],
+                'labels': labels,
+            })
+
+    def _owner(self, cell_id):
+        """Nearest node (class, package, actor, ...) containing cell_id"""
+        while cell_id is not None and cell_id in self.cells:
+            if self.cells[cell_id]['kind'] in OWNER_KINDS:
+                return cell_id
+            cell_id = self.cells[cell_id]['parent']
+        return None
+
+    def _members(self, cell):
+        members = []
+        section = 0
+        for child_id in self.children.get(cell['id'], []):
+            child = self.cells[child_id]
+            if child['kind'] == 'separator':
+                section += 1
+                continue
+            if child['kind'] != 'text':
+                continue
+            for line in child['label'].split('\n'):
+                member = parse_member(line)
+                if member:
+                    member['section'] = section
+                    members.append(member)
+        return members
+
+    def _notes(self, cell):
+        notes = []
+        for child_id in self.children.get(cell['id'], []):
+            child = self.cells[child_id]
+            if child['kind'] == 'text' and child['label']:
+                notes.extend(line.strip(' -•') for line in child['label'].split('\n') if line.strip(' -•'))
+        return notes
+
+    def of_kind(self, kind):
+        return [node for node in self.nodes.values() if node['kind'] == kind]
+
+    def contained(self, node_id, kind=None):
+        """Direct child nodes of a node (package contents)"""
+        return [node for node in self.nodes.values()
+                if node['parent'] == node_id and (kind is None or node['kind'] == kind)]
+
+    def name(self, node_id):
+        node = self.nodes.get(node_id)
+        return node['name'] if node else '?'
+
+    def diagram_type(self):
+        """'use_case', 'package', 'er' or 'class'"""
+        if self.of_kind('actor') or self.of_kind('use_case'):
+            return 'use_case'
+        if self.of_kind('package'):
+            return 'package'
+        classes = self.of_kind('class')
+        if any('PK' in member['flags'] for node in classes for member in node['members']):
+            return 'er'
+        return 'class'
+
+
+def load_model(path, cache_dir=CACHE_DIR):
+    """DiagramModel of a .drawio file; the parsed cells are cached by file hash"""
+    entry = os.path.join(cache_dir, f"{file_hash(path)}-v{CACHE_VERSION}.json")
+    if os.path.exists(entry):
+        with open(entry, 'r', encoding='utf-8') as f:
+            return DiagramModel(json.load(f), path)
+
+    cells = list(iter_cells(path))
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(entry, 'w', encoding='utf-8') as f:
+        json.dump(cells, f, ensure_ascii=False)
+    return DiagramModel(cells, path)
+
+
+# --- Описи ---
+
+def plural(count, forms):
+    """Ukrainian plural: plural(5, ('актор', 'актори', 'акторів')) -> 'акторів'"""
+    if count % 10 == 1 and count % 100 != 11:
+        return forms[0]
+    if 2 <= count % 10 <= 4 and not 12 <= count % 100 <= 14:
+        return forms[1]
+    return forms[2]
+
+
+def _join(names):
+    names = list(names)
+    if len(names) < 2:
+        return ''.join(names)
+    return ', '.join(names[:-1]) + ' та ' + names[-1]
+
+
+def _quoted(names):
+    return _join(f'«{name}»' for name in names)
+
+
+def describe_use_case(model):
+    actors = model.of_kind('actor')
+    use_cases = model.of_kind('use_case')
+    frames = model.of_kind('frame')
+    # Без рамки системи (umlFrame) назви немає, і речення обходиться без неї
+    system = f" системи {frames[0]['name']}" if frames and frames[0]['name'] else ''
+
+    paragraphs = [
+        f"Діаграма прецедентів (Use Case Diagram){system} демонструє взаємодію "
+        f"{len(actors)} {plural(len(actors), ('актора', 'акторів', 'акторів'))} "
+        f"({_quoted(a['name'] for a in actors)}) з {len(use_cases)} "
+        f"{plural(len(use_cases), ('прецедентом', 'прецедентами', 'прецедентами'))}."
+    ]
+
+    relations = model.relations
+    for actor in actors:
+        parents = [model.name(r['target']) for r in relations
+                   if r['kind'] == 'generalization' and r['source'] == actor['id']]
+        linked = [model.name(r['target'] if r['source'] == actor['id'] else r['source'])
+                  for r in relations if r['kind'] == 'association'
+                  and actor['id'] in (r['source'], r['target'])]
+        sentence = f"Актор «{actor['name']}»"
+        if parents:
+            sentence += f" успадковує можливості {_quoted(parents)} та"
+        if linked:
+            sentence += f" ініціює прецеденти: {_join(linked)}."
+        else:
+            sentence += " не має власних прецедентів." if not parents else " додаткових прецедентів не має."
+        paragraphs.append(sentence)
+
+    includes = [f"«{model.name(r['source'])}» включає «{model.name(r['target'])}»"
+                for r in relations if r['kind'] == 'include']
+    extends = [f"«{model.name(r['source'])}» розширює «{model.name(r['target'])}»"
+               for r in relations if r['kind'] == 'extend']
+    if includes:
+        paragraphs.append(f"Відношення включення (include): {'; '.join(includes)}.")
+    if extends:
+        paragraphs.append(f"Відношення розширення (extend): {'; '.join(extends)}.")
+    return '\n\n'.join(paragraphs)
+
+
+RELATION_NAMES = {
+    'composition': 'композиція',
+    'aggregation': 'агрегація',
+    'association': 'асоціація',
+    'generalization': 'успадкування',
+    'dependency': 'залежність',
+}
+
+
+def _relation_sentences(model):
+    sentences = []
+    for relation in model.relations:
+        if not relation['source'] or not relation['target']:
+            continue
+        # Підпис ребра - кратність біля джерела, підписи-нащадки - біля цілі
+        ends = [label for label in [relation['label']] + relation['labels'] if label]
+        multiplicity = f" ({' : '.join(ends)})" if ends else ''
+        sentences.append(
+            f"{model.name(relation['source'])} — {model.name(relation['target'])}: "
+            f"{RELATION_NAMES.get(relation['kind'], relation['kind'])}{multiplicity}"
+        )
+    return sentences
+
+
+def describe_class(model):
+    classes = model.of_kind('class')
+    stereotypes = sorted({node['stereotype'] for node in classes if node['stereotype']})
+    paragraphs = [
+        f"Діаграма класів (Class Diagram) містить {len(classes)} "
+        f"{plural(len(classes), ('клас', 'класи', 'класів'))}"
+        + (f" зі стереотипами {_quoted(stereotypes)}" if stereotypes else '')
+        + f" та {len(model.relations)} {plural(len(model.relations), ('зв’язок', 'зв’язки', 'зв’язків'))}."
+    ]
+    for node in classes:
+        fields = [m['name'] for m in node['members'] if not m['method'] and m['section'] == 0]
+        navigation = [m['name'] for m in node['members'] if not m['method'] and m['section'] > 0]
+        methods = [m['name'] + '()' for m in node['members'] if m['method']]
+        sentence = f"{node['name']}"
+        if node['stereotype']:
+            sentence += f" («{node['stereotype']}»)"
+        parts = []
+        if fields:
+            parts.append(f"поля: {', '.join(fields)}")
+        if navigation:
+            parts.append(f"зв’язані властивості: {', '.join(navigation)}")
+        if methods:
+            parts.append(f"методи: {', '.join(methods)}")
+        paragraphs.append(sentence + (' містить ' + '; '.join(parts) if parts else '') + '.')
+    relations = _relation_sentences(model)
+    if relations:
+        paragraphs.append(f"Зв’язки між класами: {'; '.join(relations)}.")
+    return '\n\n'.join(paragraphs)
+
+
+def describe_er(model):
+    tables = model.of_kind('class')
+    paragraphs = [
+        f"Концептуальна схема бази даних містить {len(tables)} "
+        f"{plural(len(tables), ('таблицю', 'таблиці', 'таблиць'))} та "
+        f"{len(model.relations)} {plural(len(model.relations), ('зв’язок', 'зв’язки', 'зв’язків'))} "
+        f"за зовнішніми ключами."
+    ]
+    for table in tables:
+        keys = [m['name'] for m in table['members'] if 'PK' in m['flags']]
+        foreign = [m['name'] for m in table['members'] if 'FK' in m['flags']]
+        columns = [f"{m['name']} ({m['type']})" if m['type'] else m['name'] for m in table['members']]
+        sentence = f"Таблиця {table['name']} має стовпці: {', '.join(columns)}"
+        if keys:
+            sentence += f"; первинний ключ — {', '.join(keys)}"
+        if foreign:
+            sentence += f"; зовнішні ключі — {', '.join(foreign)}"
+        paragraphs.append(sentence + '.')
+    references = sorted({f"{model.name(r['source'])} → {model.name(r['target'])}"
+                         for r in model.relations if r['source'] and r['target']})
+    if references:
+        paragraphs.append(f"Посилання між таблицями: {'; '.join(references)}.")
+    return '\n\n'.join(paragraphs)
+
+
+def describe_package(model):
+    packages = model.of_kind('package')
+    roots = [node for node in packages if node['parent'] is None]
+    paragraphs = []
+    for root in roots:
+        layers = model.contained(root['id'], 'package')
+        paragraphs.append(
+            f"Діаграма пакетів (Package Diagram) демонструє організацію {root['name']}, "
+            f"що складається з {len(layers)} {plural(len(layers), ('шару', 'шарів', 'шарів'))}: "
+            f"{_join(layer['name'] for layer in layers)}."
+        )
+        for layer in layers:
+            inner = model.contained(layer['id'], 'package')
+            if not inner:
+                continue
+            parts = []
+            for package in inner:
+                modules = model.contained(package['id'], 'package')
+                text = package['name']
+                if package['stereotype']:
+                    text += f" («{package['stereotype']}»)"
+                if modules:
+                    text += f" з пакетами {_join(m['name'] for m in modules)}"
+                parts.append(text)
+            paragraphs.append(f"Шар {layer['name']} містить: {'; '.join(parts)}.")
+
+    dependencies = [f"{model.name(r['source'])} → {model.name(r['target'])}"
+                    + (f" ({r['label']})" if r['label'] else '')
+                    for r in model.relations if r['source'] and r['target']]
+    if dependencies:
+        paragraphs.append(f"Залежності між пакетами: {'; '.join(dependencies)}.")
+    return '\n\n'.join(paragraphs)
+
+
+DESCRIBERS = {
+    'use_case': describe_use_case,
+    'class': describe_class,
+    'er': describe_er,
+    'package': describe_package,
+}
+
+
+def describe(path, cache_dir=CACHE_DIR):
+    """Generated thesis description of a .drawio diagram"""
+    model = load_model(path, cache_dir)
+    return DESCRIBERS[model.diagram_type()](model)
+
+
+def diagram_path(name):
+    """Path of a diagram in docs/diagrams"""
+    return os.path.join(DIAGRAMS_DIR, name)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(DIAGRAMS_DIR, '*.drawio')))
+    for path in paths:
+        model = load_model(path)
+        print(f"=== {os.path.basename(path)} ({model.diagram_type()}) ===\n")
+        print(describe(path))
+        print()
@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Офлайн-рендер діаграм draw.io у SVG і PNG без diagrams.net.
+
+Підтримується підмножина mxGraph, яка використовується в docs/diagrams:
+прямокутники, swimlane (класи UML і таблиці), текстові рядки та
+роздільники, пакети (folder), рамка системи (umlFrame), актори, прецеденти
+(еліпси) і зв'язки з ортогональною маршрутизацією, точками перегину,
+стрілками (open, classic, block, diamond) і підписами. Модель береться з
+drawio_model (кешована за хешем), з неї будується одна сцена примітивів,
+яка записується і в SVG, і в PNG (Pillow) з потрібним DPI.
+
+Перемальовуються лише діаграми, у яких змінився хеш джерела або параметри
+рендеру; кілька діаграм обробляються паралельно в окремих процесах.
+Вихідні файли називаються як при експорті з diagrams.net:
+use-case-diagram.drawio.png / .svg.
+
+Використання:
+    python drawio_render.py [файл.drawio ...] [-o каталог] [--dpi 150]
+                            [--format svg png] [-j 4] [--force]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageDraw, ImageFont
+from xml.sax.saxutils import escape
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+
+from drawio_model import DIAGRAMS_DIR, load_model
+from hashing import file_hash
+
+RENDER_VERSION = 1
+INDEX_FILE = '.render-index.json'
+SCREEN_DPI = 96
+MARGIN = 10
+
+DEFAULT_FONT_SIZE = 11
+LINE_HEIGHT = 1.25
+# Середня ширина символу відносно кегля - для переносу рядків без метрик шрифту
+CHAR_WIDTH = 0.55
+
+FONT_FILES = {
+    (False, False): ['arial.ttf', 'DejaVuSans.ttf', 'LiberationSans-Regular.ttf'],
+    (True, False): ['arialbd.ttf', 'DejaVuSans-Bold.ttf', 'LiberationSans-Bold.ttf'],
+    (False, True): ['ariali.ttf', 'DejaVuSans-Oblique.ttf', 'LiberationSans-Italic.ttf'],
+    (True, True): ['arialbi.ttf', 'DejaVuSans-BoldOblique.ttf', 'LiberationSans-BoldItalic.ttf'],
+}
+
+
+# --- Геометрія ---
+
+def _number(style, key, default):
+    try:
+        return float(style.get(key, default))
+    except ValueError:
+        return default
+
+
+def _color(value, default):
+    if value is None or value == '':
+        return default
+    return None if value == 'none' else value
+
+
+class Layout:
+    """Absolute boxes of vertices (child geometry is relative to the parent)"""
+
+    def __init__(self, model):
+        self.cells = model.cells
+        self._boxes = {}
+
+    def box(self, cell_id):
+        if cell_id in self._boxes:
+            return self._boxes[cell_id]
+        cell = self.cells.get(cell_id)
+        geometry = cell.get('geometry') if cell else None
+        if not geometry or not cell['vertex']:
+            return None
+        x, y = geometry['x'], geometry['y']
+        origin = self.origin(cell['parent'])
+        result = (x + origin[0], y + origin[1], geometry['width'], geometry['height'])
+        self._boxes[cell_id] = result
+        return result
+
+    def origin(self, parent_id):
+        parent = self.box(parent_id) if parent_id in self.cells else None
+        return (parent[0], parent[1]) if parent else (0.0, 0.0)
+
+
+def _center(box):
+    return box[0] + box[2] / 2, box[1] + box[3] / 2
+
+
+def _clip(box, toward, ellipse=False):
+    """Point on the border of box on the line from its centre to toward"""
+    cx, cy = _center(box)
+    dx, dy = toward[0] - cx, toward[1] - cy
+    if not dx and not dy:
+        return cx, cy
+    half_w, half_h = box[2] / 2, box[3] / 2
+    if ellipse:
+        scale = 1 / math.sqrt((dx / half_w) ** 2 + (dy / half_h) ** 2)
+    else:
+        scale = min(half_w / abs(dx) if dx else math.inf, half_h / abs(dy) if dy else math.inf)
+    return cx + dx * scale, cy + dy * scale
+
+
+def _port(box, style, prefix):
+    """Fixed connection point from exitX/exitY or entryX/entryY"""
+    if prefix + 'X' not in style:
+        return None
+    return (box[0] + _number(style, prefix + 'X', 0.5) * box[2] + _number(style, prefix + 'Dx', 0),
+            box[1] + _number(style, prefix + 'Y', 0.5) * box[3] + _number(style, prefix + 'Dy', 0))
+
+
+def _side_point(box, point):
+    """Point just outside a port: which way the orthogonal route leaves it"""
+    x, y, w, h = box
+    distances = [(abs(point[0] - x), (-1, 0)), (abs(point[0] - x - w), (1, 0)),
+                 (abs(point[1] - y), (0, -1)), (abs(point[1] - y - h), (0, 1))]
+    return min(distances)[1]
+
+
+def _elbow(start, end, direction):
+    """Orthogonal route start -> end leaving start along direction"""
+    if start[0] == end[0] or start[1] == end[1]:
+        return [start, end]
+    if direction[0]:
+        middle = (start[0] + end[0]) / 2
+        return [start, (middle, start[1]), (middle, end[1]), end]
+    middle = (start[1] + end[1]) / 2
+    return [start, (start[0], middle), (end[0], middle), end]
+
+
+def _orthogonalize(points):
+    """Insert corners so that every segment is horizontal or vertical"""
+    result = [points[0]]
+    for point in points[1:]:
+        previous = result[-1]
+        if previous[0] != point[0] and previous[1] != point[1]:
+            result.append((point[0], previous[1]))
+        result.append(point)
+    return result
+
+
+def edge_route(layout, cell):
+    """Polyline of an edge in absolute coordinates"""
+    style = cell['style']
+    geometry = cell.get('geometry') or {}
+    source = layout.box(cell['source'])
+    target = layout.box(cell['target'])
+    origin = layout.origin(cell['parent'])
+    waypoints = [(x + origin[0], y + origin[1]) for x, y in geometry.get('points', [])]
+    if source is None:
+        source_point = geometry.get('sourcePoint')
+        source = (source_point[0] + origin[0], source_point[1] + origin[1], 0, 0) if source_point else None
+    if target is None:
+        target_point = geometry.get('targetPoint')
+        target = (target_point[0] + origin[0], target_point[1] + origin[1], 0, 0) if target_point else None
+    if source is None or target is None:
+        return []
+
+    orthogonal = style.get('edgeStyle') == 'orthogonalEdgeStyle'
+    source_ellipse = 'ellipse' in layout.cells[cell['source']]['style'] if cell['source'] in layout.cells else False
+    target_ellipse = 'ellipse' in layout.cells[cell['target']]['style'] if cell['target'] in layout.cells else False
+
+    start = _port(source, style, 'exit')
+    end = _port(target, style, 'entry')
+
+    if source == target and not waypoints:
+        # Петля праворуч від вузла
+        x, y, w, h = source
+        return [(x + w, y + h / 3), (x + w + 30, y + h / 3), (x + w + 30, y + 2 * h / 3), (x + w, y + 2 * h / 3)]
+
+    first = waypoints[0] if waypoints else (end or _center(target))
+    last = waypoints[-1] if waypoints else (start or _center(source))
+    if orthogonal and waypoints:
+        # Ортогональний вихід у бік першої точки перегину
+        if start is None:
+            cx, cy = _center(source)
+            if source[0] <= first[0] <= source[0] + source[2]:
+                start = (first[0], source[1] if first[1] < cy else source[1] + source[3])
+            else:
+                start = (source[0] if first[0] < cx else source[0] + source[2], first[1] if source[1] <= first[1] <= source[1] + source[3] else cy)
+        if end is None:
+            cx, cy = _center(target)
+            if target[0] <= last[0] <= target[0] + target[2]:
+                end = (last[0], target[1] if last[1] < cy else target[1] + target[3])
+            else:
+                end = (target[0] if last[0] < cx else target[0] + target[2], last[1] if target[1] <= last[1] <= target[1] + target[3] else cy)
+        return _orthogonalize([start] + waypoints + [end])
+
+    if orthogonal:
+        if start is None or end is None:
+            sx, sy = _center(source)
+            tx, ty = _center(target)
+            horizontal = source[0] + source[2] < target[0] or target[0] + target[2] < source[0]
+            if horizontal:
+                start = start or (source[0] + source[2] if tx > sx else source[0], sy)
+                end = end or (target[0] if tx > sx else target[0] + target[2], ty)
+            else:
+                start = start or (sx, source[1] + source[3] if ty > sy else source[1])
+                end = end or (tx, target[1] if ty > sy else target[1] + target[3])
+        return _elbow(start, end, _side_point(source, start))
+
+    start = start or _clip(source, first, source_ellipse)
+    end = end or _clip(target, last, target_ellipse)
+    return [start] + waypoints + [end]
+
+
+def point_along(points, fraction):
+    """Point at fraction (0..1) of the polyline length"""
+    lengths = [math.dist(a, b) for a, b in zip(points, points[1:])]
+    remaining = sum(lengths) * min(max(fraction, 0), 1)
+    for (a, b), length in zip(zip(points, points[1:]), lengths):
+        if remaining <= length and length:
+            t = remaining / length
+            return a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t
+        remaining -= length
+    return points[-1]
+
+
+# --- Сцена ---
+
+def _font(style, default_size=DEFAULT_FONT_SIZE):
+    font_style = int(_number(style, 'fontStyle', 0))
+    return {
+        'size': _number(style, 'fontSize', default_size),
+        'bold': bool(font_style & 1),
+        'italic': bool(font_style & 2),
+        'underline': bool(font_style & 4),
+        'color': _color(style.get('fontColor'), '#000000'),
+    }
+
+
+def wrap(text, width, size):
+    """Split text into lines no wider than width (approximate metrics)"""
+    limit = max(1, int(width / (size * CHAR_WIDTH)))
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f'{line} {word}' if line else word
+            if len(candidate) > limit and line:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+def _text(box, text, style, align=None, valign=None, wrapped=False, background=None, default_size=DEFAULT_FONT_SIZE):
+    font = _font(style, default_size)
+    x, y, w, h = box
+    spacing = _number(style, 'spacing', 2)
+    x += _number(style, 'spacingLeft', 0) + spacing
+    w -= _number(style, 'spacingLeft', 0) + _number(style, 'spacingRight', 0) + 2 * spacing
+    y += _number(style, 'spacingTop', 0) + spacing
+    h -= _number(style, 'spacingTop', 0) + 2 * spacing
+    lines = wrap(text, w, font['size']) if wrapped else text.split('\n')
+    return {
+        'type': 'text',
+        'box': (x, y, w, h),
+        'lines': lines,
+        'font': font,
+        'align': align or style.get('align', 'center'),
+        'valign': valign or style.get('verticalAlign', 'middle'),
+        'background': background,
+    }
+
+
+def _shape_style(style, fill='#ffffff', stroke='#000000'):
+    return {
+        'fill': _color(style.get('fillColor'), fill),
+        'stroke': _color(style.get('strokeColor'), stroke),
+        'width': _number(style, 'strokeWidth', 1),
+        'dashed': style.get('dashed') == '1',
+    }
+
+
+def _vertex_shapes(cell, box, model):
+    style = cell['style']
+    kind = cell['kind']
+    label = cell['label']
+    x, y, w, h = box
+    wrapped = style.get('whiteSpace') == 'wrap'
+    shapes = []
+
+    if kind == 'class' or kind == 'legend':
+        header = _number(style, 'startSize', 23)
+        shapes.append({'type': 'rect', 'box': box, **_shape_style(style)})
+        if model.children.get(cell['id']):
+            shapes.append({'type': 'polyline', 'points': [(x, y + header), (x + w, y + header)],
+                           **_shape_style(style)})
+        shapes.append(_text((x, y, w, header), label, style, 'center', 'middle'))
+    elif kind == 'package':
+        tab_width = _number(style, 'tabWidth', 60)
+        tab_height = _number(style, 'tabHeight', 20)
+        shapes.append({'type': 'rect', 'box': (x, y, min(tab_width, w), tab_height), **_shape_style(style)})
+        shapes.append({'type': 'rect', 'box': (x, y + tab_height, w, h - tab_height), **_shape_style(style)})
+        if style.get('labelInHeader') == '1':
+            shapes.append(_text((x, y, min(tab_width, w), tab_height), label,
+                                {key: value for key, value in style.items() if key != 'spacingTop'}, 'left', 'middle'))
+        else:
+            shapes.append(_text(box, label, style, valign='middle'))
+    elif kind == 'frame':
+        title_width = _number(style, 'width', 60)
+        title_height = _number(style, 'height', 30)
+        shapes.append({'type': 'rect', 'box': box, **_shape_style(style, fill=None)})
+        shapes.append({'type': 'polygon', 'points': [
+            (x, y), (x + title_width, y), (x + title_width, y + title_height * 0.6),
+            (x + title_width - 10, y + title_height), (x, y + title_height)], **_shape_style(style)})
+        shapes.append(_text((x, y, title_width, title_height), label, style, wrapped=wrapped))
+    elif kind == 'actor':
+        line = _shape_style(style)
+        head = min(w, h / 4)
+        cx = x + w / 2
+        shapes.append({'type': 'ellipse', 'box': (cx - head / 2, y, head, head), **line})
+        shapes.append({'type': 'polyline', 'points': [(cx, y + head), (cx, y + h * 2 / 3)], **line})
+        shapes.append({'type': 'polyline', 'points': [(x, y + h / 3), (x + w, y + h / 3)], **line})
+        shapes.append({'type': 'polyline', 'points': [(x, y + h), (cx, y + h * 2 / 3), (x + w, y + h)], **line})
+        shapes.append(_text((x - 40, y + h, w + 80, 20), label, style, 'center', 'top'))
+    elif kind == 'use_case':
+        shapes.append({'type': 'ellipse', 'box': box, **_shape_style(style)})
+        shapes.append(_text(box, label, style, wrapped=wrapped))
+    elif kind == 'separator':
+        shapes.append({'type': 'polyline', 'points': [(x, y + h / 2), (x + w, y + h / 2)],
+                       **_shape_style(style, stroke='#000000')})
+    elif kind == 'text':
+        fill = _color(style.get('fillColor'), None)
+        stroke = _color(style.get('strokeColor'), None)
+        if fill or stroke:
+            shapes.append({'type': 'rect', 'box': box, 'fill': fill, 'stroke': stroke,
+                           'width': _number(style, 'strokeWidth', 1), 'dashed': False})
+        shapes.append(_text(box, label, style, 'left', 'top', wrapped))
+    elif kind == 'shape':
+        shapes.append({'type': 'rect', 'box': box, 'rounded': style.get('rounded') == '1', **_shape_style(style)})
+        if label:
+            shapes.append(_text(box, label, style, wrapped=wrapped))
+    return shapes
+
+
+def _marker(tip, previous, kind, size, filled, color):
+    """Arrow head at tip pointing away from previous"""
+    if kind in ('', 'none') or tip == previous:
+        return []
+    angle = math.atan2(tip[1] - previous[1], tip[0] - previous[0])
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    def at(back, side):
+        return tip[0] - back * cos - side * sin, tip[1] - back * sin + side * cos
+
+    fill = color if filled else '#ffffff'
+    if kind.startswith('diamond'):
+        half = size * (0.2 if kind == 'diamondThin' else 0.35)
+        return [{'type': 'polygon', 'points': [tip, at(size / 2, half), at(size, 0), at(size / 2, -half)],
+                 'fill': fill, 'stroke': color, 'width': 1, 'dashed': False}]
+    if kind == 'open':
+        return [{'type': 'polyline', 'points': [at(size, size * 0.4), tip, at(size, -size * 0.4)],
+                 'stroke': color, 'width': 1, 'dashed': False}]
+    # classic, block та інші - трикутник
+    return [{'type': 'polygon', 'points': [tip, at(size, size * 0.4), at(size, -size * 0.4)],
+             'fill': fill, 'stroke': color, 'width': 1, 'dashed': False}]
+
+
+def _edge_shapes(cell, layout, model):
+    style = cell['style']
+    points = edge_route(layout, cell)
+    if len(points) < 2:
+        return []
+    color = _color(style.get('strokeColor'), '#000000')
+    shapes = [{'type': 'polyline', 'points': points, 'stroke': color,
+               'width': _number(style, 'strokeWidth', 1), 'dashed': style.get('dashed') == '1'}]
+    end_arrow = style.get('endArrow', 'classic')
+    start_arrow = style.get('startArrow', 'none')
+    shapes += _marker(points[-1], points[-2], end_arrow, _number(style, 'endSize', 6) + 4,
+                      style.get('endFill', '1') != '0', color)
+    shapes += _marker(points[0], points[1], start_arrow, _number(style, 'startSize', 6) + 4,
+                      style.get('startFill', '1') != '0', color)
+
+    geometry = cell.get('geometry') or {}
+    labels = []
+    if cell['label']:
+        labels.append((cell['label'], style, geometry))
+    for child_id in model.children.get(cell['id'], []):
+        child = model.cells[child_id]
+        if child['label']:
+            labels.append((child['label'], child['style'], child.get('geometry') or {}))
+    for text, label_style, label_geometry in labels:
+        # x від -1 (джерело) до 1 (ціль), y - зсув упоперек, offset - додатковий зсув
+        x, y = point_along(points, (label_geometry.get('x', 0) + 1) / 2)
+        offset = label_geometry.get('offset') or (0, 0)
+        y += label_geometry.get('y', 0) + offset[1]
+        x += offset[0]
+        font_size = _number(label_style, 'fontSize', DEFAULT_FONT_SIZE)
+        width = max(len(line) for line in text.split('\n')) * font_size * CHAR_WIDTH + 8
+        height = len(text.split('\n')) * font_size * LINE_HEIGHT + 4
+        shapes.append(_text((x - width / 2, y - height / 2, width, height), text,
+                            {key: value for key, value in label_style.items() if not key.startswith('spacing')},
+                            'center', 'middle', background='#ffffff'))
+    return shapes
+
+
+def build_scene(model):
+    """List of drawing primitives in draw order (containers before contents, edges last)"""
+    layout = Layout(model)
+    shapes = []
+    edges = []
+
+    def visit(cell_id):
+        for child_id in model.children.get(cell_id, []):
+            cell = model.cells[child_id]
+            if cell['edge']:
+                edges.append(cell)
+            elif cell['vertex'] and cell['kind'] != 'edge_label':
+                box = layout.box(child_id)
+                if box:
+                    shapes.extend(_vertex_shapes(cell, box, model))
+            visit(child_id)
+
+    roots = [cell_id for cell_id, cell in model.cells.items() if cell['parent'] not in model.cells]
+    for root in roots:
+        visit(root)
+    for cell in edges:
+        shapes.extend(_edge_shapes(cell, layout, model))
+    return shapes
+
+
+def scene_bounds(shapes):
+    xs, ys = [], []
+    for shape in shapes:
+        if 'box' in shape:
+            x, y, w, h = shape['box']
+            xs += [x, x + w]
+            ys += [y, y + h]
+        else:
+            xs += [p[0] for p in shape['points']]
+            ys += [p[1] for p in shape['points']]
+    if not xs:
+        return 0, 0, 1, 1
+    return min(xs) - MARGIN, min(ys) - MARGIN, max(xs) - min(xs) + 2 * MARGIN, max(ys) - min(ys) + 2 * MARGIN
+
+
+def text_lines(shape):
+    """[(x, baseline y, anchor, line)] of a text primitive"""
+    x, y, w, h = shape['box']
+    size = shape['font']['size']
+    step = size * LINE_HEIGHT
+    total = step * len(shape['lines'])
+    if shape['valign'] == 'top':
+        top = y
+    elif shape['valign'] == 'bottom':
+        top = y + h - total
+    else:
+        top = y + (h - total) / 2
+    anchor, left = {'left': ('start', x), 'right': ('end', x + w)}.get(shape['align'], ('middle', x + w / 2))
+    return [(left, top + step * (i + 0.8), anchor, line) for i, line in enumerate(shape['lines'])]
+
+
+# --- SVG ---
+
+def _svg_stroke(shape):
+    stroke = shape.get('stroke')
+    if not stroke:
+        return 'stroke="none"'
+    attributes = f'stroke="{stroke}" stroke-width="{shape.get("width", 1):g}"'
+    if shape.get('dashed'):
+        attributes += ' stroke-dasharray="6 4"'
+    return attributes
+
+
+def to_svg(shapes):
+    x0, y0, width, height = scene_bounds(shapes)
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="{x0:.1f} {y0:.1f} {width:.1f} {height:.1f}" font-family="Arial, Helvetica, sans-serif">',
+        f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{width:.1f}" height="{height:.1f}" fill="#ffffff"/>',
+    ]
+    for shape in shapes:
+        kind = shape['type']
+        if kind == 'rect':
+            x, y, w, h = shape['box']
+            radius = ' rx="6"' if shape.get('rounded') else ''
+            out.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}"{radius} '
+                       f'fill="{shape["fill"] or "none"}" {_svg_stroke(shape)}/>')
+        elif kind == 'ellipse':
+            x, y, w, h = shape['box']
+            out.append(f'<ellipse cx="{x + w / 2:.1f}" cy="{y + h / 2:.1f}" rx="{w / 2:.1f}" ry="{h / 2:.1f}" '
+                       f'fill="{shape["fill"] or "none"}" {_svg_stroke(shape)}/>')
+        elif kind in ('polyline', 'polygon'):
+            points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in shape['points'])
+            fill = shape.get('fill') or 'none' if kind == 'polygon' else 'none'
+            out.append(f'<{kind} points="{points}" fill="{fill}" {_svg_stroke(shape)}/>')
+        elif kind == 'text':
+            font = shape['font']
+            if shape['background']:
+                x, y, w, h = shape['box']
+                out.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" fill="{shape["background"]}"/>')
+            attributes = f'font-size="{font["size"]:g}" fill="{font["color"]}"'
+            if font['bold']:
+                attributes += ' font-weight="bold"'
+            if font['italic']:
+                attributes += ' font-style="italic"'
+            if font['underline']:
+                attributes += ' text-decoration="underline"'
+            for x, y, anchor, line in text_lines(shape):
+                if line:
+                    out.append(f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" {attributes}>{escape(line)}</text>')
+    out.append('</svg>')
+    return '\n'.join(out)
+
+
+# --- PNG ---
+
+_fonts = {}
+
+
+def _pil_font(font, scale):
+    key = (font['bold'], font['italic'], round(font['size'] * scale))
+    if key not in _fonts:
+        for name in FONT_FILES[(font['bold'], font['italic'])]:
+            try:
+                _fonts[key] = ImageFont.truetype(name, key[2])
+                break
+            except OSError:
+                continue
+        else:
+            _fonts[key] = ImageFont.load_default(key[2])
+    return _fonts[key]
+
+
+def _dashed(draw, points, fill, width, scale):
+    dash, gap = 6 * scale, 4 * scale
+    for a, b in zip(points, points[1:]):
+        length = math.dist(a, b)
+        position = 0.0
+        while position < length:
+            end = min(position + dash, length)
+            draw.line([
+                (a[0] + (b[0] - a[0]) * position / length, a[1] + (b[1] - a[1]) * position / length),
+                (a[0] + (b[0] - a[0]) * end / length, a[1] + (b[1] - a[1]) * end / length),
+            ], fill=fill, width=width)
+            position = end + gap
+
+
+def to_png(shapes, path, dpi=150):
+    """Rasterize the scene at dpi (draw.io coordinates are 96 dpi pixels)"""
+    scale = dpi / SCREEN_DPI
+    x0, y0, width, height = scene_bounds(shapes)
+    image = Image.new('RGB', (max(1, round(width * scale)), max(1, round(height * scale))), '#ffffff')
+    draw = ImageDraw.Draw(image)
+
+    def at(point):
+        return (point[0] - x0) * scale, (point[1] - y0) * scale
+
+    def rectangle(box):
+        x, y, w, h = box
+        return [at((x, y)), at((x + w, y + h))]
+
+    for shape in shapes:
+        kind = shape['type']
+        width_px = max(1, round(shape.get('width', 1) * scale))
+        if kind == 'rect':
+            if shape.get('rounded'):
+                draw.rounded_rectangle(rectangle(shape['box']), 6 * scale, fill=shape['fill'],
+                                       outline=shape['stroke'], width=width_px)
+            else:
+                draw.rectangle(rectangle(shape['box']), fill=shape['fill'],
+                               outline=None if shape.get('dashed') else shape['stroke'], width=width_px)
+                if shape.get('dashed') and shape['stroke']:
+                    x, y, w, h = shape['box']
+                    _dashed(draw, [at(p) for p in [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]],
+                            shape['stroke'], width_px, scale)
+        elif kind == 'ellipse':
+            draw.ellipse(rectangle(shape['box']), fill=shape['fill'], outline=shape['stroke'], width=width_px)
+        elif kind == 'polygon':
+            draw.polygon([at(p) for p in shape['points']], fill=shape.get('fill'), outline=shape['stroke'], width=width_px)
+        elif kind == 'polyline':
+            points = [at(p) for p in shape['points']]
+            if shape.get('dashed'):
+                _dashed(draw, points, shape['stroke'], width_px, scale)
+            else:
+                draw.line(points, fill=shape['stroke'], width=width_px, joint='curve')
+        elif kind == 'text':
+            if shape['background']:
+                draw.rectangle(rectangle(shape['box']), fill=shape['background'])
+            font = _pil_font(shape['font'], scale)
+            for x, y, anchor, line in text_lines(shape):
+                if not line:
+                    continue
+                position = at((x, y))
+                draw.text(position, line, fill=shape['font']['color'], font=font,
+                          anchor={'start': 'ls', 'middle': 'ms', 'end': 'rs'}[anchor])
+                if shape['font']['underline']:
+                    left, _, right, _ = draw.textbbox(position, line, font=font,
+                                                      anchor={'start': 'ls', 'middle': 'ms', 'end': 'rs'}[anchor])
+                    draw.line([(left, position[1] + 2 * scale), (right, position[1] + 2 * scale)],
+                              fill=shape['font']['color'], width=max(1, round(scale)))
+    image.save(path, dpi=(dpi, dpi))
+
+
+# --- Інкрементальний рендер ---
+
+def output_paths(path, output_dir, formats):
+    name = os.path.basename(path)
+    return {fmt: os.path.join(output_dir, f'{name}.{fmt}') for fmt in formats}
+
+
+def render(path, output_dir, dpi=150, formats=('svg', 'png')):
+    """Render one diagram; returns {format: output path}"""
+    shapes = build_scene(load_model(path))
+    outputs = output_paths(path, output_dir, formats)
+    if 'svg' in outputs:
+        with open(outputs['svg'], 'w', encoding='utf-8') as f:
+            f.write(to_svg(shapes))
+    if 'png' in outputs:
+        to_png(shapes, outputs['png'], dpi)
+    return outputs
+
+
+def _render_job(job):
+    path, output_dir, dpi, formats = job
+    render(path, output_dir, dpi, formats)
+    return path
+
+
+def render_all(paths, output_dir=DIAGRAMS_DIR, dpi=150, formats=('svg', 'png'), workers=None, force=False):
+    """
+    Render diagrams whose source hash or render settings changed.
+
+    Returns (rendered paths, skipped paths).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    index_path = os.path.join(output_dir, INDEX_FILE)
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+    pending = []
+    skipped = []
+    keys = {}
+    for path in paths:
+        key = f"{file_hash(path)}-{dpi}-{RENDER_VERSION}"
+        keys[path] = key
+        up_to_date = index.get(os.path.basename(path), {})
+        outputs = output_paths(path, output_dir, formats)
+        if not force and up_to_date.get('key') == key and set(formats) <= set(up_to_date.get('formats', [])) \
+                and all(os.path.exists(output) for output in outputs.values()):
+            skipped.append(path)
+        else:
+            pending.append(path)
+
+    jobs = [(path, output_dir, dpi, tuple(formats)) for path in pending]
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(_render_job, jobs))
+    else:
+        rendered = [_render_job(job) for job in jobs]
+
+    for path in rendered:
+        index[os.path.basename(path)] = {'key': keys[path], 'formats': sorted(formats)}
+    if rendered:
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+    return rendered, skipped
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Render draw.io diagrams to SVG/PNG offline')
+    parser.add_argument('diagrams', nargs='*', help='.drawio files (docs/diagrams/*.drawio by default)')
+    parser.add_argument('-o', '--output', default=DIAGRAMS_DIR, help='output directory')
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--format', nargs='+', choices=['svg', 'png'], default=['svg', 'png'])
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes')
+    parser.add_argument('--force', action='store_true', help='re-render unchanged diagrams too')
+    args = parser.parse_args()
+
+    paths = args.diagrams or sorted(glob.glob(os.path.join(DIAGRAMS_DIR, '*.drawio')))
+    start = time.perf_counter()
+    rendered, skipped = render_all(paths, args.output, args.dpi, args.format, args.jobs, args.force)
+    for path in rendered:
+        print(f"  ✓ {os.path.basename(path)}")
+    print(f"\nПеремальовано: {len(rendered)}, без змін: {len(skipped)} за {time.perf_counter() - start:.2f} с")
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Перевірка відповідності діаграм і таблиць БД сутностям TypeORM з services/api.
+
+Із TypeScript-джерел (*.entity.ts) індексуються @Entity, колонки (@Column,
+@PrimaryGeneratedColumn, @CreateDateColumn, ...) і зв'язки (@ManyToOne,
+@OneToMany, @OneToOne, @ManyToMany з @JoinColumn). Індекс кешується:
+файл з тим самим розміром і часом зміни не читається, зі зміненим - лише
+перевіряється хеш, і розбираються (паралельно) тільки файли з новим вмістом.
+
+З іншого боку беруться модель діаграми класів (class-diagram-api.drawio),
+концептуальна схема (database_conceptual.drawio) і таблиці
+database_tables.html. Звіт містить сутності, поля і зв'язки, яких бракує
+в документації або яких немає в коді.
+
+Використання:
+    python entity_check.py [--api ../services/api/src] [-j 4]
+                           [--only class er html]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+from drawio_model import diagram_path, load_model
+from hashing import file_hash
+from html_blocks import iter_html_blocks
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+API_DIR = os.path.join(os.path.dirname(DOCS_DIR), 'services', 'api', 'src')
+CACHE_PATH = os.path.join(DOCS_DIR, '.cache', 'entities.json')
+CACHE_VERSION = 2
+TABLES_HTML = os.path.join(DOCS_DIR, 'diagrams', 'database_tables.html')
+
+COLUMN_DECORATORS = {
+    'Column', 'PrimaryColumn', 'PrimaryGeneratedColumn', 'CreateDateColumn',
+    'UpdateDateColumn', 'DeleteDateColumn', 'VersionColumn', 'ObjectIdColumn',
+}
+PRIMARY_DECORATORS = {'PrimaryColumn', 'PrimaryGeneratedColumn'}
+RELATION_DECORATORS = {'ManyToOne', 'OneToMany', 'OneToOne', 'ManyToMany'}
+
+DECORATOR_RE = re.compile(r'@(\w+)\s*\(')
+CLASS_RE = re.compile(r'\bexport\s+(?:default\s+)?(?:abstract\s+)?class\s+(\w+)')
+PROPERTY_RE = re.compile(r'\s*(?:(?:public|private|protected|readonly)\s+)*(\w+)\s*[?!]?\s*:\s*([^;=\n]+)')
+STRING_RE = re.compile(r"^\s*['\"`]([^'\"`]+)['\"`]")
+NAME_OPTION_RE = re.compile(r"\bname\s*:\s*['\"`]([^'\"`]+)['\"`]")
+TYPE_OPTION_RE = re.compile(r"\btype\s*:\s*['\"`]([^'\"`]+)['\"`]")
+TARGET_RE = re.compile(r'\(\s*\)\s*=>\s*(\w+)')
+SPACE_RE = re.compile(r'\s*')
+# Рядки в групі 1 пропускаються як є, щоб '//' чи '/*' у них не вважалися коментарем
+COMMENT_RE = re.compile(
+    r"""('(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)|/\*.*?\*/|//[^\n]*""", re.DOTALL)
+CAPTION_RE = re.compile(r'Структура таблиці\s+(\w+)')
+FIELD_NAME_RE = re.compile(r'^[A-Za-z_]\w*')
+
+
+def key(name):
+    """Comparison key: case and underscores ignored (password_hash ~ passwordHash)"""
+    return name.replace('_', '').replace(' ', '').lower()
+
+
+def snake_case(name):
+    """TypeORM default table name of a class: ProductAttribute -> product_attribute"""
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+# --- Розбір TypeScript ---
+
+def _arguments(source, start):
+    """Text between the parenthesis at start and its pair, and the index after it"""
+    depth = 0
+    quote = None
+    escaped = False
+    for index in range(start, len(source)):
+        ch = source[index]
+        if escaped:
+            escaped = False
+        elif quote:
+            if ch == '\\':
+                escaped = True
+            elif ch == quote:
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if not depth:
+                return source[start + 1:index], index + 1
+    return source[start + 1:], len(source)
+
+
+def parse_entity_source(source):
+    """
+    Entities of one TypeScript file.
+
+    Returns [{'class', 'table', 'columns': [...], 'relations': [...]}]; a
+    column is {'property', 'column', 'type', 'primary'}, a relation is
+    {'property', 'kind', 'target', 'join_column'}.
+    """
+    source = COMMENT_RE.sub(lambda m: m.group(1) or ' ' * len(m.group(0)), source)
+    entities = []
+    pending = []
+    position = 0
+    current = None
+
+    while True:
+        decorator = DECORATOR_RE.search(source, position)
+        class_match = CLASS_RE.search(source, position)
+        if class_match and (not decorator or class_match.start() < decorator.start()):
+            table = None
+            for name, arguments in pending:
+                if name == 'Entity':
+                    match = STRING_RE.match(arguments) or NAME_OPTION_RE.search(arguments)
+                    table = match.group(1) if match else snake_case(class_match.group(1))
+            current = None
+            if table:
+                current = {'class': class_match.group(1), 'table': table, 'columns': [], 'relations': []}
+                entities.append(current)
+            pending = []
+            position = class_match.end()
+            continue
+        if not decorator:
+            break
+
+        arguments, position = _arguments(source, decorator.end() - 1)
+        pending.append((decorator.group(1), arguments))
+        # Після декораторів властивості йде її оголошення
+        following = SPACE_RE.match(source, position).end()
+        if current is None or source.startswith('@', following):
+            continue
+        prop = PROPERTY_RE.match(source, position)
+        if not prop:
+            continue
+        names = {name for name, _ in pending}
+        options = dict(pending)
+        if names & COLUMN_DECORATORS:
+            decorator_name = next(name for name, _ in pending if name in COLUMN_DECORATORS)
+            arguments = options[decorator_name]
+            column = NAME_OPTION_RE.search(arguments)
+            column_type = TYPE_OPTION_RE.search(arguments) or STRING_RE.match(arguments)
+            current['columns'].append({
+                'property': prop.group(1),
+                'column': column.group(1) if column else prop.group(1),
+                'type': column_type.group(1) if column_type else prop.group(2).strip(),
+                'primary': decorator_name in PRIMARY_DECORATORS,
+            })
+        elif names & RELATION_DECORATORS:
+            kind = next(name for name, _ in pending if name in RELATION_DECORATORS)
+            target = TARGET_RE.search(options[kind])
+            join = NAME_OPTION_RE.search(options.get('JoinColumn', ''))
+            current['relations'].append({
+                'property': prop.group(1),
+                'kind': kind,
+                'target': target.group(1) if target else prop.group(2).strip().rstrip('[]'),
+                'join_column': join.group(1) if join else None,
+            })
+        pending = []
+        position = prop.end()
+    return entities
+
+
+def _parse_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return path, parse_entity_source(f.read())
+
+
+def index_entities(api_dir=API_DIR, cache_path=CACHE_PATH, workers=None):
+    """
+    {class name: entity} of all *.entity.ts files under api_dir.
+
+    Files whose size and mtime are unchanged come from the cache; changed
+    files are re-parsed only if their content hash differs. Returns
+    (entities, parsed file count).
+    """
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored.get('version') == CACHE_VERSION:
+            cache = stored['files']
+
+    files = {}
+    changed = []
+    for path in sorted(glob.glob(os.path.join(api_dir, '**', '*.entity.ts'), recursive=True)):
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        entry = cache.get(path)
+        if entry and entry['stat'] == signature:
+            files[path] = entry
+            continue
+        digest = file_hash(path)
+        if entry and entry['hash'] == digest:
+            files[path] = dict(entry, stat=signature)
+            continue
+        files[path] = {'stat': signature, 'hash': digest, 'entities': None}
+        changed.append(path)
+
+    if len(changed) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_file, changed, chunksize=8))
+    else:
+        parsed = [_parse_file(path) for path in changed]
+    for path, entities in parsed:
+        files[path]['entities'] = entities
+
+    if changed or set(files) != set(cache):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+
+    entities = {}
+    for path, entry in files.items():
+        for entity in entry['entities']:
+            entities[entity['class']] = dict(entity, path=path)
+    return entities, len(changed)
+
+
+# --- Документація ---
+
+def class_diagram_index(path):
+    """{class: {'fields': set, 'relations': set}} of <<Entity>> classes"""
+    model = load_model(path)
+    result = {}
+    for node in model.of_kind('class'):
+        if node['stereotype'] and node['stereotype'].lower() != 'entity':
+            continue
+        members = [m for m in node['members'] if not m['method']]
+        result[node['name']] = {
+            'fields': {m['name'] for m in members if m['section'] == 0},
+            'relations': {m['name'] for m in members if m['section'] > 0},
+        }
+    return result
+
+
+def er_diagram_index(path):
+    """({table: set of columns}, {(referenced, referencing)}) of a conceptual ER diagram"""
+    model = load_model(path)
+    tables = {node['name'].lower(): {m['name'] for m in node['members']} for node in model.of_kind('class')}
+    references = {(model.name(r['source']).lower(), model.name(r['target']).lower())
+                  for r in model.relations if r['source'] and r['target']}
+    return tables, references
+
+
+def html_tables_index(path):
+    """{table: set of columns} from 'Структура таблиці X' sections of an HTML file"""
+    tables = {}
+    table = None
+    for block in iter_html_blocks(path):
+        if block['type'] == 'heading':
+            match = CAPTION_RE.search(''.join(text for text, _ in block['fragments']))
+            table = match.group(1).lower() if match else None
+        elif block['type'] == 'table' and table:
+            columns = set()
+            for row in block['rows']:
+                name = FIELD_NAME_RE.match(''.join(text for text, _ in row[0]).strip()) if row else None
+                if name:
+                    columns.add(name.group(0))
+            tables[table] = columns
+            table = None
+    return tables
+
+
+# --- Порівняння ---
+
+def _compare(found, expected):
+    """(missing, extra): names of expected absent from found and vice versa, by key()"""
+    found_keys = {key(name) for name in found}
+    expected_keys = {key(name) for name in expected}
+    missing = sorted(name for name in expected if key(name) not in found_keys)
+    extra = sorted(name for name in found if key(name) not in expected_keys)
+    return missing, extra
+
+
+def _findings(source, entity, category, missing, extra):
+    return [(source, entity, category, name, 'missing') for name in missing] + \
+           [(source, entity, category, name, 'extra') for name in extra]
+
+
+def check_class_diagram(entities, path):
+    """Findings of the class diagram: entities by class name, fields by property"""
+    diagram = class_diagram_index(path)
+    source = os.path.basename(path)
+    missing, extra = _compare(diagram, entities)
+    findings = _findings(source, '', 'entity', missing, extra)
+    for name, entity in sorted(entities.items()):
+        if name not in diagram:
+            continue
+        findings += _findings(source, name, 'field', *_compare(
+            diagram[name]['fields'], [column['property'] for column in entity['columns']]))
+        findings += _findings(source, name, 'relation', *_compare(
+            diagram[name]['relations'], [relation['property'] for relation in entity['relations']]))
+    return findings
+
+
+def _tables(entities):
+    return {entity['table'].lower(): entity for entity in entities.values()}
+
+
+def _check_tables(source, tables, entities):
+    by_table = _tables(entities)
+    missing, extra = _compare(tables, by_table)
+    findings = _findings(source, '', 'table', missing, extra)
+    for table, entity in sorted(by_table.items()):
+        if table not in tables:
+            continue
+        # Колонки зв'язків (@JoinColumn) теж є в таблиці
+        columns = {column['column'] for column in entity['columns']}
+        columns |= {relation['join_column'] for relation in entity['relations'] if relation['join_column']}
+        findings += _findings(source, table, 'column', *_compare(tables[table], columns))
+    return findings
+
+
+def check_er_diagram(entities, path):
+    """Findings of the conceptual ER diagram: tables, columns and foreign-key references"""
+    tables, references = er_diagram_index(path)
+    source = os.path.basename(path)
+    findings = _check_tables(source, tables, entities)
+
+    expected = set()
+    for entity in entities.values():
+        for relation in entity['relations']:
+            target = entities.get(relation['target'])
+            if target and (relation['kind'] == 'ManyToOne' or relation['join_column']):
+                expected.add((target['table'].lower(), entity['table'].lower()))
+    known = set(tables)
+    expected = {pair for pair in expected if set(pair) <= known}
+    findings += [(source, f'{a} → {b}', 'reference', '', 'missing') for a, b in sorted(expected - references)]
+    findings += [(source, f'{a} → {b}', 'reference', '', 'extra') for a, b in sorted(references - expected)]
+    return findings
+
+
+def check_html_tables(entities, path):
+    return _check_tables(os.path.basename(path), html_tables_index(path), entities)
+
+
+CHECKS = {
+    'class': (check_class_diagram, lambda: diagram_path('class-diagram-api.drawio')),
+    'er': (check_er_diagram, lambda: diagram_path('database_conceptual.drawio')),
+    'html': (check_html_tables, lambda: TABLES_HTML),
+}
+
+PROBLEMS = {'missing': 'немає в документації', 'extra': 'немає в коді'}
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Check diagrams and DB tables against TypeORM entities')
+    parser.add_argument('--api', default=API_DIR, help='TypeScript sources with *.entity.ts files')
+    parser.add_argument('--only', nargs='+', choices=list(CHECKS), default=list(CHECKS))
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes for parsing')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entities, parsed = index_entities(args.api, workers=args.jobs)
+    print(f"Сутностей: {len(entities)}, розібрано файлів: {parsed} за {time.perf_counter() - start:.2f} с\n")
+
+    total = 0
+    for name in args.only:
+        check, path = CHECKS[name]
+        findings = check(entities, path())
+        total += len(findings)
+        print(f"=== {os.path.basename(path())}: {len(findings)} розбіжностей ===")
+        for source, entity, category, item, problem in findings:
+            target = f"{entity}.{item}" if entity and item else entity or item
+            print(f"  [{category}] {target}: {PROBLEMS[problem]}")
+        print()
+
+    print(f"Всього розбіжностей: {total}")
+    sys.exit(1 if total else 0)
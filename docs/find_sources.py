@@ -2,16 +2,17 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from docx import Document
+from doc_server import fetch
 
-doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx')
+# Абзаци беруться з сервера документів (doc_server.py serve), якщо він запущений
+DOCUMENT = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx'
 
-print(f"=== Всього параграфів: {len(doc.paragraphs)} ===\n")
+total = fetch('info', DOCUMENT)['paragraphs']
+print(f"=== Всього параграфів: {total} ===\n")
 
 print("=== ОСТАННІ 150 ПАРАГРАФІВ ===")
-start = max(0, len(doc.paragraphs) - 150)
-for i in range(start, len(doc.paragraphs)):
-    text = doc.paragraphs[i].text.strip()
-    if text:
-        preview = text[:200] + "..." if len(text) > 200 else text
-        print(f"[{i}] {preview}")
+start = max(0, total - 150)
+for para in fetch('range', DOCUMENT, start=start):
+    text = para['text']
+    preview = text[:200] + "..." if len(text) > 200 else text
+    print(f"[{para['position']}] {preview}")
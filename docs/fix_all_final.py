@@ -7,11 +7,20 @@ import random
 from datetime import datetime, timedelta
 import re
 
+from profiling import step
+from run_locator import ParagraphText
+
+# Кроки видно в профілі: DOCS_PROFILE=профіль.json або python profiling.py fix_all_final.py
+step('відкриття')
 # Відкриваємо ОРИГІНАЛЬНИЙ файл
 doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx')
 
 print("=== ПОВНА МОДИФІКАЦІЯ ДОКУМЕНТА ===\n")
 
+# Абзаци не додаються і не видаляються, тож список будується один раз
+# (doc.paragraphs створює його заново при кожному зверненні)
+paragraphs = doc.paragraphs
+
 def random_date():
     """Генерує випадкову дату між 10.10.2025 та 06.12.2025"""
     start = datetime(2025, 10, 10)
@@ -102,10 +111,11 @@ figure_descriptions = {
 # 1. АНАЛІЗ
 # ============================================================
 
+step('аналіз')
 print("1. Аналіз структури документа...\n")
 
 section_positions = {}
-for i, para in enumerate(doc.paragraphs):
+for i, para in enumerate(paragraphs):
     text = para.text.strip()
     if text == "РОЗДІЛ 1 ТЕОРЕТИЧНІ ЗАСАДИ СТВОРЕННЯ СИСТЕМИ":
         section_positions['section1_start'] = i
@@ -124,17 +134,18 @@ print(f"Позиції: {section_positions}")
 # 2. ДОДАЄМО ОПИСИ ДО РИСУНКІВ
 # ============================================================
 
+step('описи рисунків')
 print("\n2. Додаємо описи до рисунків...\n")
 
 for i in range(606, 720):
-    if i >= len(doc.paragraphs):
+    if i >= len(paragraphs):
         break
-    text = doc.paragraphs[i].text.strip()
+    text = paragraphs[i].text.strip()
     if text.startswith("Рисунок") or text.startswith("Рис"):
         # Перевіряємо чи є опис після рисунка
         has_description = False
-        if i + 1 < len(doc.paragraphs):
-            next_text = doc.paragraphs[i+1].text.strip()
+        if i + 1 < len(paragraphs):
+            next_text = paragraphs[i+1].text.strip()
             if next_text and not next_text.startswith("Рисунок") and not next_text.startswith("Рис") and not next_text.startswith("3.") and len(next_text) > 50:
                 has_description = True
 
@@ -144,10 +155,10 @@ for i in range(606, 720):
                 fig_text_norm = text.lower().replace("рис.", "рисунок")
                 fig_name_norm = fig_name.lower()
                 if fig_name_norm in fig_text_norm or fig_text_norm in fig_name_norm:
-                    if i + 1 < len(doc.paragraphs):
-                        next_para = doc.paragraphs[i + 1]
+                    if i + 1 < len(paragraphs):
+                        next_para = paragraphs[i + 1]
                         if not next_para.text.strip() or len(next_para.text.strip()) < 50:
-                            next_para.text = description
+                            ParagraphText(next_para).rewrite(description)
                             print(f"  [{i}] Додано опис: {text[:50]}...")
                     break
 
@@ -155,13 +166,14 @@ for i in range(606, 720):
 # 3. ФОРМАТУЄМО ДЖЕРЕЛА
 # ============================================================
 
+step('джерела')
 print("\n3. Форматуємо джерела...\n")
 
 sources_start = section_positions.get('sources_start', 798)
 source_num = 0
 
-for i in range(sources_start + 1, len(doc.paragraphs)):
-    para = doc.paragraphs[i]
+for i in range(sources_start + 1, len(paragraphs)):
+    para = paragraphs[i]
     text = para.text.strip()
 
     if not text:
@@ -192,12 +204,12 @@ for i in range(sources_start + 1, len(doc.paragraphs)):
 
             # Формуємо результат
             result = f"{source_num}. {clean_text}. URL: {url} (дата звернення: {date})."
-            para.text = result
+            ParagraphText(para).rewrite(result)
             print(f"  {source_num}. {result[:80]}...")
     else:
         # Без URL
         text = text.rstrip('.')
-        para.text = f"{source_num}. {text}."
+        ParagraphText(para).rewrite(f"{source_num}. {text}.")
         print(f"  {source_num}. {text[:70]}...")
 
 print(f"\nВсього джерел: {source_num}")
@@ -206,6 +218,7 @@ print(f"\nВсього джерел: {source_num}")
 # 4. ВИСНОВКИ
 # ============================================================
 
+step('висновки')
 print("\n4. Додаємо висновки до розділів...\n")
 
 # Знаходимо порожні параграфи перед кожним розділом
@@ -223,8 +236,8 @@ for section_num, conclusion_text in conclusions.items():
     found = False
     for offset in range(0, 5):
         idx = target_idx - offset
-        if idx > 0 and not doc.paragraphs[idx].text.strip():
-            doc.paragraphs[idx].text = conclusion_text
+        if idx > 0 and not paragraphs[idx].text.strip():
+            ParagraphText(paragraphs[idx]).rewrite(conclusion_text)
             print(f"  Розділ {section_num}: додано висновки в параграф [{idx}]")
             found = True
             break
@@ -236,6 +249,7 @@ for section_num, conclusion_text in conclusions.items():
 # ЗБЕРЕЖЕННЯ
 # ============================================================
 
+step('збереження')
 output_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL.docx'
 doc.save(output_path)
 
@@ -10,12 +10,18 @@ from docx.shared import Pt
 import re
 import copy
 
+from docx_tables import iter_tables
+from run_coalescer import coalesce_document, report
+
 # Шлях до файлу
 input_file = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL2.docx'
 output_file = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_FINAL3.docx'
 
 doc = Document(input_file)
 
+# Зливаємо дрібні run з однаковим форматуванням перед обходом run
+print(report(*coalesce_document(doc)))
+
 # Різні види тире для заміни на звичайний дефіс
 dash_chars = [
     '\u2013',  # en dash –
@@ -97,26 +103,25 @@ for para in doc.paragraphs:
             if run.text:
                 run.text = replace_dashes(run.text)
 
-# Обробляємо таблиці
-for table in doc.tables:
-    for row in table.rows:
-        for cell in row.cells:
-            for para in cell.paragraphs:
-                old_text = para.text
-                for dash in dash_chars:
-                    dash_count += old_text.count(dash)
-
-                is_caption = bool(re.match(r'^\s*(Таблиця|Рисунок)\s+\d+\.\d+', old_text))
-
-                if is_caption:
-                    if re.search(r'\d+\.\d+\.?\s*[-\u2013\u2014\u2015]', old_text):
-                        caption_fixes += 1
-                        new_text = fix_caption_text(old_text)
-                        set_paragraph_text(para, new_text)
-                else:
-                    for run in para.runs:
-                        if run.text:
-                            run.text = replace_dashes(run.text)
+# Обробляємо таблиці (кожна об'єднана клітинка - один раз)
+for grid in iter_tables(doc):
+    for cell in grid.cell_objects():
+        for para in cell.paragraphs:
+            old_text = para.text
+            for dash in dash_chars:
+                dash_count += old_text.count(dash)
+
+            is_caption = bool(re.match(r'^\s*(Таблиця|Рисунок)\s+\d+\.\d+', old_text))
+
+            if is_caption:
+                if re.search(r'\d+\.\d+\.?\s*[-\u2013\u2014\u2015]', old_text):
+                    caption_fixes += 1
+                    new_text = fix_caption_text(old_text)
+                    set_paragraph_text(para, new_text)
+            else:
+                for run in para.runs:
+                    if run.text:
+                        run.text = replace_dashes(run.text)
 
 # Зберігаємо результат
 doc.save(output_file)
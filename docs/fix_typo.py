@@ -4,17 +4,18 @@ sys.stdout.reconfigure(encoding='utf-8')
 
 from docx import Document
 
+from text_corrector import load_corrector
+
 doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED5.docx')
 
 print("=== ВИПРАВЛЕННЯ ДРУКАРСЬКОЇ ПОМИЛКИ ===\n")
 
-# Знаходимо та виправляємо "Еелктронний" на "Електронний"
-for i, para in enumerate(doc.paragraphs):
-    text = para.text
-    if 'Еелктронний' in text:
-        new_text = text.replace('Еелктронний', 'Електронний')
-        doc.paragraphs[i].text = new_text
-        print(f"[{i}] Виправлено: {new_text[:80]}...")
+# Виправляємо всі помилки словника corrections.tsv (у т.ч. "Еелктронний")
+# за один прохід; заміна лише в тих run, які покриває слово
+corrector = load_corrector()
+hits = corrector.apply(doc)
+for pattern, count in hits.most_common():
+    print(f"Виправлено {count}x: {pattern}")
 
 # Зберігаємо результат
 output_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED5.docx'
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Перевірка оформлення роботи за вимогами ДСТУ / кафедри.
+
+Вимоги описані декларативно (format_profile.json): поля сторінки і
+правила для абзаців - підписи рисунків і таблиць, заголовки, клітинки
+таблиць, основний текст (Times New Roman 14, інтервал 1.5, абзацний
+відступ 1.25 см, вирівнювання по ширині). Ефективне форматування кожного
+абзацу і run береться з style_resolver, тож перевірка всієї роботи
+займає до секунди.
+
+З --fix порушення виправляються насамперед на рівні стилів: якщо всі
+абзаци стилю, для яких є правило, мають отримати одне значення, воно
+записується в стиль, а пряме форматування, що його перекриває,
+прибирається. Непорожні абзаци того ж стилю без такого правила отримують
+своє попереднє значення прямим форматуванням, тож їхній вигляд не
+змінюється. Лише те, що так виправити не можна, змінюється безпосередньо
+в абзацах і run.
+
+Використання:
+    python format_check.py робота.docx [--profile format_profile.json]
+                           [--fix] [-o результат.docx] [-n 50]
+"""
+
+from collections import Counter, defaultdict
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Cm, Pt
+from docx.styles.style import StyleFactory
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from run_locator import iter_paragraphs
+from style_resolver import W, W_PPR, W_RPR, StyleResolver
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROFILE = os.path.join(DOCS_DIR, 'format_profile.json')
+
+W_T = W + 't'
+W_TC = W + 'tc'
+
+ALIGNMENTS = {
+    'left': WD_ALIGN_PARAGRAPH.LEFT,
+    'center': WD_ALIGN_PARAGRAPH.CENTER,
+    'right': WD_ALIGN_PARAGRAPH.RIGHT,
+    'justify': WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+UNITS = {
+    'first_line_indent': 'cm', 'left_indent': 'cm', 'right_indent': 'cm',
+    'top_margin': 'cm', 'bottom_margin': 'cm', 'left_margin': 'cm', 'right_margin': 'cm',
+    'size': 'pt', 'space_before': 'pt', 'space_after': 'pt', 'line_spacing': 'line',
+}
+PROPERTY_NAMES = {
+    'alignment': 'вирівнювання', 'line_spacing': 'міжрядковий інтервал',
+    'first_line_indent': 'абзацний відступ', 'left_indent': 'відступ зліва',
+    'right_indent': 'відступ справа', 'space_before': 'інтервал перед',
+    'space_after': 'інтервал після', 'font': 'шрифт', 'size': 'кегль',
+    'bold': 'жирний', 'italic': 'курсив',
+}
+EXCERPT = 60
+# Значення, яке діє, коли властивість не задана ні в стилях, ні в абзаці
+WORD_DEFAULTS = {
+    'alignment': 'left', 'line_spacing': 1.0, 'first_line_indent': 0, 'left_indent': 0, 'right_indent': 0,
+    'space_before': 0, 'space_after': 0, 'bold': False, 'italic': False,
+}
+
+
+def load_profile(path=DEFAULT_PROFILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+    for rule in profile['rules']:
+        match = rule.setdefault('match', {})
+        for key in ('text', 'style'):
+            if key in match:
+                match[key] = re.compile(match[key])
+    ignore = profile.setdefault('ignore', {})
+    ignore['fonts'] = set(ignore.get('fonts', []))
+    if ignore.get('styles'):
+        ignore['styles'] = re.compile(ignore['styles'])
+    return profile
+
+
+def _allowed(expected):
+    return expected if isinstance(expected, list) else [expected]
+
+
+def _matches(actual, expected, prop, tolerance):
+    """Whether an effective value satisfies the profile (a value or a list of values)"""
+    margin = tolerance.get(UNITS.get(prop), 0)
+    for value in _allowed(expected):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if isinstance(actual, (int, float)) and abs(actual - value) <= margin:
+                return True
+        elif actual == value or (value is False and actual is None):
+            return True
+    return False
+
+
+def _rule_for(profile, style_name, text, in_table):
+    for rule in profile['rules']:
+        match = rule['match']
+        if 'in_table' in match and match['in_table'] != in_table:
+            continue
+        if 'style' in match and not match['style'].search(style_name or ''):
+            continue
+        if 'text' in match and not match['text'].search(text):
+            continue
+        return rule
+    return None
+
+
+class FormatChecker:
+    """Evaluate paragraphs and runs of a document against a rule profile"""
+
+    def __init__(self, doc, profile):
+        self.doc = doc
+        self.profile = profile
+        self.tolerance = profile.get('tolerance', {})
+        # Після check(): непорожні абзаци кожного стилю і ті з них, що мають правило для властивості
+        self.members = defaultdict(list)
+        self.covered = defaultdict(set)
+
+    def check(self):
+        """
+        [violation] of the document and the expectations per style.
+
+        A violation is a dict with position, text, rule, scope ('page',
+        'paragraph' or 'run'), property, expected, actual and the affected
+        elements. expectations maps (style id, scope, property) to the set of
+        values the paragraphs of that style must get.
+        """
+        resolver = StyleResolver(self.doc)
+        ignore = self.profile['ignore']
+        style_names = {}
+        violations = []
+        expectations = defaultdict(set)
+        self.members = defaultdict(list)
+        self.covered = defaultdict(set)
+
+        for index, section in enumerate(self.doc.sections):
+            for prop, expected in self.profile.get('page', {}).items():
+                value = getattr(section, prop)
+                actual = round(value.cm, 2) if value is not None else None
+                if not _matches(actual, expected, prop, self.tolerance):
+                    violations.append({
+                        'position': index, 'text': f'Розділ документа {index + 1}', 'rule': 'page',
+                        'scope': 'page', 'property': prop, 'expected': expected, 'actual': actual,
+                        'elements': [section],
+                    })
+
+        for position, p in enumerate(iter_paragraphs(self.doc)):
+            paragraph = resolver.paragraph(p)
+            style_id = paragraph['style']
+            if style_id not in style_names:
+                style_names[style_id] = resolver.style_name(style_id)
+            style_name = style_names[style_id]
+            if ignore.get('styles') and ignore['styles'].search(style_name or ''):
+                continue
+            all_runs = resolver.runs(p)
+            # Абзац з текстом лише у винятих шрифтах не перевіряється, але зміна стилю його зачепить
+            if any((t.text or '').strip() for r, _ in all_runs for t in r.iter(W_T)):
+                self.members[style_id].append(p)
+            runs = [(r, props) for r, props in all_runs if props.get('font') not in ignore['fonts']]
+            text = ''.join(t.text or '' for r, _ in runs for t in r.iter(W_T)).strip()
+            if not text:
+                continue
+            rule = _rule_for(self.profile, style_name, text, p.getparent().tag == W_TC)
+            if rule is None:
+                continue
+
+            for prop, expected in rule.get('paragraph', {}).items():
+                expectations[(style_id, 'paragraph', prop)].add(json.dumps(expected))
+                self.covered[(style_id, 'paragraph', prop)].add(p)
+                actual = paragraph.get(prop)
+                if prop == 'line_spacing' and paragraph.get('line_spacing_pt') is not None:
+                    # Точний інтервал у пунктах не відповідає жодному множнику профілю
+                    actual = f"{paragraph['line_spacing_pt']:g} pt"
+                if not _matches(actual, expected, prop, self.tolerance):
+                    violations.append({
+                        'position': position, 'text': text, 'rule': rule['name'], 'style': style_id,
+                        'scope': 'paragraph', 'property': prop, 'expected': expected, 'actual': actual,
+                        'elements': [p],
+                    })
+            for prop, expected in rule.get('run', {}).items():
+                expectations[(style_id, 'run', prop)].add(json.dumps(expected))
+                self.covered[(style_id, 'run', prop)].add(p)
+                wrong = [r for r, props in runs if not _matches(props.get(prop), expected, prop, self.tolerance)]
+                if wrong:
+                    actual = Counter(resolver.run(r, style_id).get(prop) for r in wrong).most_common(1)[0][0]
+                    violations.append({
+                        'position': position, 'text': text, 'rule': rule['name'], 'style': style_id,
+                        'scope': 'run', 'property': prop, 'expected': expected, 'actual': actual,
+                        'elements': wrong,
+                    })
+        return violations, expectations
+
+    # --- Виправлення ---
+
+    @staticmethod
+    def _set_paragraph(paragraph_format, prop, value):
+        if prop == 'alignment':
+            paragraph_format.alignment = ALIGNMENTS[value]
+        elif prop == 'line_spacing':
+            paragraph_format.line_spacing = value
+        elif prop in ('first_line_indent', 'left_indent', 'right_indent'):
+            setattr(paragraph_format, prop, Cm(value))
+        elif prop in ('space_before', 'space_after'):
+            setattr(paragraph_format, prop, Pt(value))
+
+    @staticmethod
+    def _set_font(font, prop, value):
+        if prop == 'font':
+            font.name = value
+        elif prop == 'size':
+            font.size = Pt(value)
+        elif prop in ('bold', 'italic'):
+            setattr(font, prop, value)
+
+    @staticmethod
+    def _clear_direct(element, scope, prop):
+        """Remove the direct formatting of prop so that the style value applies"""
+        props = element.find(W_PPR if scope == 'paragraph' else W_RPR)
+        if props is None:
+            return
+        if scope == 'paragraph':
+            if prop == 'alignment':
+                targets = [(props.find(W + 'jc'), None)]
+            elif prop == 'line_spacing':
+                targets = [(props.find(W + 'spacing'), ('line', 'lineRule'))]
+            elif prop == 'first_line_indent':
+                targets = [(props.find(W + 'ind'), ('firstLine', 'hanging'))]
+            else:
+                targets = []
+        else:
+            targets = {
+                'font': [(props.find(W + 'rFonts'), ('ascii', 'hAnsi', 'asciiTheme', 'hAnsiTheme', 'cs', 'eastAsia'))],
+                'size': [(props.find(W + 'sz'), None), (props.find(W + 'szCs'), None)],
+                'bold': [(props.find(W + 'b'), None)],
+                'italic': [(props.find(W + 'i'), None)],
+            }.get(prop, [])
+        for child, attributes in targets:
+            if child is None:
+                continue
+            if attributes:
+                for attribute in attributes:
+                    child.attrib.pop(W + attribute, None)
+            if not attributes or not child.attrib:
+                props.remove(child)
+
+    def _pin(self, resolver, p, scope, prop):
+        """Write the current effective value of prop as direct formatting; returns the number of changes"""
+        if scope == 'paragraph':
+            props = resolver.paragraph(p)
+            paragraph_format = Paragraph(p, None).paragraph_format
+            if prop == 'line_spacing' and props.get('line_spacing_pt') is not None:
+                paragraph_format.line_spacing = Pt(props['line_spacing_pt'])
+                return 1
+            value = props.get(prop, WORD_DEFAULTS.get(prop))
+            if value is None or (prop == 'alignment' and value not in ALIGNMENTS):
+                return 0
+            self._set_paragraph(paragraph_format, prop, value)
+            return 1
+        pinned = 0
+        for r, props in resolver.runs(p):
+            value = props.get(prop, WORD_DEFAULTS.get(prop))
+            if value is not None:
+                self._set_font(Run(r, None).font, prop, value)
+                pinned += 1
+        return pinned
+
+    def fix(self):
+        """
+        Fix violations, style level first.
+
+        A value goes into the style when all rule-covered paragraphs of the
+        style expect it; non-empty paragraphs of the style without such a
+        rule keep their current look through direct formatting.
+        Returns (style fixes, direct fixes, remaining violations).
+        """
+        violations, expectations = self.check()
+        resolver = StyleResolver(self.doc)
+        styles = self.doc.styles.element
+        style_fixes = 0
+        direct_fixes = 0
+        pending = []
+        for (style_id, scope, prop), values in expectations.items():
+            if len(values) != 1 or not style_id:
+                continue
+            affected = [v for v in violations
+                        if v.get('style') == style_id and v['scope'] == scope and v['property'] == prop]
+            if not affected:
+                continue
+            element = styles.get_by_id(style_id)
+            if element is None:
+                continue
+            covered = self.covered[(style_id, scope, prop)]
+            # Старі значення фіксуються до зміни будь-якого стилю
+            for p in self.members[style_id]:
+                if p not in covered:
+                    direct_fixes += self._pin(resolver, p, scope, prop)
+            pending.append((element, scope, prop, _allowed(json.loads(next(iter(values))))[0], affected))
+
+        for element, scope, prop, value, affected in pending:
+            style = StyleFactory(element)
+            if scope == 'paragraph':
+                self._set_paragraph(style.paragraph_format, prop, value)
+            else:
+                self._set_font(style.font, prop, value)
+            for violation in affected:
+                for item in violation['elements']:
+                    self._clear_direct(item, scope, prop)
+            style_fixes += 1
+
+        violations, _ = self.check()
+        for violation in violations:
+            value = _allowed(violation['expected'])[0]
+            for item in violation['elements']:
+                if violation['scope'] == 'page':
+                    setattr(item, violation['property'], Cm(value))
+                elif violation['scope'] == 'paragraph':
+                    self._set_paragraph(Paragraph(item, None).paragraph_format, violation['property'], value)
+                else:
+                    self._set_font(Run(item, None).font, violation['property'], value)
+                direct_fixes += 1
+        return style_fixes, direct_fixes, self.check()[0]
+
+
+def describe(violation):
+    prop = PROPERTY_NAMES.get(violation['property'], violation['property'])
+    text = violation['text']
+    excerpt = text[:EXCERPT] + ('...' if len(text) > EXCERPT else '')
+    runs = f" ({len(violation['elements'])} run)" if violation['scope'] == 'run' else ''
+    return (f"[{violation['position']}] {violation['rule']}: {prop} {violation['actual']} "
+            f"замість {violation['expected']}{runs} - {excerpt}")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    from docx import Document
+
+    parser = argparse.ArgumentParser(description='Check thesis formatting against a DSTU rule profile')
+    parser.add_argument('docx')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE)
+    parser.add_argument('--fix', action='store_true', help='fix violations (styles first)')
+    parser.add_argument('-o', '--output', help='output path for --fix (the input is overwritten by default)')
+    parser.add_argument('-n', '--limit', type=int, default=50, help='violations to print')
+    args = parser.parse_args()
+
+    doc = Document(args.docx)
+    checker = FormatChecker(doc, load_profile(args.profile))
+
+    start = time.perf_counter()
+    violations, _ = checker.check()
+    elapsed = time.perf_counter() - start
+
+    summary = Counter((v['rule'], v['property']) for v in violations)
+    print(f"=== ПОРУШЕННЯ ОФОРМЛЕННЯ: {len(violations)} (перевірка за {elapsed:.3f} с) ===\n")
+    for (rule, prop), count in summary.most_common():
+        print(f"  {count:5}  {rule}: {PROPERTY_NAMES.get(prop, prop)}")
+    print()
+    for violation in violations[:args.limit]:
+        print(describe(violation))
+
+    if args.fix and violations:
+        start = time.perf_counter()
+        style_fixes, direct_fixes, remaining = checker.fix()
+        output = args.output or args.docx
+        doc.save(output)
+        print(f"\nВиправлено у стилях: {style_fixes}, безпосередньо: {direct_fixes}, "
+              f"залишилось: {len(remaining)} за {time.perf_counter() - start:.3f} с")
+        print(f"Документ збережено: {output}")
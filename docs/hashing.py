@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Хеш вмісту файлів для кешів і інкрементних індексів.
+
+Окремий модуль без сторонніх залежностей: його імпортують і легкі
+скрипти (drawio_model, клієнт doc_server), яким не потрібні numpy і scipy
+з thesis_summarizer.
+"""
+
+import hashlib
+
+
+def file_hash(path):
+    """sha256 of a file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потоковий розбір HTML-документів (conclusions.html, database_tables.html, ...)
+у ті самі блоки, що й markdown_blocks: heading, paragraph, list_item, code,
+table, quote, rule. Текст блоків зберігається як фрагменти
+[(text, {'bold', 'italic', 'code'})].
+
+HTML подається шматками, а готові блоки віддаються одразу після закриття
+їхнього тегу, тож великі файли не потрібно тримати в пам'яті цілком.
+"""
+
+from html.parser import HTMLParser
+from collections import deque
+import re
+
+SKIP_TAGS = {'head', 'style', 'script', 'title', 'noscript'}
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+BOLD_TAGS = {'b', 'strong', 'th'}
+ITALIC_TAGS = {'i', 'em', 'cite'}
+CODE_TAGS = {'code', 'kbd', 'samp', 'tt'}
+PARAGRAPH_TAGS = {'p', 'div', 'section', 'article', 'figcaption', 'caption', 'dd', 'dt'}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _trim(fragments):
+    """Strip whitespace at the edges of a fragment list and drop empty fragments"""
+    if fragments:
+        text, fmt = fragments[0]
+        fragments[0] = (text.lstrip(), fmt)
+        text, fmt = fragments[-1]
+        fragments[-1] = (text.rstrip(), fmt)
+    return [(text, fmt) for text, fmt in fragments if text]
+
+
+class HTMLBlockParser(HTMLParser):
+    """HTMLParser that collects finished blocks in self.blocks"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = deque()
+        self._skip = 0
+        self._bold = 0
+        self._italic = 0
+        self._code = 0
+        self._pre = None
+        self._lists = []
+        self._block = None
+        self._table = None
+        self._row = None
+        self._cell = None
+
+    # --- допоміжні методи ---
+
+    def _format(self):
+        return {'bold': self._bold > 0, 'italic': self._italic > 0, 'code': self._code > 0}
+
+    def _target(self):
+        """Fragment list that receives text right now"""
+        if self._cell is not None:
+            return self._cell
+        if self._block is None:
+            if self._lists:
+                self._open_block('list_item')
+            else:
+                self._open_block('paragraph')
+        return self._block['fragments']
+
+    def _open_block(self, kind, **extra):
+        self._close_block()
+        if kind == 'list_item':
+            extra = {'ordered': self._lists[-1], 'level': len(self._lists) - 1}
+        self._block = {'type': kind, 'fragments': [], **extra}
+
+    def _close_block(self):
+        if self._block is None:
+            return
+        block, self._block = self._block, None
+        block['fragments'] = _trim(block['fragments'])
+        if block['fragments']:
+            self.blocks.append(block)
+
+    def _add_text(self, text):
+        target = self._target()
+        fmt = self._format()
+        if target and target[-1][1] == fmt:
+            target[-1] = (target[-1][0] + text, fmt)
+        else:
+            target.append((text, fmt))
+
+    # --- обробники HTMLParser ---
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+            return
+        if self._skip:
+            return
+
+        if self._pre is not None:
+            if tag == 'br':
+                self._pre.append('\n')
+            return
+
+        if tag in HEADING_TAGS:
+            self._open_block('heading', level=HEADING_TAGS[tag])
+        elif tag in PARAGRAPH_TAGS and self._cell is None:
+            self._close_block()
+        elif tag in ('ul', 'ol'):
+            self._close_block()
+            self._lists.append(tag == 'ol')
+        elif tag == 'li':
+            self._open_block('list_item')
+        elif tag == 'blockquote':
+            self._open_block('quote')
+        elif tag == 'pre':
+            self._close_block()
+            self._pre = []
+        elif tag == 'hr':
+            self._close_block()
+            self.blocks.append({'type': 'rule'})
+        elif tag == 'br':
+            self._add_text('\n')
+        elif tag == 'table':
+            self._close_block()
+            self._table = {'type': 'table', 'header': None, 'rows': []}
+        elif tag == 'tr' and self._table is not None:
+            self._row = {'cells': [], 'header': True}
+        elif tag in ('td', 'th') and self._row is not None:
+            if tag == 'td':
+                self._row['header'] = False
+            self._cell = []
+
+        if tag in BOLD_TAGS:
+            self._bold += 1
+        elif tag in ITALIC_TAGS:
+            self._italic += 1
+        elif tag in CODE_TAGS:
+            self._code += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+
+        if tag == 'pre' and self._pre is not None:
+            lines = ''.join(self._pre).strip('\n').split('\n')
+            self.blocks.append({'type': 'code', 'lang': '', 'lines': lines})
+            self._pre = None
+            return
+        if self._pre is not None:
+            return
+
+        if tag in BOLD_TAGS:
+            self._bold = max(0, self._bold - 1)
+        elif tag in ITALIC_TAGS:
+            self._italic = max(0, self._italic - 1)
+        elif tag in CODE_TAGS:
+            self._code = max(0, self._code - 1)
+
+        if tag in ('td', 'th') and self._cell is not None:
+            self._row['cells'].append(_trim(self._cell))
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            row = self._row
+            self._row = None
+            if row['header'] and self._table['header'] is None and not self._table['rows']:
+                self._table['header'] = row['cells']
+            else:
+                self._table['rows'].append(row['cells'])
+        elif tag == 'table' and self._table is not None:
+            self.blocks.append(self._table)
+            self._table = None
+        elif tag in ('ul', 'ol') and self._lists:
+            self._close_block()
+            self._lists.pop()
+        elif tag in HEADING_TAGS or tag in PARAGRAPH_TAGS or tag in ('li', 'blockquote'):
+            if self._cell is None:
+                self._close_block()
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._pre is not None:
+            self._pre.append(data)
+            return
+        text = WHITESPACE_RE.sub(' ', data)
+        if text.strip() or (self._block is not None and self._block['fragments']) or self._cell:
+            self._add_text(text)
+
+    def close(self):
+        super().close()
+        self._close_block()
+
+
+def iter_html_blocks(path, chunk_size=CHUNK_SIZE):
+    """Yield blocks of an HTML file while reading it in chunks"""
+    parser = HTMLBlockParser()
+    with open(path, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+            while parser.blocks:
+                yield parser.blocks.popleft()
+    parser.close()
+    while parser.blocks:
+        yield parser.blocks.popleft()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Кеш підготовлених зображень для презентацій.
+
+Скріншоти з extracted_images мають розмір у кілька мегабайт, а на слайді
+показуються максимум на 8-9 дюймів. prepare_image() зменшує зображення до
+розміру місця на слайді при заданому DPI і зберігає результат у кеші з
+ключем (хеш джерела, розмір місця, DPI). JPEG-фото лишаються JPEG (у PNG
+вони займають у кілька разів більше), решта зберігається як PNG. При
+повторній збірці вже підготовлені зображення просто беруться з кешу.
+"""
+
+from PIL import Image
+import hashlib
+import json
+import os
+
+EMU_PER_INCH = 914400
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'images')
+INDEX_FILE = 'index.json'
+
+_indexes = {}
+
+
+def _load_index(cache_dir):
+    """Load (path, mtime, size) -> source hash index"""
+    if cache_dir not in _indexes:
+        index_path = os.path.join(cache_dir, INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                _indexes[cache_dir] = json.load(f)
+        except (OSError, ValueError):
+            _indexes[cache_dir] = {}
+    return _indexes[cache_dir]
+
+
+def _save_index(cache_dir):
+    """Persist source hash index"""
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, INDEX_FILE)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(_indexes[cache_dir], f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+
+def source_hash(image_path, cache_dir=CACHE_DIR):
+    """Return sha256 of the source file, reusing the index when mtime/size match"""
+    index = _load_index(cache_dir)
+    stat = os.stat(image_path)
+    key = os.path.abspath(image_path)
+    entry = index.get(key)
+    if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+        return entry['sha256']
+
+    h = hashlib.sha256()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    digest = h.hexdigest()
+
+    index[key] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': digest}
+    _save_index(cache_dir)
+    return digest
+
+
+def box_pixels(box_width=None, box_height=None, dpi=DEFAULT_DPI):
+    """Convert a placement box in EMU to pixels at the target DPI"""
+    width_px = int(round(box_width * dpi / EMU_PER_INCH)) if box_width else None
+    height_px = int(round(box_height * dpi / EMU_PER_INCH)) if box_height else None
+    return width_px, height_px
+
+
+def _fit_size(size, width_px, height_px):
+    """Scale (w, h) down to fit the pixel box, keeping aspect ratio"""
+    w, h = size
+    scale = 1.0
+    if width_px:
+        scale = min(scale, width_px / w)
+    if height_px:
+        scale = min(scale, height_px / h)
+    return max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+
+
+def prepare_image(image_path, box_width=None, box_height=None, dpi=DEFAULT_DPI, cache_dir=CACHE_DIR):
+    """
+    Return path to a copy of image_path scaled to fit the placement box.
+
+    box_width / box_height are EMU lengths (Inches(8) etc.), either may be
+    None. Images that already fit are returned unchanged.
+    """
+    width_px, height_px = box_pixels(box_width, box_height, dpi)
+    digest = source_hash(image_path, cache_dir)
+
+    # Image.open читає лише заголовок; пікселі декодуються тільки при resize
+    with Image.open(image_path) as img:
+        target = _fit_size(img.size, width_px, height_px)
+        if target == img.size:
+            return image_path
+
+        jpeg = img.format == 'JPEG'
+        name = f"{digest[:32]}_{width_px or 0}x{height_px or 0}_{dpi}.{'jpg' if jpeg else 'png'}"
+        cached_path = os.path.join(cache_dir, name)
+        if os.path.exists(cached_path):
+            return cached_path
+
+        if jpeg and img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        elif not jpeg and img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        resized = img.resize(target, Image.LANCZOS)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cached_path + '.tmp'
+    if jpeg:
+        resized.save(tmp_path, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+    else:
+        resized.save(tmp_path, format='PNG', optimize=True)
+    os.replace(tmp_path, cached_path)
+    return cached_path
+
+
+if __name__ == "__main__":
+    from pptx.util import Inches
+
+    extracted_base = r"C:\Users\Iurii\Desktop\magister\extracted_images"
+
+    total_before = 0
+    total_after = 0
+    for filename in sorted(os.listdir(extracted_base)):
+        if not filename.lower().endswith(('.png', '.jpg', '.jpeg')):
+            continue
+        path = os.path.join(extracted_base, filename)
+        prepared = prepare_image(path, box_width=Inches(8), box_height=Inches(5.5))
+        before = os.path.getsize(path)
+        after = os.path.getsize(prepared)
+        total_before += before
+        total_after += after
+        print(f"{filename:20} {before // 1024:6} KB -> {after // 1024:6} KB")
+
+    print(f"\nTotal: {total_before // 1024} KB -> {total_after // 1024} KB")
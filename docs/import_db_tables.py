@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Імпорт таблиць бази даних з database_tables.html у документ Word.
+
+HTML читається потоково (html_blocks), кожна <table> одразу збирається як
+готовий w:tbl (docx_builder.make_table) без cell.text по кожній клітинці.
+Перед таблицею додається підпис "Таблиця N.M. Назва" за заголовком <h2>,
+а опис із наступного <p> - як звичайний абзац тексту.
+
+Використання:
+    python import_db_tables.py [html] [--docx thesis.docx] [--after "текст"]
+                               [--chapter 3] [--style "Table Grid"] [-o output.docx]
+"""
+
+from docx import Document
+import argparse
+import os
+import re
+import sys
+import time
+
+from docx_builder import BodyWriter, make_paragraph, make_table
+from html_blocks import iter_html_blocks
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CAPTION_RE = re.compile(r'^\s*Таблиця\s+(\d+)\.(\d+)\.?\s*[-–—.]?\s*(.*)$')
+
+FONT = 'Times New Roman'
+CAPTION_SIZE = 14
+CELL_SIZE = 12
+
+
+def _text(fragments):
+    return ''.join(text for text, _ in fragments)
+
+
+def import_tables(html_path, doc, after=None, chapter=None, style_name='Table Grid'):
+    """
+    Insert every table of html_path into doc with its caption.
+
+    after - paragraph element to insert after (None appends to the end),
+    chapter - renumber captions as chapter.1, chapter.2, ... (by default the
+    numbers from the HTML headings are kept). Returns (tables, rows) counts.
+    """
+    writer = BodyWriter(doc, after=after)
+    style_id = writer.style_id(style_name)
+
+    title = None
+    source_number = None
+    table_count = 0
+    row_count = 0
+
+    for block in iter_html_blocks(html_path):
+        kind = block['type']
+        if kind == 'heading':
+            match = CAPTION_RE.match(_text(block['fragments']))
+            if match:
+                source_number = f"{match.group(1)}.{match.group(2)}"
+                title = match.group(3)
+            else:
+                source_number = None
+                title = _text(block['fragments'])
+        elif kind == 'paragraph':
+            writer.append(make_paragraph(block['fragments'], style_id=writer.style_id('Normal')))
+        elif kind == 'table':
+            table_count += 1
+            if chapter:
+                number = f"{chapter}.{table_count}"
+            else:
+                number = source_number or str(table_count)
+            caption = f"Таблиця {number}. {title}" if title else f"Таблиця {number}"
+            writer.append(make_paragraph(
+                [(caption, {})], alignment='center', font=FONT, size=CAPTION_SIZE,
+            ))
+
+            rows = ([block['header']] if block['header'] else []) + block['rows']
+            writer.append(make_table(
+                rows, style_id=style_id, header_rows=1 if block['header'] else 0,
+                font=FONT, size=CELL_SIZE,
+            ))
+            row_count += len(rows)
+            title = None
+            source_number = None
+
+    return table_count, row_count
+
+
+def find_paragraph(doc, text):
+    """First body paragraph element containing text"""
+    for para in doc.paragraphs:
+        if text in para.text:
+            return para._p
+    raise ValueError(f"Абзац з текстом '{text}' не знайдено")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Import HTML DB tables as native Word tables')
+    parser.add_argument('html', nargs='?', default=os.path.join(DOCS_DIR, 'database_tables.html'))
+    parser.add_argument('--docx', help='document to insert into (new document by default)')
+    parser.add_argument('--after', help='insert after the first paragraph containing this text')
+    parser.add_argument('--chapter', type=int, default=None, help='caption chapter number')
+    parser.add_argument('--style', default='Table Grid', help='table style name')
+    parser.add_argument('-o', '--output', default=r'C:\Users\Iurii\Downloads\Таблиці_БД.docx')
+    args = parser.parse_args()
+
+    doc = Document(args.docx) if args.docx else Document()
+    after = find_paragraph(doc, args.after) if args.after else None
+
+    start = time.perf_counter()
+    tables, rows = import_tables(args.html, doc, after, args.chapter, args.style)
+    elapsed = time.perf_counter() - start
+
+    doc.save(args.output)
+    print(f"Імпортовано таблиць: {tables}, рядків: {rows} за {elapsed:.3f} с "
+          f"({rows / elapsed if elapsed else 0:.0f} рядків/с)")
+    print(f"Документ збережено: {args.output}")
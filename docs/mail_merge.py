@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Масове створення відгуків і рецензій з одного шаблону docx.
+
+Шаблон розбирається один раз: у кожному абзаці шукаються поля {{назва}}
+та задані фрази-замінники (наприклад 'Луцик О.Р.'), навіть якщо Word
+розбив їх на кілька w:r (run_locator). Кожне поле зводиться до одного
+w:t, після чого XML частини серіалізується і ділиться на незмінні шматки
+між полями.
+Документ для запису зі списку - це лише склеювання шматків зі значеннями
+та запис zip, тож N документів рендеряться в паралельних процесах без
+повторного розбору шаблону.
+
+Використання:
+    python mail_merge.py шаблон.docx список.csv|json [-o тека]
+                         [--name "ВІДГУК_{surname}.docx"] [-j workers]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+from lxml import etree
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+
+from run_locator import ParagraphText, own_texts
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_P = f'{{{W_NS}}}p'
+W_R = f'{{{W_NS}}}r'
+W_T = f'{{{W_NS}}}t'
+W_BODY = f'{{{W_NS}}}body'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Частини, в яких можуть бути поля
+PART_RE = re.compile(r'^word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$')
+
+FIELD_RE = re.compile(r'\{\{\s*([\w.]+)\s*\}\}')
+
+# Маркер поля в серіалізованому XML (символи з Private Use Area)
+SLOT_OPEN = '\ue000'
+SLOT_CLOSE = '\ue001'
+SLOT_RE = re.compile(SLOT_OPEN + r'(\d+)' + SLOT_CLOSE)
+
+# Перенос рядка у значенні поля: закриваємо w:t, додаємо w:br, відкриваємо новий
+LINE_BREAK = '</w:t><w:br/><w:t xml:space="preserve">'
+
+
+def _phrase_pattern(phrases):
+    """Regex for {{fields}} and literal phrases (longest phrase wins)"""
+    alternatives = [FIELD_RE.pattern]
+    alternatives += [re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)]
+    return re.compile('|'.join(alternatives))
+
+
+class MergeTemplate:
+    """
+    A docx template compiled into static XML chunks and field slots.
+
+    phrases - {literal text: field name}, for samples without {{fields}};
+    paragraphs - {N: field name}, the N-th non-empty body paragraph is
+    replaced by the field as a whole (formatting of its first run is kept).
+    """
+
+    def __init__(self, source, phrases=None, paragraphs=None):
+        self.phrases = dict(phrases or {})
+        self.paragraphs = dict(paragraphs or {})
+        self.fields = []
+        self.entries = []
+        self.parts = {}
+
+        pattern = _phrase_pattern(self.phrases)
+        with zipfile.ZipFile(source) as zf:
+            for info in zf.infolist():
+                data = zf.read(info)
+                if PART_RE.match(info.filename):
+                    compiled = self._compile_part(data, pattern, info.filename == 'word/document.xml')
+                    if compiled is not None:
+                        self.parts[info.filename] = compiled
+                        data = None
+                self.entries.append((info, data))
+
+    def _slot(self, name):
+        self.fields.append(name)
+        return f'{SLOT_OPEN}{len(self.fields) - 1}{SLOT_CLOSE}'
+
+    def _compile_part(self, data, pattern, is_document):
+        root = etree.fromstring(data)
+        first_slot = len(self.fields)
+
+        whole = {}
+        if is_document and self.paragraphs:
+            body = root.find(W_BODY)
+            number = 0
+            for p in body.iterchildren(W_P):
+                if ''.join(t.text or '' for t in own_texts(p)).strip():
+                    number += 1
+                    if number in self.paragraphs:
+                        whole[p] = self.paragraphs[number]
+
+        for p in root.iter(W_P):
+            if p in whole:
+                self._fill_paragraph(p, whole[p])
+                continue
+            paragraph = ParagraphText(p)
+            spans = []
+            for match in pattern.finditer(paragraph.text):
+                name = match.group(1) or self.phrases[match.group(0)]
+                spans.append((match.start(), match.end(), self._slot(name)))
+            paragraph.replace_spans(spans)
+
+        if len(self.fields) == first_slot:
+            return None
+
+        xml = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True).decode('utf-8')
+        pieces = SLOT_RE.split(xml)
+        # pieces: [xml, slot, xml, slot, ..., xml]
+        return pieces[0::2], [int(slot) for slot in pieces[1::2]]
+
+    def _fill_paragraph(self, p, name):
+        """Whole paragraph becomes one field in its first run"""
+        texts = own_texts(p)
+        first = texts[0]
+        first.text = self._slot(name)
+        first.set(XML_SPACE, 'preserve')
+        first_run = first.getparent()
+        for t in texts[1:]:
+            t.text = ''
+        for r in list(p.iter(W_R)):
+            if r is not first_run and next(r.iterancestors(W_P), None) is p and r.find(W_T) is not None:
+                r.getparent().remove(r)
+
+    def missing(self, record):
+        """Field names the record has no value for"""
+        return sorted({name for name in self.fields if name not in record})
+
+    def render(self, record, output):
+        """Write the document for one record to a path or a binary file"""
+        missing = self.missing(record)
+        if missing:
+            raise KeyError(f"У записі немає полів: {', '.join(missing)}")
+        values = [escape(str(record[name])).replace('\n', LINE_BREAK) for name in self.fields]
+
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for info, data in self.entries:
+                if data is None:
+                    chunks, slots = self.parts[info.filename]
+                    pieces = [chunks[0]]
+                    for slot, chunk in zip(slots, chunks[1:]):
+                        pieces.append(values[slot])
+                        pieces.append(chunk)
+                    data = ''.join(pieces).encode('utf-8')
+                zf.writestr(info, data)
+        return output
+
+
+def load_roster(path):
+    """Records from a CSV (header row = field names) or a JSON list of objects"""
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+_worker_template = None
+
+
+def _init_worker(template):
+    global _worker_template
+    _worker_template = template
+
+
+def _render_one(job):
+    record, output = job
+    return _worker_template.render(record, output)
+
+
+def render_roster(template, records, output_dir, name_pattern, workers=None):
+    """
+    Render one document per record into output_dir.
+
+    name_pattern is formatted with the record, e.g. 'ВІДГУК_{surname}.docx'.
+    The compiled template is sent to every worker process once.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(record, os.path.join(output_dir, name_pattern.format(**record))) for record in records]
+
+    if workers == 1 or len(jobs) < 2:
+        return [template.render(record, output) for record, output in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(template,)) as pool:
+        return list(pool.map(_render_one, jobs, chunksize=max(1, len(jobs) // 32)))
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Render documents from a docx template and a roster')
+    parser.add_argument('template')
+    parser.add_argument('roster', help='CSV or JSON list of records')
+    parser.add_argument('-o', '--output-dir', default='.')
+    parser.add_argument('--name', default='{surname}.docx', help='file name pattern')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    template = MergeTemplate(args.template)
+    records = load_roster(args.roster)
+    print(f"Шаблон: {len(template.fields)} полів ({', '.join(sorted(set(template.fields)))})")
+
+    paths = render_roster(template, records, args.output_dir, args.name, args.jobs)
+    elapsed = time.perf_counter() - start
+    for path in paths:
+        print(f"  {path}")
+    print(f"\nСтворено документів: {len(paths)} за {elapsed:.2f} с")
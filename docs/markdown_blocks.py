@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Однопрохідний токенізатор Markdown.
+
+tokenize_blocks() читає рядки один раз і повертає блоки: heading,
+paragraph, list_item (з рівнем вкладеності), code, table, quote, rule.
+tokenize_inline() розбиває текст блоку на фрагменти з форматуванням
+(bold / italic / code) одним проходом регулярного виразу.
+"""
+
+import re
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+FENCE_RE = re.compile(r'^\s*(```|~~~)\s*([\w+-]*)')
+RULE_RE = re.compile(r'^\s*([-*_─])(\s*\1){2,}\s*$')
+LIST_RE = re.compile(r'^(\s*)([-*+•]|\d+[.)])\s+(.*)$')
+
+INLINE_RE = re.compile(
+    r'\\(?P<escaped>[\\`*_{}\[\]()#+\-.!|])'
+    r'|(?P<ticks>`+)(?P<code>.+?)(?P=ticks)'
+    r'|\*\*(?P<bold>.+?)\*\*'
+    r'|__(?P<bold2>.+?)__'
+    r'|\*(?P<italic>[^\s*](?:.*?[^\s])?)\*'
+    r'|(?<!\w)_(?P<italic2>[^\s_](?:.*?[^\s])?)_(?!\w)'
+    r'|\[(?P<link>[^\]]+)\]\((?P<url>[^)\s]+)\)'
+)
+
+
+def is_table_separator(line):
+    """True for '|---|:---:|' style separator rows"""
+    return ('-' in line or '─' in line) and not line.strip(' |:-─')
+
+
+def split_table_row(line):
+    """Cells of a '| a | b |' table row"""
+    row = line.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', row)]
+
+
+def tokenize_blocks(lines):
+    """Yield block dicts for an iterable of Markdown lines"""
+    code = None            # відкритий блок коду
+    table = None           # рядки таблиці, що накопичуються
+    pending = None         # абзац або пункт списку, до якого дописуються рядки
+    list_indents = []      # відступи відкритих рівнів списку
+
+    def flush():
+        nonlocal table, pending
+        blocks = []
+        if pending is not None:
+            blocks.append(pending)
+            pending = None
+        if table is not None:
+            # Таблиця лише з рядка-роздільника не має заголовка - блоку немає
+            if table:
+                header, *rows = table
+                blocks.append({'type': 'table', 'header': header, 'rows': rows})
+            table = None
+        return blocks
+
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        stripped = line.strip()
+
+        if code is not None:
+            if FENCE_RE.match(line) and stripped.strip('`~') == '':
+                yield code
+                code = None
+            else:
+                code['lines'].append(line)
+            continue
+
+        fence = FENCE_RE.match(line)
+        if fence:
+            yield from flush()
+            list_indents = []
+            code = {'type': 'code', 'lang': fence.group(2), 'lines': []}
+            continue
+
+        if not stripped:
+            yield from flush()
+            continue
+
+        if stripped.startswith('|'):
+            if table is None:
+                yield from flush()
+                table = []
+            if not is_table_separator(stripped):
+                table.append(split_table_row(stripped))
+            continue
+        if table is not None:
+            yield from flush()
+
+        heading = HEADING_RE.match(stripped)
+        if heading:
+            yield from flush()
+            list_indents = []
+            yield {'type': 'heading', 'level': len(heading.group(1)), 'text': heading.group(2)}
+            continue
+
+        if RULE_RE.match(stripped):
+            yield from flush()
+            list_indents = []
+            yield {'type': 'rule'}
+            continue
+
+        item = LIST_RE.match(line.expandtabs(4))
+        if item:
+            yield from flush()
+            indent = len(item.group(1))
+            while list_indents and indent < list_indents[-1]:
+                list_indents.pop()
+            if not list_indents or indent > list_indents[-1]:
+                list_indents.append(indent)
+            pending = {
+                'type': 'list_item',
+                'ordered': item.group(2)[0].isdigit(),
+                'level': len(list_indents) - 1,
+                'text': item.group(3),
+            }
+            continue
+
+        if stripped.startswith('>'):
+            text = stripped.lstrip('>').strip()
+            if pending is not None and pending['type'] == 'quote':
+                pending['text'] += ' ' + text
+            else:
+                yield from flush()
+                pending = {'type': 'quote', 'text': text}
+            continue
+
+        # Продовження абзацу або пункту списку
+        if pending is not None and pending['type'] in ('paragraph', 'list_item'):
+            pending['text'] += ' ' + stripped
+            continue
+
+        yield from flush()
+        list_indents = []
+        pending = {'type': 'paragraph', 'text': stripped}
+
+    yield from flush()
+    if code is not None:
+        yield code
+
+
+def tokenize_inline(text, bold=False, italic=False):
+    """Return [(text, {'bold', 'italic', 'code'})] fragments of inline Markdown"""
+    fragments = []
+    position = 0
+
+    def plain(chunk):
+        if not chunk:
+            return
+        # Сусідні фрагменти з однаковим форматуванням зливаємо в один
+        if fragments and not fragments[-1][1]['code'] and fragments[-1][1]['bold'] == bold \
+                and fragments[-1][1]['italic'] == italic:
+            fragments[-1] = (fragments[-1][0] + chunk, fragments[-1][1])
+        else:
+            fragments.append((chunk, {'bold': bold, 'italic': italic, 'code': False}))
+
+    for match in INLINE_RE.finditer(text):
+        plain(text[position:match.start()])
+        position = match.end()
+
+        groups = match.groupdict()
+        if groups['escaped'] is not None:
+            plain(groups['escaped'])
+        elif groups['code'] is not None:
+            fragments.append((groups['code'].strip(), {'bold': bold, 'italic': italic, 'code': True}))
+        elif groups['bold'] is not None or groups['bold2'] is not None:
+            fragments.extend(tokenize_inline(groups['bold'] or groups['bold2'], True, italic))
+        elif groups['italic'] is not None or groups['italic2'] is not None:
+            fragments.extend(tokenize_inline(groups['italic'] or groups['italic2'], bold, True))
+        else:
+            fragments.extend(tokenize_inline(groups['link'], bold, italic))
+
+    plain(text[position:])
+    return fragments
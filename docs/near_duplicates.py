@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пошук майже однакових абзаців у роботі, Markdown-документації та скриптах.
+
+Кожен абзац (абзац docx, блок Markdown або довгий рядковий літерал у .py,
+наприклад описи рисунків у update_docx.py / fix_all_v2.py) розбивається на
+шинґли - по SHINGLE_SIZE нормалізованих слів. MinHash-сигнатури рахуються
+векторизовано для всіх абзаців документа одразу (NumPy), а LSH з розбиттям
+сигнатури на смуги знаходить пари-кандидати без порівняння всіх з усіма.
+Кандидати перевіряються точним коефіцієнтом Жаккара. Сигнатури кешуються
+за хешем кожного документа.
+
+Використання:
+    python near_duplicates.py [джерела ...] [-t 0.6] [--cross-only] [-n 50]
+"""
+
+from docx import Document
+import argparse
+import ast
+import glob
+import json
+import os
+import sys
+import zlib
+
+import numpy as np
+
+from hashing import file_hash
+from markdown_blocks import tokenize_blocks
+from ukrainian_text import tokenize
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(DOCS_DIR, '.cache', 'minhash')
+
+THESIS_PATH = r"C:\Users\Iurii\Desktop\magister\ФКНТ_2025_121_магістр_Хоменко Ю.Ю..docx"
+DESCRIPTION_SCRIPTS = ['update_docx.py', 'fix_all_v2.py', 'fix_all_final.py', 'update_diagrams_v2.py']
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+MIN_WORDS = 8
+SEED = 1
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+# Скільки шинґлів обробляти за раз (пам'ять: NUM_PERM x BATCH x 8 байт)
+BATCH = 16384
+
+
+# --- Абзаци джерел ---
+
+def docx_paragraphs(path):
+    return [para.text.strip() for para in Document(path).paragraphs if para.text.strip()]
+
+
+def markdown_paragraphs(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [block['text'] for block in tokenize_blocks(f) if block.get('text', '').strip()]
+
+
+def python_paragraphs(path):
+    """Long string literals of a script (figure descriptions, conclusions, ...)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    texts = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            texts.extend(part.strip() for part in node.value.split('\n\n') if part.strip())
+    return texts
+
+
+READERS = {'.docx': docx_paragraphs, '.md': markdown_paragraphs, '.py': python_paragraphs}
+
+
+def default_sources():
+    sources = [THESIS_PATH] if os.path.exists(THESIS_PATH) else []
+    sources += sorted(glob.glob(os.path.join(DOCS_DIR, '*.md')))
+    sources += [os.path.join(DOCS_DIR, name) for name in DESCRIPTION_SCRIPTS]
+    return [path for path in sources if os.path.exists(path)]
+
+
+# --- MinHash ---
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set of 32-bit hashes of word n-grams (stable across runs)"""
+    words = tokenize(text, stemming=True, stopwords=False)
+    if len(words) < size:
+        return {zlib.crc32(' '.join(words).encode('utf-8'))} if words else set()
+    return {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8'))
+            for i in range(len(words) - size + 1)}
+
+
+def permutations(num_perm=NUM_PERM, seed=SEED):
+    """(a, b) coefficients of the universal hashes (a*x + b) mod p"""
+    generator = np.random.RandomState(seed)
+    a = generator.randint(1, MAX_HASH, size=num_perm, dtype=np.uint64)
+    b = generator.randint(0, MAX_HASH, size=num_perm, dtype=np.uint64)
+    return a[:, None], b[:, None]
+
+
+def minhash_signatures(shingle_sets, num_perm=NUM_PERM, seed=SEED):
+    """
+    Signatures for many shingle sets at once: uint32 array (sets x num_perm).
+
+    All shingles are concatenated into one vector; each permutation is applied
+    to the whole vector and the per-set minimum is taken with minimum.reduceat.
+    """
+    signatures = np.full((len(shingle_sets), num_perm), MAX_HASH, dtype=np.uint64)
+    lengths = np.array([len(s) for s in shingle_sets], dtype=np.int64)
+    if not lengths.sum():
+        return signatures.astype(np.uint32)
+
+    values = np.fromiter((h for s in shingle_sets for h in s), dtype=np.uint64, count=int(lengths.sum()))
+    owners = np.repeat(np.arange(len(shingle_sets)), lengths)
+    a, b = permutations(num_perm, seed)
+
+    for start in range(0, len(values), BATCH):
+        chunk = values[start:start + BATCH]
+        chunk_owners = owners[start:start + BATCH]
+        # a, x < 2^32, тож a*x + b вміщується в uint64 без переповнення
+        hashed = ((a * chunk + b) % MERSENNE_PRIME) & MAX_HASH
+        boundaries = np.flatnonzero(np.r_[True, chunk_owners[1:] != chunk_owners[:-1]])
+        minima = np.minimum.reduceat(hashed, boundaries, axis=1)
+        rows = chunk_owners[boundaries]
+        signatures[rows] = np.minimum(signatures[rows], minima.T)
+    return signatures.astype(np.uint32)
+
+
+def load_document(path, num_perm=NUM_PERM, cache_dir=CACHE_DIR):
+    """(paragraphs, signatures) of one source, cached by its hash"""
+    key = f"{file_hash(path)}-{num_perm}-{SHINGLE_SIZE}-{SEED}"
+    entry = os.path.join(cache_dir, key)
+    if os.path.exists(entry + '.npy') and os.path.exists(entry + '.json'):
+        with open(entry + '.json', 'r', encoding='utf-8') as f:
+            paragraphs = json.load(f)
+        return paragraphs, np.load(entry + '.npy')
+
+    reader = READERS[os.path.splitext(path)[1].lower()]
+    paragraphs = [text for text in reader(path) if len(text.split()) >= MIN_WORDS]
+    signatures = minhash_signatures([shingles(text) for text in paragraphs], num_perm)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(entry + '.npy', signatures)
+    with open(entry + '.json', 'w', encoding='utf-8') as f:
+        json.dump(paragraphs, f, ensure_ascii=False)
+    return paragraphs, signatures
+
+
+# --- LSH ---
+
+def _false_rates(threshold, bands, rows):
+    """Approximate false positive / negative areas of the S-curve"""
+    steps = 100
+    xs = np.linspace(0, 1, steps + 1)
+    probability = 1 - (1 - xs ** rows) ** bands
+    below = xs <= threshold
+    false_positive = probability[below].sum() / steps
+    false_negative = (1 - probability[~below]).sum() / steps
+    return false_positive, false_negative
+
+
+def choose_bands(threshold, num_perm=NUM_PERM):
+    """(bands, rows) with bands * rows <= num_perm minimizing FP + FN at threshold"""
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        false_positive, false_negative = _false_rates(threshold, bands, rows)
+        error = false_positive + false_negative
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def candidate_pairs(signatures, bands, rows):
+    """Row index pairs that share at least one band bucket"""
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        for index in range(len(block)):
+            buckets.setdefault(block[index].tobytes(), []).append(index)
+        for members in buckets.values():
+            if len(members) > 1:
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        pairs.add((first, second))
+    return pairs
+
+
+def jaccard(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def find_duplicates(sources, threshold=0.6, cross_only=False, num_perm=NUM_PERM, cache_dir=CACHE_DIR):
+    """
+    Near-duplicate paragraph pairs across sources.
+
+    Returns [(similarity, (source, index, text), (source, index, text))]
+    sorted by similarity; with cross_only pairs inside one source are skipped.
+    """
+    owners = []
+    texts = []
+    blocks = []
+    for path in sources:
+        paragraphs, signatures = load_document(path, num_perm, cache_dir)
+        owners.extend((path, index) for index in range(len(paragraphs)))
+        texts.extend(paragraphs)
+        blocks.append(signatures)
+    if not texts:
+        return []
+
+    signatures = np.vstack(blocks)
+    bands, rows = choose_bands(threshold, num_perm)
+
+    # Шинґли потрібні лише для перевірки кандидатів
+    sets = {}
+
+    def shingle_set(index):
+        if index not in sets:
+            sets[index] = shingles(texts[index])
+        return sets[index]
+
+    result = []
+    for first, second in candidate_pairs(signatures, bands, rows):
+        if cross_only and owners[first][0] == owners[second][0]:
+            continue
+        similarity = jaccard(shingle_set(first), shingle_set(second))
+        if similarity >= threshold:
+            result.append((
+                similarity,
+                (*owners[first], texts[first]),
+                (*owners[second], texts[second]),
+            ))
+    result.sort(key=lambda item: -item[0])
+    return result
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Find near-duplicate paragraphs with MinHash-LSH')
+    parser.add_argument('sources', nargs='*', help='docx / md / py files (thesis, docs/*.md and description scripts by default)')
+    parser.add_argument('-t', '--threshold', type=float, default=0.6, help='Jaccard similarity threshold')
+    parser.add_argument('--cross-only', action='store_true', help='only pairs from different files')
+    parser.add_argument('-n', '--limit', type=int, default=50, help='pairs to print')
+    args = parser.parse_args()
+
+    sources = args.sources or default_sources()
+    pairs = find_duplicates(sources, args.threshold, args.cross_only)
+
+    print(f"=== МАЙЖЕ ОДНАКОВІ АБЗАЦИ: {len(pairs)} пар (поріг {args.threshold}) ===\n")
+    for similarity, (path_a, index_a, text_a), (path_b, index_b, text_b) in pairs[:args.limit]:
+        print(f"{similarity:.2f}  {os.path.basename(path_a)}[{index_a}] ~ {os.path.basename(path_b)}[{index_b}]")
+        print(f"      {text_a[:90]}")
+        print(f"      {text_b[:90]}\n")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потокове читання тексту та структури .pptx.
+
+Замість завантаження всієї Presentation кожен ppt/slides/slideN.xml
+читається через iterparse у порядку sldIdLst, а для кожної фігури
+повертається запис: номер слайда, тип фігури, індекс плейсхолдера, текст і
+посилання на зображення. Оброблені елементи одразу звільняються, тому
+пам'ять не залежить від розміру презентації.
+"""
+
+from lxml import etree
+import posixpath
+import sys
+import zipfile
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+A = '{%s}' % NS['a']
+P = '{%s}' % NS['p']
+R = '{%s}' % NS['r']
+
+# Елементи, що відповідають окремим фігурам слайда
+SHAPE_TAGS = {
+    P + 'sp': 'shape',
+    P + 'pic': 'picture',
+    P + 'graphicFrame': 'graphic_frame',
+    P + 'cxnSp': 'connector',
+}
+
+
+def _read_rels(zf, part_name):
+    """Return rId -> absolute part name for a part's relationships"""
+    base, name = posixpath.split(part_name)
+    rels_name = posixpath.join(base, '_rels', name + '.rels')
+    try:
+        root = etree.fromstring(zf.read(rels_name))
+    except KeyError:
+        return {}
+
+    rels = {}
+    for rel in root.iterfind('rel:Relationship', NS):
+        target = rel.get('Target')
+        if rel.get('TargetMode') == 'External':
+            rels[rel.get('Id')] = target
+        else:
+            rels[rel.get('Id')] = posixpath.normpath(posixpath.join(base, target))
+    return rels
+
+
+def slide_parts(zf):
+    """Slide part names in presentation order"""
+    presentation = 'ppt/presentation.xml'
+    rels = _read_rels(zf, presentation)
+    root = etree.fromstring(zf.read(presentation))
+    return [rels[sld.get(R + 'id')] for sld in root.iterfind('p:sldIdLst/p:sldId', NS)]
+
+
+def _iter_slide(zf, slide_number, part_name):
+    """Yield shape records of one slide part"""
+    rels = None
+    stack = []
+    groups = 0
+
+    with zf.open(part_name) as f:
+        for event, elem in etree.iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                if tag == P + 'grpSp':
+                    groups += 1
+                elif tag in SHAPE_TAGS:
+                    stack.append({
+                        'slide': slide_number,
+                        'shape_type': SHAPE_TAGS[tag],
+                        'grouped': groups > 0,
+                        'shape_id': None,
+                        'name': None,
+                        'placeholder_idx': None,
+                        'placeholder_type': None,
+                        'paragraphs': [],
+                        'line': [],
+                        'images': [],
+                    })
+                elif stack:
+                    shape = stack[-1]
+                    if tag == P + 'cNvPr' and shape['shape_id'] is None:
+                        shape['shape_id'] = int(elem.get('id', 0))
+                        shape['name'] = elem.get('name')
+                    elif tag == P + 'ph':
+                        # idx відсутній у title-плейсхолдерів - це idx 0
+                        shape['placeholder_idx'] = int(elem.get('idx', 0))
+                        shape['placeholder_type'] = elem.get('type', 'body')
+                continue
+
+            if tag == P + 'grpSp':
+                groups -= 1
+            elif stack:
+                shape = stack[-1]
+                if tag == A + 't':
+                    shape['line'].append(elem.text or '')
+                elif tag == A + 'br':
+                    shape['line'].append('\v')
+                elif tag == A + 'p':
+                    shape['paragraphs'].append(''.join(shape['line']))
+                    shape['line'] = []
+                elif tag == A + 'blip':
+                    rId = elem.get(R + 'embed') or elem.get(R + 'link')
+                    if rId:
+                        if rels is None:
+                            rels = _read_rels(zf, part_name)
+                        shape['images'].append(rels.get(rId, rId))
+                elif tag in SHAPE_TAGS:
+                    stack.pop()
+                    shape.pop('line')
+                    shape['text'] = '\n'.join(shape.pop('paragraphs'))
+                    yield shape
+
+            # Звільняємо оброблені фігури та їхніх попередніх сусідів
+            if event == 'end' and not stack and (tag in SHAPE_TAGS or tag == P + 'grpSp'):
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+
+def iter_presentation(pptx_path):
+    """
+    Yield one dict per shape of the presentation, slide by slide.
+
+    Keys: slide, shape_type, shape_id, name, placeholder_idx,
+    placeholder_type, grouped, text, images (part names of embedded pictures).
+    Unlike slide.shapes in python-pptx, shapes inside groups are included
+    (grouped=True) and graphic frames carry the text of their tables.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        for slide_number, part_name in enumerate(slide_parts(zf), 1):
+            yield from _iter_slide(zf, slide_number, part_name)
+
+
+def count_slides(pptx_path):
+    """Number of slides without parsing slide parts"""
+    with zipfile.ZipFile(pptx_path) as zf:
+        return len(slide_parts(zf))
+
+
+def iter_slide_texts(pptx_path):
+    """
+    Yield (slide_number, [non-empty shape texts]) per slide, including empty slides.
+
+    Same scope as shape.text over slide.shapes: top-level text shapes only,
+    without groups, tables and connectors.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        for slide_number, part_name in enumerate(slide_parts(zf), 1):
+            texts = [shape['text'] for shape in _iter_slide(zf, slide_number, part_name)
+                     if shape['shape_type'] == 'shape' and not shape['grouped'] and shape['text'].strip()]
+            yield slide_number, texts
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    paths = sys.argv[1:] or [r"C:\Users\Iurii\Desktop\magister\дп_Презентація.pptx"]
+
+    for pptx_path in paths:
+        print(f"=== {pptx_path} ===")
+        for shape in iter_presentation(pptx_path):
+            ph = f" ph={shape['placeholder_idx']}" if shape['placeholder_idx'] is not None else ""
+            text = shape['text'].strip().replace('\n', ' / ')[:100]
+            images = f" images={shape['images']}" if shape['images'] else ""
+            print(f"[{shape['slide']}] {shape['shape_type']}{ph}: {text}{images}")
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Профілювання етапів скриптів обробки роботи.
+
+Коли fix_all_final.py чи create_complete_presentation.py працюють
+повільно, print не показує, куди йде час: на читання zip, розбір XML,
+перебудову doc.paragraphs, регулярні вирази чи збереження. Тут кожен етап
+(контекстний менеджер stage(), декоратор profiled() або послідовні кроки
+step() у скриптах без функцій) записує час wall і CPU, кількість викликів,
+пік пам'яті tracemalloc і лічильники (абзаци, run, виклики регулярних
+виразів). З instrument() автоматично стають етапами відкриття і
+збереження docx / pptx, читання і запис zip, розбір і серіалізація XML та
+кожна перебудова doc.paragraphs.
+
+Результат - JSON з деревом етапів і файл .folded зі згорнутими стеками
+(власний час у мікросекундах) для flamegraph.pl / speedscope.
+
+Профілювання вмикається змінною середовища DOCS_PROFILE=шлях.json (пам'ять -
+DOCS_PROFILE_MEMORY=1) до імпорту модулів або запуском скрипта через цей
+модуль. Вимкнене профілювання нічого не вимірює: profiled() повертає саму
+функцію, stage() і step() - спільний порожній об'єкт, count() - порожня
+функція.
+
+Використання:
+    python profiling.py [--memory] [-o profile.json] скрипт.py [аргументи ...]
+"""
+
+from collections import defaultdict
+import atexit
+import functools
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+ENV_OUTPUT = 'DOCS_PROFILE'
+ENV_MEMORY = 'DOCS_PROFILE_MEMORY'
+ROOT = 'main'
+
+# Функції модуля re, виклики яких рахуються після instrument()
+REGEX_FUNCTIONS = ('match', 'fullmatch', 'search', 'sub', 'subn', 'split', 'findall', 'finditer')
+
+
+class _Node:
+    __slots__ = ('calls', 'wall', 'cpu', 'child_wall', 'child_cpu', 'peak', 'counters')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.peak = 0
+        self.counters = defaultdict(int)
+
+
+class _Frame:
+    __slots__ = ('name', 'path', 'wall', 'cpu', 'memory', 'peak', 'step')
+
+    def __init__(self, name, path, step=False):
+        self.name = name
+        self.path = path
+        self.step = step
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.memory = 0
+        self.peak = 0
+
+
+class Profiler:
+    """Tree of stages keyed by their stack path with times, memory peaks and counters"""
+
+    def __init__(self, output=None, memory=False):
+        self.output = output
+        self.memory = memory
+        self.nodes = defaultdict(_Node)
+        self.counters = defaultdict(int)
+        self.stack = [_Frame(ROOT, (ROOT,))]
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def enter(self, name, step=False):
+        frame = _Frame(name, self.stack[-1].path + (name,), step)
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Пік, досягнутий до цього етапу, належить батьківському
+            parent = self.stack[-1]
+            parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+            frame.memory = current
+        self.stack.append(frame)
+
+    def exit(self):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        frame = self.stack.pop()
+        node = self.nodes[frame.path]
+        node.calls += 1
+        elapsed = wall - frame.wall
+        spent = cpu - frame.cpu
+        node.wall += elapsed
+        node.cpu += spent
+        parent = self.stack[-1]
+        self.nodes[parent.path].child_wall += elapsed
+        self.nodes[parent.path].child_cpu += spent
+        if self.memory:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(frame.peak, peak)
+            node.peak = max(node.peak, peak - frame.memory)
+            parent.peak = max(parent.peak, peak)
+
+    def step(self, name):
+        """Close the current step (if it is the innermost stage) and start the next one"""
+        if self.stack[-1].step:
+            self.exit()
+        self.enter(name, step=True)
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+        self.nodes[self.stack[-1].path].counters[name] += n
+
+    def finish(self):
+        """Close open stages and the root; returns the report"""
+        while len(self.stack) > 1:
+            self.exit()
+        root = self.stack[0]
+        node = self.nodes[root.path]
+        node.calls = 1
+        node.wall = time.perf_counter() - root.wall
+        node.cpu = time.process_time() - root.cpu
+        if self.memory:
+            node.peak = max(root.peak, tracemalloc.get_traced_memory()[1])
+        return self.report()
+
+    def report(self):
+        stages = []
+        for path, node in sorted(self.nodes.items()):
+            stages.append({
+                'stage': ';'.join(path),
+                'calls': node.calls,
+                'wall': round(node.wall, 6),
+                'cpu': round(node.cpu, 6),
+                'self_wall': round(max(0.0, node.wall - node.child_wall), 6),
+                'self_cpu': round(max(0.0, node.cpu - node.child_cpu), 6),
+                'memory_peak': node.peak if self.memory else None,
+                'counters': dict(node.counters),
+            })
+        return {'argv': sys.argv, 'memory': self.memory, 'counters': dict(self.counters), 'stages': stages}
+
+    def collapsed(self):
+        """Collapsed stacks (stack;frames self-microseconds) for flamegraph tools"""
+        lines = []
+        for path, node in sorted(self.nodes.items()):
+            micros = int(max(0.0, node.wall - node.child_wall) * 1e6)
+            if micros:
+                lines.append(f"{';'.join(name.replace(';', ',').replace(' ', '_') for name in path)} {micros}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, output=None):
+        output = output or self.output
+        report = self.finish()
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(os.path.splitext(output)[0] + '.folded', 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        return report
+
+
+_profiler = None
+
+
+class _NullStage:
+    """Shared no-op stand-in for stage() when profiling is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _profiler.enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        _profiler.exit()
+        return False
+
+
+def enabled():
+    return _profiler is not None
+
+
+def stage(name):
+    """Context manager timing one stage (a no-op object when disabled)"""
+    return _Stage(name) if _profiler is not None else _NULL_STAGE
+
+
+def step(name):
+    """Start the next sequential step of a script (ends the previous one)"""
+    if _profiler is not None:
+        _profiler.step(name)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+def _count(name, n=1):
+    _profiler.count(name, n)
+
+
+count = _noop
+
+
+def profiled(name=None):
+    """Decorator timing every call as a stage; returns the function itself when disabled"""
+    def decorate(function):
+        if _profiler is None:
+            return function
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            _profiler.enter(label)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _profiler.exit()
+        return wrapper
+    return decorate
+
+
+def enable(output=None, memory=False):
+    """Start profiling; the report is written to output at exit (if given)"""
+    global _profiler, count
+    if _profiler is not None:
+        return _profiler
+    _profiler = Profiler(output, memory)
+    count = _count
+    # Модулі, що вже зробили from profiling import count, отримують робочу функцію
+    for module in list(sys.modules.values()):
+        if getattr(module, 'count', None) is _noop:
+            module.count = _count
+    if output:
+        atexit.register(_profiler.write)
+    return _profiler
+
+
+# --- Автоматичні етапи бібліотек ---
+
+def _wrap_stage(function, label, counter=None, measure=None):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        _profiler.enter(label)
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _profiler.exit()
+        if counter:
+            _profiler.count(counter, measure(result) if measure else 1)
+        return result
+    wrapper.__profiling_original__ = function
+    return wrapper
+
+
+def _replace_everywhere(prefixes, original, replacement):
+    """Rebind original to replacement in every loaded module of the given packages"""
+    for name, module in list(sys.modules.items()):
+        if module is None or not name.startswith(prefixes):
+            continue
+        for attribute, value in list(vars(module).items()):
+            if value is original:
+                setattr(module, attribute, replacement)
+
+
+def instrument():
+    """Turn docx/pptx I/O, XML parsing, doc.paragraphs and re calls into stages and counters"""
+    if _profiler is None or getattr(instrument, 'done', False):
+        return
+    instrument.done = True
+
+    for function in REGEX_FUNCTIONS:
+        original = getattr(re, function)
+        setattr(re, function, _wrap_stage(original, f're.{function}', 'regex'))
+
+    try:
+        import docx
+        import docx.api
+        import docx.document
+        import docx.opc.oxml
+        import docx.opc.phys_pkg
+        import docx.oxml.parser
+        import docx.text.paragraph
+    except ImportError:
+        pass
+    else:
+        _replace_everywhere(('docx',), docx.api.Document, _wrap_stage(docx.api.Document, 'docx.open'))
+        for original, label in ((docx.oxml.parser.parse_xml, 'xml.parse'), (docx.opc.oxml.parse_xml, 'xml.parse'),
+                                (docx.opc.oxml.serialize_part_xml, 'xml.serialize')):
+            _replace_everywhere(('docx',), original, _wrap_stage(original, label))
+        reader = docx.opc.phys_pkg._ZipPkgReader
+        reader.blob_for = _wrap_stage(reader.blob_for, 'zip.read')
+        writer = docx.opc.phys_pkg._ZipPkgWriter
+        writer.write = _wrap_stage(writer.write, 'zip.write')
+        document = docx.document.Document
+        document.save = _wrap_stage(document.save, 'docx.save')
+        document.paragraphs = property(_wrap_stage(document.paragraphs.fget, 'doc.paragraphs', 'paragraphs', len))
+        paragraph = docx.text.paragraph.Paragraph
+        runs = paragraph.runs.fget
+
+        def counted_runs(self):
+            result = runs(self)
+            _profiler.count('runs', len(result))
+            return result
+        paragraph.runs = property(counted_runs)
+
+    try:
+        import pptx
+        import pptx.api
+        import pptx.presentation
+    except ImportError:
+        pass
+    else:
+        _replace_everywhere(('pptx',), pptx.api.Presentation, _wrap_stage(pptx.api.Presentation, 'pptx.open'))
+        presentation = pptx.presentation.Presentation
+        presentation.save = _wrap_stage(presentation.save, 'pptx.save')
+
+
+def summary(report, limit=20):
+    """Lines of the slowest stages by self time"""
+    stages = sorted(report['stages'], key=lambda s: s['self_wall'], reverse=True)[:limit]
+    lines = [f"{'власний, с':>11} {'усього, с':>10} {'CPU, с':>8} {'викл.':>7}  етап"]
+    for s in stages:
+        lines.append(f"{s['self_wall']:11.3f} {s['wall']:10.3f} {s['cpu']:8.3f} {s['calls']:7}  {s['stage']}")
+    if report['counters']:
+        lines.append('Лічильники: ' + ', '.join(f'{k}={v}' for k, v in sorted(report['counters'].items())))
+    return lines
+
+
+if os.environ.get(ENV_OUTPUT):
+    enable(os.environ[ENV_OUTPUT], memory=os.environ.get(ENV_MEMORY) == '1')
+    instrument()
+
+
+if __name__ == "__main__":
+    import argparse
+    import runpy
+
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Run a docs script with stage profiling')
+    parser.add_argument('-o', '--output', help='report JSON (default: <script>.profile.json)')
+    parser.add_argument('--memory', action='store_true', help='track tracemalloc peaks (slower)')
+    parser.add_argument('script')
+    parser.add_argument('arguments', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    # Скрипт імпортує profiling як звичайний модуль - стан має бути в ньому, а не в __main__
+    import profiling
+
+    output = args.output or os.path.splitext(os.path.basename(args.script))[0] + '.profile.json'
+    profiler = profiling.enable(memory=args.memory)
+    profiling.instrument()
+    sys.argv = [args.script] + args.arguments
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    try:
+        with profiling.stage(os.path.basename(args.script)):
+            runpy.run_path(args.script, run_name='__main__')
+    finally:
+        report = profiler.write(output)
+        print('\n' + '\n'.join(profiling.summary(report)), file=sys.stderr)
+        print(f"Профіль: {output}, {os.path.splitext(output)[0]}.folded", file=sys.stderr)
@@ -1,22 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from docx import Document
 import sys
 
+from pptx_stream import iter_slide_texts
+
 def read_presentation_structure(pptx_path):
-    """Read and print structure of existing presentation"""
+    """Read and print structure of existing presentation, return slide count"""
     print("=== СТРУКТУРА ІСНУЮЧОЇ ПРЕЗЕНТАЦІЇ ===\n")
-    prs = Presentation(pptx_path)
 
-    for i, slide in enumerate(prs.slides, 1):
+    slide_count = 0
+    for i, texts in iter_slide_texts(pptx_path):
+        slide_count = i
         print(f"\n--- Слайд {i} ---")
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                print(f"  {shape.text[:100]}")
+        for text in texts:
+            print(f"  {text[:100]}")
 
-    return prs
+    return slide_count
 
 def read_thesis_document(docx_path):
     """Read thesis document"""
@@ -44,8 +45,8 @@ if __name__ == "__main__":
     docx_path = r"C:\Users\Iurii\Desktop\magister\ФКНТ_2025_121_магістр_Хоменко Ю.Ю..docx"
 
     try:
-        prs = read_presentation_structure(pptx_path)
-        print(f"\n\nВсього слайдів: {len(prs.slides)}")
+        slide_count = read_presentation_structure(pptx_path)
+        print(f"\n\nВсього слайдів: {slide_count}")
 
         content = read_thesis_document(docx_path)
         print(f"\n\nВсього розділів: {len(content)}")
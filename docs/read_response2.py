@@ -4,6 +4,8 @@ sys.stdout.reconfigure(encoding='utf-8')
 
 from docx import Document
 
+from docx_tables import iter_tables
+
 # Читаємо зразок відгуку
 doc = Document(r'C:\magister_work\docs\response\Відгук_Зразок (1).docx')
 
@@ -14,10 +16,10 @@ with open('response_content.txt', 'w', encoding='utf-8') as f:
             f.write(para.text + '\n')
 
     # Також читаємо таблиці
-    for table in doc.tables:
+    for grid in iter_tables(doc):
         f.write('\n=== ТАБЛИЦЯ ===\n')
-        for row in table.rows:
-            row_text = ' | '.join([cell.text.strip() for cell in row.cells])
+        for r in range(grid.height):
+            row_text = ' | '.join([text.strip() for text in grid.row_texts(r)])
             if row_text.strip():
                 f.write(row_text + '\n')
 
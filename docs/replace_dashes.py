@@ -1,6 +1,9 @@
 from docx import Document
 import re
 
+from docx_tables import iter_tables
+from run_coalescer import coalesce_document, report
+
 # Шлях до файлів
 input_path = r"C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED3.docx"
 output_path = r"C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx"
@@ -8,6 +11,9 @@ output_path = r"C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬ
 # Завантажуємо документ
 doc = Document(input_path)
 
+# Зливаємо дрібні run з однаковим форматуванням - тире рідше розрізані між run
+print(report(*coalesce_document(doc)))
+
 # Довгі тире та їх варіанти
 long_dashes = [
     '\u2014',  # Em dash (—)
@@ -35,20 +41,20 @@ for para in doc.paragraphs:
             run.text = new_text
 
 # Заміна в таблицях
-for table in doc.tables:
-    for row in table.rows:
-        for cell in row.cells:
-            for para in cell.paragraphs:
-                for run in para.runs:
-                    original_text = run.text
-                    new_text = original_text
-                    for dash in long_dashes:
-                        if dash in new_text:
-                            count = new_text.count(dash)
-                            replaced_count += count
-                            new_text = new_text.replace(dash, hyphen)
-                    if new_text != original_text:
-                        run.text = new_text
+# (кожна об'єднана клітинка обробляється один раз)
+for grid in iter_tables(doc):
+    for cell in grid.cell_objects():
+        for para in cell.paragraphs:
+            for run in para.runs:
+                original_text = run.text
+                new_text = original_text
+                for dash in long_dashes:
+                    if dash in new_text:
+                        count = new_text.count(dash)
+                        replaced_count += count
+                        new_text = new_text.replace(dash, hyphen)
+                if new_text != original_text:
+                    run.text = new_text
 
 # Заміна в headers та footers
 for section in doc.sections:
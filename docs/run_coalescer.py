@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Нормалізація run у документі Word: злиття сусідніх run з однаковим
+форматуванням.
+
+Після редагування у Word текст абзацу розсипається на дрібні run, які
+відрізняються лише службовими позначками: rsid-атрибутами (сесія
+редагування), w:proofErr (межі орфографічних помилок) і
+w:lastRenderedPageBreak (де Word востаннє розірвав сторінку). Прохід
+спочатку прибирає цю розмітку, а потім зливає сусідні run, у яких
+канонічний rPr (style_resolver.signature) однаковий. Зливаються лише
+run із текстом, табуляціями і розривами рядків - поля, малюнки, виноски
+й закладки лишаються окремими, тож вигляд документа не змінюється.
+
+Подальші проходи по run (replace_dashes.py, fix_dashes_and_captions.py,
+check_remaining_dashes.py) після нормалізації обходять у кілька разів
+менше run, а фрази рідше розрізані між ними.
+
+Використання:
+    python run_coalescer.py документ.docx [-o результат.docx]
+"""
+
+import argparse
+import sys
+import time
+
+from style_resolver import RUN_CONTAINERS, W, W_P, W_R, W_RPR, signature
+
+W_T = W + 't'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Службова розмітка, яка не впливає на вигляд документа
+NOISE_TAGS = {W + 'proofErr', W + 'lastRenderedPageBreak'}
+# Вміст run, який можна переносити в сусідній run без зміни змісту
+MERGEABLE_TAGS = {W_T, W + 'tab', W + 'br', W + 'noBreakHyphen', W + 'softHyphen', W + 'cr'}
+
+
+def strip_noise(root):
+    """Remove proofErr, lastRenderedPageBreak and rsid attributes; return removed elements count"""
+    removed = [e for e in root.iter(*NOISE_TAGS)]
+    for element in removed:
+        parent = element.getparent()
+        # tail у WordprocessingML порожній, але не втрачаємо його
+        if element.tail:
+            previous = element.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or '') + element.tail
+            else:
+                parent.text = (parent.text or '') + element.tail
+        parent.remove(element)
+    for element in root.iter():
+        for name in [name for name in element.attrib if name.startswith(W + 'rsid')]:
+            del element.attrib[name]
+    return len(removed)
+
+
+def _mergeable(r):
+    return all(child.tag in MERGEABLE_TAGS for child in r if child.tag != W_RPR)
+
+
+def _append_content(target, source):
+    """Move the content of run source to the end of run target"""
+    last = target[-1] if len(target) else None
+    for child in list(source):
+        if child.tag == W_RPR:
+            continue
+        if child.tag == W_T and last is not None and last.tag == W_T:
+            last.text = (last.text or '') + (child.text or '')
+            if last.text != last.text.strip():
+                last.set(XML_SPACE, 'preserve')
+            continue
+        target.append(child)
+        last = child
+
+
+def coalesce_container(container):
+    """Merge adjacent equally formatted runs among the children of container; return runs merged"""
+    merged = 0
+    previous = None
+    previous_key = None
+    for child in list(container):
+        if child.tag == W_R and _mergeable(child):
+            key = signature(child.find(W_RPR))
+            if previous is not None and key == previous_key:
+                _append_content(previous, child)
+                container.remove(child)
+                merged += 1
+                continue
+            previous, previous_key = child, key
+        else:
+            previous = None
+            if child.tag in RUN_CONTAINERS:
+                merged += coalesce_container(child)
+    return merged
+
+
+def coalesce(root):
+    """Normalize and merge runs of every paragraph under root; return (runs before, runs after)"""
+    before = sum(1 for _ in root.iter(W_R))
+    strip_noise(root)
+    merged = sum(coalesce_container(p) for p in root.iter(W_P))
+    return before, before - merged
+
+
+def document_roots(doc):
+    """XML roots of the body, headers, footers and notes of a python-docx Document"""
+    roots = [doc.element]
+    for rel in doc.part.rels.values():
+        if rel.is_external:
+            continue
+        element = getattr(rel.target_part, 'element', None)
+        if element is not None and rel.reltype.rsplit('/', 1)[-1] in ('header', 'footer', 'footnotes', 'endnotes'):
+            roots.append(element)
+    return roots
+
+
+def coalesce_document(doc):
+    """Coalesce runs in the whole document; return (runs before, runs after)"""
+    before = after = 0
+    for root in document_roots(doc):
+        root_before, root_after = coalesce(root)
+        before += root_before
+        after += root_after
+    return before, after
+
+
+def report(before, after):
+    ratio = before / after if after else 1
+    return f"Run: {before} -> {after} (у {ratio:.1f} раза менше)"
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    from docx import Document
+
+    parser = argparse.ArgumentParser(description='Merge adjacent runs with identical formatting')
+    parser.add_argument('docx')
+    parser.add_argument('-o', '--output', help='output path (the input is overwritten by default)')
+    args = parser.parse_args()
+
+    doc = Document(args.docx)
+    start = time.perf_counter()
+    before, after = coalesce_document(doc)
+    print(f"{report(before, after)} за {time.perf_counter() - start:.3f} с")
+    output = args.output or args.docx
+    doc.save(output)
+    print(f"Документ збережено: {output}")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пошук і заміна тексту в абзацах docx без втрати форматування.
+
+Word ділить текст абзацу на w:r довільно ('Луцик', ' ', 'О', '.', ...),
+тому para.text = ... або run.text.replace(...) або руйнують форматування,
+або не знаходять фразу. ParagraphText один раз будує карту зміщень
+"текст абзацу -> (w:t, зміщення)" і змінює лише ті w:t, які покриває збіг:
+новий текст отримує форматування run, в якому збіг починається, решта
+run абзацу лишається без змін. Кілька збігів у абзаці застосовуються з
+кінця, тож карта не перебудовується і заміна лінійна за довжиною абзацу.
+
+Табуляції та розриви рядків входять у текст так само, як у Paragraph.text
+(w:tab - '\t', w:br і w:cr - '\n'), і заміна, що їх покриває, їх видаляє;
+'\t' і '\n' у новому тексті записуються як w:tab і w:br. Розриви сторінок
+і колонок у тексті не видно, і вони лишаються на своїх місцях.
+"""
+
+from bisect import bisect_right
+from copy import deepcopy
+from lxml import etree
+import re
+
+import profiling
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_P = f'{{{W_NS}}}p'
+W_R = f'{{{W_NS}}}r'
+W_T = f'{{{W_NS}}}t'
+W_RPR = f'{{{W_NS}}}rPr'
+W_PPR = f'{{{W_NS}}}pPr'
+W_BR = f'{{{W_NS}}}br'
+W_TAB = f'{{{W_NS}}}tab'
+W_PTAB = f'{{{W_NS}}}ptab'
+W_CR = f'{{{W_NS}}}cr'
+W_NO_BREAK_HYPHEN = f'{{{W_NS}}}noBreakHyphen'
+W_TYPE = f'{{{W_NS}}}type'
+
+# Переноси рядків і табуляції в новому тексті стають w:br / w:tab
+SPECIAL_RE = re.compile(r'([\t\n])')
+SPECIAL_TAGS = {'\t': W_TAB, '\n': W_BR}
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+
+# Вміст run, який Paragraph.text показує як символ
+SEGMENT_TEXT = {W_TAB: '\t', W_PTAB: '\t', W_CR: '\n', W_NO_BREAK_HYPHEN: '-'}
+
+
+def own_texts(p):
+    """w:t of a paragraph in order, without text boxes nested inside it"""
+    return [t for t in p.iter(W_T) if next(t.iterancestors(W_P), None) is p]
+
+
+def own_segments(p):
+    """
+    [(element, text)] of a paragraph in order: w:t and the w:tab / w:br / w:cr /
+    w:noBreakHyphen of its runs, as Paragraph.text renders them.
+
+    Page and column breaks have no text and are left out.
+    """
+    segments = []
+    for element in p.iter(W_T, W_TAB, W_PTAB, W_BR, W_CR, W_NO_BREAK_HYPHEN):
+        if next(element.iterancestors(W_P), None) is not p:
+            continue
+        if element.tag == W_T:
+            segments.append((element, element.text or ''))
+        elif element.getparent().tag != W_R:
+            # w:tab у w:pPr/w:tabs - позиція табуляції, а не символ
+            continue
+        elif element.tag == W_BR:
+            if element.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                segments.append((element, '\n'))
+        else:
+            segments.append((element, SEGMENT_TEXT[element.tag]))
+    return segments
+
+
+def paragraph_text(p):
+    """Text of a w:p with tabs and line breaks, like Paragraph.text"""
+    return ''.join(text for _, text in own_segments(p))
+
+
+class ParagraphText:
+    """
+    Editable view of the text of one w:p.
+
+    Accepts a python-docx Paragraph or a bare w:p element (also from a plain
+    lxml tree, e.g. in mail_merge).
+    """
+
+    def __init__(self, paragraph):
+        self.p = getattr(paragraph, '_p', paragraph)
+        self._build()
+
+    def _build(self):
+        self.texts = []
+        self.starts = []
+        parts = []
+        position = 0
+        for element, value in own_segments(self.p):
+            self.texts.append(element)
+            self.starts.append(position)
+            parts.append(value)
+            position += len(value)
+        self.text = ''.join(parts)
+
+    def _replace(self, start, end, new):
+        """Replace text[start:end] using the current offset map (no rebuild)"""
+        if not self.texts:
+            self._add_run(new)
+            return
+
+        index = max(0, bisect_right(self.starts, start) - 1)
+        # Вставка на початку сегмента наслідує форматування попереднього тексту
+        if start == end and index and start == self.starts[index]:
+            index -= 1
+
+        first = self.texts[index]
+        following = index + 1
+        if first.tag == W_T:
+            value = first.text or ''
+            local = start - self.starts[index]
+            local_end = min(len(value), end - self.starts[index])
+            tail = value[local_end:]
+        else:
+            # Табуляція чи розрив - новий текст іде в окремий w:t поруч у тому ж run
+            special = first
+            first = etree.Element(W_T)
+            value = tail = ''
+            local = 0
+            if start > self.starts[index]:
+                special.addnext(first)
+            else:
+                special.addprevious(first)
+                following = index
+        pieces = SPECIAL_RE.split(new)
+        first.text = value[:local] + pieces[0]
+        first.set(XML_SPACE, 'preserve')
+        if len(pieces) > 1:
+            self._insert_special(first, pieces[1:], tail)
+        else:
+            first.text += tail
+        if not first.text:
+            self._drop(first)
+
+        for next_index in range(following, len(self.texts)):
+            t_start = self.starts[next_index]
+            if t_start >= end:
+                break
+            t = self.texts[next_index]
+            if t.tag != W_T:
+                # Табуляція чи розрив цілком усередині заміненого фрагмента
+                self._drop(t)
+                continue
+            value = t.text or ''
+            t.text = value[end - t_start:] if end - t_start < len(value) else ''
+            if not t.text:
+                self._drop(t)
+
+    def _insert_special(self, t, pieces, tail):
+        """After t in its run: w:br / w:tab and w:t for [special, text, special, text, ...]"""
+        anchor = t
+        for index in range(0, len(pieces), 2):
+            special = etree.Element(SPECIAL_TAGS[pieces[index]])
+            anchor.addnext(special)
+            text = etree.Element(W_T)
+            text.text = pieces[index + 1] + (tail if index + 2 >= len(pieces) else '')
+            text.set(XML_SPACE, 'preserve')
+            special.addnext(text)
+            anchor = text
+
+    def _drop(self, t):
+        """Remove an emptied w:t (or a replaced tab / break), and its run when nothing else is left in it"""
+        r = t.getparent()
+        r.remove(t)
+        if r.tag == W_R and all(child.tag == W_RPR for child in r):
+            r.getparent().remove(r)
+
+    def _add_run(self, text):
+        """First run of an empty paragraph; takes the paragraph mark formatting"""
+        r = etree.SubElement(self.p, W_R)
+        mark = self.p.find(f'{W_PPR}/{W_RPR}')
+        if mark is not None:
+            r.append(deepcopy(mark))
+        t = etree.SubElement(r, W_T)
+        pieces = SPECIAL_RE.split(text)
+        t.text = pieces[0]
+        t.set(XML_SPACE, 'preserve')
+        if len(pieces) > 1:
+            self._insert_special(t, pieces[1:], '')
+
+    def replace_span(self, start, end, new):
+        """Replace text[start:end] with new; formatting of other runs is kept"""
+        self._replace(start, end, new)
+        self._build()
+
+    def replace_spans(self, spans):
+        """Apply [(start, end, new)] non-overlapping replacements in one pass"""
+        spans = sorted(spans, key=lambda span: span[0])
+        for start, end, new in reversed(spans):
+            self._replace(start, end, new)
+        if spans:
+            self._build()
+        return len(spans)
+
+    def find(self, pattern, regex=False, flags=0):
+        """[(start, end)] of non-overlapping matches of a literal or a regex"""
+        if not regex:
+            pattern = re.escape(pattern)
+        return [match.span() for match in re.finditer(pattern, self.text, flags)]
+
+    def replace(self, old, new, regex=False, count=0, flags=0):
+        """
+        Replace matches of old (literal or regex) with new.
+
+        For regex, new may be a template with \\1 / \\g<name> or a callable
+        taking the match. Returns the number of replacements.
+        """
+        compiled = re.compile(old if regex else re.escape(old), flags)
+        profiling.count('regex')
+        spans = []
+        for match in compiled.finditer(self.text):
+            if callable(new):
+                value = new(match)
+            elif regex:
+                value = match.expand(new)
+            else:
+                value = new
+            spans.append((match.start(), match.end(), value))
+            if count and len(spans) >= count:
+                break
+        return self.replace_spans(spans)
+
+    def rewrite(self, new_text):
+        """
+        Set the whole text, editing only the part that differs.
+
+        The common prefix and suffix stay in their runs; the changed middle
+        takes the formatting of the run where it starts.
+        """
+        old = self.text
+        if old == new_text:
+            return False
+        limit = min(len(old), len(new_text))
+        prefix = 0
+        while prefix < limit and old[prefix] == new_text[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new_text[-1 - suffix]:
+            suffix += 1
+        self.replace_span(prefix, len(old) - suffix, new_text[prefix:len(new_text) - suffix])
+        return True
+
+
+def iter_paragraphs(doc, tables=True):
+    """Body paragraphs and, with tables=True, paragraphs inside table cells"""
+    body = doc.element.body
+    if tables:
+        yield from body.iter(W_P)
+    else:
+        yield from body.iterchildren(W_P)
+
+
+@profiling.profiled('replace_in_document')
+def replace_in_document(doc, old, new, regex=False, tables=True, flags=0):
+    """
+    Replace old with new in every paragraph of doc.
+
+    Returns [(paragraph text after the change, number of replacements)].
+    """
+    compiled = re.compile(old if regex else re.escape(old), flags)
+    changed = []
+    visited = 0
+    for p in iter_paragraphs(doc, tables):
+        visited += 1
+        paragraph = ParagraphText(p)
+        if not compiled.search(paragraph.text):
+            continue
+        replaced = paragraph.replace(old, new, regex=regex, flags=flags)
+        changed.append((paragraph.text, replaced))
+    profiling.count('paragraphs', visited)
+    profiling.count('regex', visited)
+    return changed
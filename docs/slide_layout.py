@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Розкладка зображень на слайді.
+
+Розміри зображень читаються із заголовків файлів (PNG, JPEG, GIF, BMP) без
+декодування пікселів, після чого для 1-4 зображень підбирається сітка, в
+якій вони займають найбільшу площу. Кожне зображення додається на слайд
+один раз, одразу у фінальному розмірі та позиції.
+"""
+
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN
+import struct
+
+from image_cache import prepare_image
+
+GAP = Inches(0.3)
+CAPTION_HEIGHT = Inches(0.4)
+
+# Кандидати сітки (рядки, стовпці) для кожної кількості зображень
+GRIDS = {
+    1: [(1, 1)],
+    2: [(1, 2), (2, 1)],
+    3: [(1, 3), (3, 1), (2, 2)],
+    4: [(1, 4), (4, 1), (2, 2)],
+}
+
+
+def image_size(image_path):
+    """Read (width, height) in pixels from the image file header"""
+    with open(image_path, 'rb') as f:
+        head = f.read(26)
+
+        if head[:8] == b'\x89PNG\r\n\x1a\n':
+            return struct.unpack('>II', head[16:24])
+
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', head[6:10])
+
+        if head[:2] == b'BM':
+            width, height = struct.unpack('<ii', head[18:26])
+            return width, abs(height)
+
+        if head[:2] == b'\xff\xd8':
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                code = marker[1]
+                if code == 0xFF:
+                    f.seek(-1, 1)
+                    continue
+                if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+                    continue
+                length = struct.unpack('>H', f.read(2))[0]
+                # SOF0..SOF15, крім DHT (C4), JPG (C8) та DAC (CC)
+                if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(length - 2, 1)
+
+    # Невідомий формат - звертаємося до PIL
+    from PIL import Image
+    with Image.open(image_path) as img:
+        return img.size
+
+
+def content_area(prs, top=Inches(1.2), caption=False):
+    """Return (left, top, width, height) of the free area below the slide title"""
+    left = Inches(0.5)
+    width = prs.slide_width - 2 * left
+    bottom = Inches(6.7) if caption else prs.slide_height - Inches(0.3)
+    return left, top, width, bottom - top
+
+
+def _fit(size, max_width, max_height):
+    """Largest (width, height) with the image aspect ratio inside the box"""
+    w, h = size
+    scale = min(max_width / w, max_height / h)
+    return int(w * scale), int(h * scale)
+
+
+def solve_layout(sizes, area, captions=None):
+    """
+    Compute final boxes for 1-4 images inside area.
+
+    sizes - list of (width, height) in pixels, area - (left, top, width,
+    height) in EMU, captions - optional per-image caption list. Returns a
+    list of dicts with picture box and caption box for every image.
+    """
+    count = len(sizes)
+    if count not in GRIDS:
+        raise ValueError(f"Підтримується від 1 до 4 зображень, отримано {count}")
+
+    captions = captions or [None] * count
+    caption_height = CAPTION_HEIGHT if any(captions) else 0
+    area_left, area_top, area_width, area_height = area
+
+    best = None
+    for rows, cols in GRIDS[count]:
+        cell_width = (area_width - GAP * (cols - 1)) // cols
+        cell_height = (area_height - GAP * (rows - 1)) // rows
+        pic_height = cell_height - caption_height
+        if cell_width <= 0 or pic_height <= 0:
+            continue
+
+        fitted = [_fit(size, cell_width, pic_height) for size in sizes]
+        score = sum(w * h for w, h in fitted)
+        if best is None or score > best[0]:
+            best = (score, rows, cols, cell_width, cell_height, fitted)
+
+    if best is None:
+        raise ValueError("Область слайда замала для зображень")
+
+    _, rows, cols, cell_width, cell_height, fitted = best
+
+    boxes = []
+    for index, (width, height) in enumerate(fitted):
+        row, col = divmod(index, cols)
+        # Останній неповний рядок центруємо по горизонталі
+        in_row = min(cols, count - row * cols)
+        row_width = in_row * cell_width + (in_row - 1) * GAP
+        row_left = area_left + (area_width - row_width) // 2
+
+        cell_left = row_left + col * (cell_width + GAP)
+        cell_top = area_top + row * (cell_height + GAP)
+        block_height = height + (caption_height if captions[index] else 0)
+        top = cell_top + (cell_height - block_height) // 2
+
+        box = {
+            'left': cell_left + (cell_width - width) // 2,
+            'top': top,
+            'width': width,
+            'height': height,
+            'caption': None,
+        }
+        if captions[index]:
+            box['caption'] = (cell_left, top + height, cell_width, caption_height)
+        boxes.append(box)
+
+    return boxes
+
+
+def place_pictures(slide, image_paths, area, captions=None):
+    """Add images to the slide at their solved boxes; returns picture shapes"""
+    boxes = solve_layout([image_size(path) for path in image_paths], area, captions)
+
+    pictures = []
+    for path, box, caption in zip(image_paths, boxes, captions or [None] * len(image_paths)):
+        prepared = prepare_image(path, box_width=box['width'], box_height=box['height'])
+        pictures.append(slide.shapes.add_picture(
+            prepared, box['left'], box['top'], width=box['width'], height=box['height']
+        ))
+
+        if caption:
+            left, top, width, height = box['caption']
+            txBox = slide.shapes.add_textbox(left, top, width, height)
+            tf = txBox.text_frame
+            tf.text = caption
+            p = tf.paragraphs[0]
+            p.font.size = Pt(11)
+            p.font.italic = True
+            p.alignment = PP_ALIGN.CENTER
+
+    return pictures
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Інкрементальна збірка презентації за маніфестом слайдів.
+
+Маніфест - це список словників {'type': ..., <аргументи функції add_*>}.
+Для кожного слайда рахується відбиток (спека, хеші зображень, код
+функції-будівника і спільних модулів slide_layout / image_cache). Готовий
+XML слайда разом із його зображеннями зберігається в кеші, тож при
+повторній збірці заново будуються лише слайди, в яких змінилась спека,
+зображення чи код, а решта вставляється з кешу.
+"""
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from lxml import etree
+import hashlib
+import inspect
+import io
+import json
+import os
+import shutil
+
+from image_cache import source_hash
+
+# Змінюється при зміні формату кешу
+CACHE_VERSION = 1
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(DOCS_DIR, '.cache', 'slides')
+
+# Спільні модулі, якими користуються будівники: їх код теж входить у відбиток
+HELPER_MODULES = ('slide_layout.py', 'image_cache.py')
+_helpers_hash = None
+
+
+def _helpers_source_hash():
+    """Hash of the helper modules' source, computed once per process"""
+    global _helpers_hash
+    if _helpers_hash is None:
+        h = hashlib.sha256()
+        for name in HELPER_MODULES:
+            with open(os.path.join(DOCS_DIR, name), 'rb') as f:
+                h.update(f.read())
+        _helpers_hash = h.hexdigest()
+    return _helpers_hash
+
+
+def _image_args(spec):
+    """Spec keys that reference image files (image_path, image1_path, ...)"""
+    return [key for key in spec if key.endswith('_path') and spec[key]]
+
+
+def slide_fingerprint(spec, builder):
+    """Fingerprint of everything that affects the built slide"""
+    h = hashlib.sha256()
+    h.update(str(CACHE_VERSION).encode())
+    h.update(_helpers_source_hash().encode())
+    h.update(inspect.getsource(builder).encode('utf-8'))
+    h.update(json.dumps(spec, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    for key in _image_args(spec):
+        h.update(source_hash(spec[key]).encode())
+    return h.hexdigest()
+
+
+def _store_slide(prs, slide, entry_dir):
+    """Save slide XML, layout index and embedded images to the cache"""
+    tmp_dir = entry_dir + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    media = {}
+    for blip in slide._element.iter(qn('a:blip')):
+        rId = blip.get(qn('r:embed'))
+        if not rId or rId in media:
+            continue
+        image_part = slide.part.related_part(rId)
+        filename = f"{rId}.{image_part.partname.ext}"
+        with open(os.path.join(tmp_dir, filename), 'wb') as f:
+            f.write(image_part.blob)
+        media[rId] = filename
+
+    meta = {
+        'layout': list(prs.slide_layouts).index(slide.slide_layout),
+        'media': media,
+    }
+    with open(os.path.join(tmp_dir, 'slide.xml'), 'wb') as f:
+        f.write(etree.tostring(slide._element, encoding='UTF-8', xml_declaration=True, standalone=True))
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    os.replace(tmp_dir, entry_dir)
+
+
+def _splice_slide(prs, entry_dir):
+    """Append a cached slide to prs, re-linking its images"""
+    with open(os.path.join(entry_dir, 'meta.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    with open(os.path.join(entry_dir, 'slide.xml'), 'rb') as f:
+        cached = parse_xml(f.read())
+
+    slide = prs.slides.add_slide(prs.slide_layouts[meta['layout']])
+
+    new_ids = {}
+    for old_rId, filename in meta['media'].items():
+        with open(os.path.join(entry_dir, filename), 'rb') as f:
+            _, new_ids[old_rId] = slide.part.get_or_add_image_part(io.BytesIO(f.read()))
+    for blip in cached.iter(qn('a:blip')):
+        rId = blip.get(qn('r:embed'))
+        if rId in new_ids:
+            blip.set(qn('r:embed'), new_ids[rId])
+
+    # Замінюємо дерево фігур, створене макетом, на збережене
+    slide._element.replace(slide._element.cSld, cached.cSld)
+    return slide
+
+
+def build_deck(prs, manifest, builders, cache_dir=CACHE_DIR):
+    """
+    Build every slide of the manifest into prs, reusing cached slides.
+
+    builders maps spec['type'] to an add_*(prs, **kwargs) function. Slides
+    whose images do not exist are skipped, like the hand-written builders
+    did with os.path.exists(). Returns build statistics.
+    """
+    stats = {'built': 0, 'cached': 0, 'skipped': 0}
+
+    for spec in manifest:
+        spec = dict(spec)
+        slide_type = spec.pop('type')
+        builder = builders[slide_type]
+
+        if any(not os.path.exists(spec[key]) for key in _image_args(spec)):
+            stats['skipped'] += 1
+            continue
+
+        entry_dir = os.path.join(cache_dir, slide_fingerprint(spec, builder))
+        if os.path.exists(os.path.join(entry_dir, 'meta.json')):
+            _splice_slide(prs, entry_dir)
+            stats['cached'] += 1
+            continue
+
+        slide = builder(prs, **spec)
+        _store_slide(prs, slide, entry_dir)
+        stats['built'] += 1
+
+    return stats
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потокове перетворення тексту docx з обмеженою пам'яттю.
+
+Document() тримає в пам'яті все дерево lxml разом з об'єктами python-docx,
+і на великих роботах (додатки з лістингами й таблицями) кілька паралельних
+конвертацій займають гігабайти. Для етапів, яким потрібен лише текст
+абзаців - нормалізація тире, словник друкарських помилок
+(text_corrector.py), виправлення підписів - тут word/document.xml (а також
+колонтитули і виноски) читається через iterparse. Кожен блок тіла (w:p,
+w:tbl, w:sdt ...) після розбору проходить правила для всіх своїх w:p через
+run_locator, одразу серіалізується в потік нового zip і звільняється. У
+пам'яті одночасно лише один блок, тож пік не залежить від розміру
+документа. Решта частин пакета копіюється потоком без розбору.
+
+Використання:
+    python stream_transform.py документ.docx [...] [-o результат.docx]
+                               [--rules dashes,captions,typos] [--coalesce]
+                               [--dict corrections.tsv] [-j workers] [--memory]
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+import argparse
+import os
+import re
+import shutil
+import sys
+import time
+import tracemalloc
+import zipfile
+
+import profiling
+from run_locator import ParagraphText, W_NS, W_P
+
+W_BODY = f'{{{W_NS}}}body'
+
+# Частини, текст яких перетворюється; решта копіюється як є
+TEXT_PARTS_RE = re.compile(r'^word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$')
+
+# Тире та їх варіанти (як у fix_dashes_and_captions.py)
+DASHES_RE = '[‒–—―‐‑−­]'
+CAPTION_DASH_RE = r'^(\s*(?:Таблиця|Рисунок)\s+\d+\.\d+)\.?\s*-\s*'
+
+
+def _dashes(paragraph):
+    return paragraph.replace(DASHES_RE, '-', regex=True)
+
+
+def _captions(paragraph):
+    return paragraph.replace(CAPTION_DASH_RE, r'\1. ', regex=True, count=1)
+
+
+def _typos(dictionary):
+    from text_corrector import load_corrector
+
+    corrector = load_corrector(dictionary) if dictionary else load_corrector()
+
+    def rule(paragraph):
+        spans = corrector.spans(paragraph.text)
+        if spans:
+            paragraph.replace_spans([(start, end, new) for start, end, new, _ in spans])
+        return len(spans)
+    return rule
+
+
+# Назва -> фабрика правила; правило змінює ParagraphText і повертає кількість замін
+RULES = {
+    'dashes': lambda dictionary: _dashes,
+    'captions': lambda dictionary: _captions,
+    'typos': _typos,
+}
+DEFAULT_RULES = ('dashes', 'captions')
+
+
+def make_rules(names, dictionary=None):
+    """[(name, rule)] in the given order"""
+    unknown = [name for name in names if name not in RULES]
+    if unknown:
+        raise ValueError(f"unknown rules: {', '.join(unknown)}")
+    return [(name, RULES[name](dictionary)) for name in names]
+
+
+def transform_block(block, rules, stats, coalesce=False):
+    """Apply rules to every w:p of one body-level element (nested tables and text boxes included)"""
+    if coalesce:
+        from run_coalescer import coalesce as coalesce_runs
+        before, after = coalesce_runs(block)
+        stats['runs_merged'] += before - after
+    for p in block.iter(W_P):
+        stats['paragraphs'] += 1
+        paragraph = ParagraphText(p)
+        if not paragraph.text:
+            continue
+        changed = False
+        for name, rule in rules:
+            replaced = rule(paragraph)
+            if replaced:
+                stats[name] += replaced
+                changed = True
+        stats['changed'] += changed
+
+
+def _declarations(nsmap):
+    """Serialized xmlns attributes of nsmap, as lxml writes them"""
+    return [(f' xmlns:{prefix}="{uri}"' if prefix else f' xmlns="{uri}"').encode() for prefix, uri in nsmap.items()]
+
+
+def _strip_declarations(start_tag, declarations):
+    """Drop namespace declarations already made by the root (lxml repeats all of them on subtrees)"""
+    for declaration in declarations:
+        start_tag = start_tag.replace(declaration, b'', 1)
+    return start_tag
+
+
+def _open_tag(element, declarations):
+    empty = etree.tostring(etree.Element(element.tag, dict(element.attrib), nsmap=element.nsmap), encoding='UTF-8')
+    return _strip_declarations(empty[:-2], declarations) + b'>'
+
+
+def _close_tag(element):
+    name = etree.QName(element).localname
+    return (f'</{element.prefix}:{name}>' if element.prefix else f'</{name}>').encode()
+
+
+def transform_part(source, target, rules, stats, coalesce=False):
+    """
+    Stream one WordprocessingML part from source to target.
+
+    The root and w:body are written as open tags; every element directly
+    inside them is transformed, written and freed as soon as its end tag is
+    parsed.
+    """
+    target.write(b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n")
+    root = body = None
+    opened = False
+    declared = []
+    # Лише події end: вдвічі менше подій, ніж зі start, а блоки все одно закінчуються цілими
+    for _, element in etree.iterparse(source, events=('end',), huge_tree=True):
+        if element is body:
+            target.write(_close_tag(body))
+            continue
+        parent = element.getparent()
+        if parent is None:
+            target.write(_close_tag(element) if root is not None else etree.tostring(element, encoding='UTF-8'))
+            break
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            if body is None and parent.tag == W_BODY and grandparent.getparent() is None:
+                body = parent
+            elif parent is not body:
+                continue
+        # Корінь частини і w:body відкриваються при першому блоці і лишаються відкритими
+        if root is None:
+            root = parent if grandparent is None else grandparent
+            declared = _declarations(root.nsmap)
+            target.write(_open_tag(root, []))
+        if parent is body and not opened:
+            target.write(_open_tag(body, declared))
+            opened = True
+        transform_block(element, rules, stats, coalesce)
+        data = etree.tostring(element, encoding='UTF-8', with_tail=False)
+        head = data.index(b'>')
+        target.write(_strip_declarations(data[:head], declared))
+        target.write(memoryview(data)[head:])
+        stats['blocks'] += 1
+        # Звільняємо блок і вже записаних сусідів
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _copy_info(info):
+    copy = zipfile.ZipInfo(info.filename, info.date_time)
+    copy.compress_type = info.compress_type
+    copy.external_attr = info.external_attr
+    copy.create_system = info.create_system
+    return copy
+
+
+def transform_docx(input_path, output_path=None, rules=DEFAULT_RULES, dictionary=None, coalesce=False):
+    """Transform the text parts of a docx in one streaming pass; returns stats"""
+    output_path = output_path or input_path
+    temporary = output_path + '.tmp'
+    stats = Counter()
+    compiled = make_rules(rules, dictionary)
+    with zipfile.ZipFile(input_path) as zin, zipfile.ZipFile(temporary, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            with zin.open(info) as source, zout.open(_copy_info(info), 'w', force_zip64=True) as target:
+                if TEXT_PARTS_RE.match(info.filename):
+                    transform_part(source, target, compiled, stats, coalesce)
+                    stats['parts'] += 1
+                else:
+                    shutil.copyfileobj(source, target)
+    os.replace(temporary, output_path)
+    profiling.count('paragraphs', stats['paragraphs'])
+    return stats
+
+
+def _transform_job(job):
+    input_path, output_path, rules, dictionary, coalesce, memory = job
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    stats = transform_docx(input_path, output_path, rules, dictionary, coalesce)
+    stats['seconds'] = time.perf_counter() - start
+    if memory:
+        stats['peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return input_path, output_path or input_path, stats
+
+
+def transform_many(jobs, workers=None):
+    """Run transform jobs in worker processes (in process for one job or workers=1)"""
+    if len(jobs) == 1 or workers == 1:
+        yield from map(_transform_job, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_transform_job, jobs)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Streaming text transform of docx files with bounded memory')
+    parser.add_argument('docx', nargs='+')
+    parser.add_argument('-o', '--output', help='output path (one input only; inputs are overwritten by default)')
+    parser.add_argument('--rules', default=','.join(DEFAULT_RULES), help=f"comma separated: {', '.join(RULES)}")
+    parser.add_argument('--dict', help='dictionary for the typos rule (corrections.tsv by default)')
+    parser.add_argument('--coalesce', action='store_true', help='merge runs with identical formatting first')
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    parser.add_argument('--memory', action='store_true', help='report tracemalloc peak per document')
+    args = parser.parse_args()
+
+    if args.output and len(args.docx) > 1:
+        parser.error('-o needs exactly one input')
+    rules = [name.strip() for name in args.rules.split(',') if name.strip()]
+    try:
+        make_rules([name for name in rules if name != 'typos'])
+    except ValueError as e:
+        parser.error(str(e))
+
+    jobs = [(path, args.output, rules, args.dict, args.coalesce, args.memory) for path in args.docx]
+    start = time.perf_counter()
+    for input_path, output_path, stats in transform_many(jobs, args.workers):
+        counts = ', '.join(f"{name}={stats[name]}" for name in rules)
+        line = (f"{os.path.basename(input_path)}: {stats['paragraphs']} абзаців, змінено {stats['changed']} "
+                f"({counts}), {stats['seconds']:.2f} с")
+        if args.coalesce:
+            line += f", злито run: {stats['runs_merged']}"
+        if args.memory:
+            line += f", пік пам'яті {stats['peak'] / 2**20:.1f} МБ"
+        print(line)
+        if output_path != input_path:
+            print(f"  -> {output_path}")
+    print(f"\nВсього: {len(jobs)} документів за {time.perf_counter() - start:.2f} с")
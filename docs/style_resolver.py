@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ефективне форматування абзаців і run документа Word з мемоізацією.
+
+Щоб дізнатися, яким шрифтом насправді написаний run, треба пройти ланцюжок
+rPr run -> стиль символів -> стиль абзацу -> basedOn ... -> docDefaults
+(і шрифти теми). StyleResolver один раз розгортає кожен стиль у плоский
+набір властивостей, а результат для пари (стиль абзацу, пряме
+форматування run) запам'ятовує за канонічним підписом rPr. У типовому
+документі різних комбінацій лише десятки, тож ефективні властивості
+кожного run даються одним пошуком у словнику.
+
+Властивості run: font, size (пт), bold, italic, underline, caps, strike,
+color. Властивості абзацу: alignment, line_spacing (множник) або
+line_spacing_pt, space_before / space_after (пт), first_line_indent,
+left_indent, right_indent (см). Стилі таблиць і нумерація не враховуються.
+
+Використання:
+    python style_resolver.py документ.docx
+"""
+
+from collections import Counter
+from lxml import etree
+import sys
+import time
+
+import profiling
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+W = '{%s}' % W_NS
+
+W_P = W + 'p'
+W_R = W + 'r'
+W_RPR = W + 'rPr'
+W_PPR = W + 'pPr'
+W_VAL = W + 'val'
+
+# Елементи всередині w:p, у яких можуть бути run цього ж абзацу
+RUN_CONTAINERS = {
+    W + 'hyperlink', W + 'ins', W + 'moveTo', W + 'smartTag', W + 'fldSimple',
+    W + 'sdt', W + 'sdtContent', W + 'customXml', W + 'dir', W + 'bdo',
+}
+
+TWIPS_PER_CM = 1440 / 2.54
+ALIGNMENTS = {'both': 'justify', 'start': 'left', 'end': 'right', 'distribute': 'justify'}
+TOGGLES = {'b': 'bold', 'i': 'italic', 'caps': 'caps', 'strike': 'strike'}
+
+
+def merge_paragraph(*levels):
+    """
+    Merge paragraph props from the outermost level (docDefaults) inwards.
+
+    line_spacing and line_spacing_pt are one property: a level that sets
+    either of them drops the other one inherited from outer levels.
+    """
+    merged = {}
+    for props in levels:
+        if 'line_spacing' in props:
+            merged.pop('line_spacing_pt', None)
+        elif 'line_spacing_pt' in props:
+            merged.pop('line_spacing', None)
+        merged.update(props)
+    return merged
+
+
+def _on(element):
+    return element.get(W_VAL) not in ('0', 'false', 'off')
+
+
+def _twips(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def signature(element):
+    """Hashable canonical form of a property element (tags and attributes of its subtree)"""
+    if element is None:
+        return ()
+    return tuple((e.tag, *e.items()) for e in element.iter())
+
+
+def own_runs(p):
+    """w:r of a paragraph (also inside hyperlinks, insertions, fields), not of nested paragraphs"""
+    stack = [iter(p)]
+    while stack:
+        for child in stack[-1]:
+            if child.tag == W_R:
+                yield child
+            elif child.tag in RUN_CONTAINERS:
+                stack.append(iter(child))
+                break
+        else:
+            stack.pop()
+
+
+class StyleResolver:
+    """Flattened style properties of a document with memoized run/paragraph lookups"""
+
+    def __init__(self, doc):
+        styles = doc.styles.element
+        self._theme_fonts = self._load_theme_fonts(doc)
+        self._styles = {}
+        self.default_paragraph_style = None
+        for style in styles.iterchildren(W + 'style'):
+            style_id = style.get(W + 'styleId')
+            self._styles[style_id] = style
+            if style.get(W + 'type') == 'paragraph' and style.get(W + 'default') in ('1', 'true'):
+                self.default_paragraph_style = style_id
+
+        defaults = styles.find(W + 'docDefaults')
+        run_defaults = defaults.find(f'{W}rPrDefault/{W}rPr') if defaults is not None else None
+        paragraph_defaults = defaults.find(f'{W}pPrDefault/{W}pPr') if defaults is not None else None
+        self.defaults = (self.paragraph_properties(paragraph_defaults), self.run_properties(run_defaults))
+
+        self._flat = {}
+        self._direct_runs = {}
+        self._runs = {}
+        self._paragraphs = {}
+        self.lookups = 0
+        self.misses = 0
+
+    # --- Розбір властивостей ---
+
+    @staticmethod
+    def _load_theme_fonts(doc):
+        fonts = {}
+        for rel in doc.part.rels.values():
+            if rel.reltype.endswith('/theme') and not rel.is_external:
+                theme = etree.fromstring(rel.target_part.blob)
+                for role in ('major', 'minor'):
+                    latin = theme.find(f'.//{{{A_NS}}}{role}Font/{{{A_NS}}}latin')
+                    if latin is not None:
+                        fonts[role] = latin.get('typeface')
+        return fonts
+
+    def run_properties(self, rPr):
+        """Properties set by one rPr element (not inherited)"""
+        props = {}
+        if rPr is None:
+            return props
+        for child in rPr:
+            name = etree.QName(child).localname
+            if name == 'rFonts':
+                font = child.get(W + 'ascii') or child.get(W + 'hAnsi')
+                theme = child.get(W + 'asciiTheme') or child.get(W + 'hAnsiTheme')
+                if font:
+                    props['font'] = font
+                elif theme:
+                    props['font'] = self._theme_fonts.get('major' if theme.startswith('major') else 'minor')
+            elif name == 'sz':
+                props['size'] = int(child.get(W_VAL, 0)) / 2
+            elif name in TOGGLES:
+                props[TOGGLES[name]] = _on(child)
+            elif name == 'u':
+                props['underline'] = child.get(W_VAL, 'single') != 'none'
+            elif name == 'color':
+                props['color'] = child.get(W_VAL)
+        return props
+
+    @staticmethod
+    def paragraph_properties(pPr):
+        """Properties set by one pPr element (not inherited)"""
+        props = {}
+        if pPr is None:
+            return props
+        jc = pPr.find(W + 'jc')
+        if jc is not None:
+            value = jc.get(W_VAL)
+            props['alignment'] = ALIGNMENTS.get(value, value)
+        spacing = pPr.find(W + 'spacing')
+        if spacing is not None:
+            line = _twips(spacing.get(W + 'line'))
+            if line is not None:
+                if spacing.get(W + 'lineRule', 'auto') == 'auto':
+                    props['line_spacing'] = round(line / 240, 2)
+                else:
+                    props['line_spacing_pt'] = line / 20
+            for side in ('before', 'after'):
+                value = _twips(spacing.get(W + side))
+                if value is not None:
+                    props[f'space_{side}'] = value / 20
+        ind = pPr.find(W + 'ind')
+        if ind is not None:
+            first = _twips(ind.get(W + 'firstLine'))
+            hanging = _twips(ind.get(W + 'hanging'))
+            if hanging is not None:
+                props['first_line_indent'] = round(-hanging / TWIPS_PER_CM, 2)
+            elif first is not None:
+                props['first_line_indent'] = round(first / TWIPS_PER_CM, 2)
+            for side, names in (('left', ('left', 'start')), ('right', ('right', 'end'))):
+                for name in names:
+                    value = _twips(ind.get(W + name))
+                    if value is not None:
+                        props[f'{side}_indent'] = round(value / TWIPS_PER_CM, 2)
+                        break
+        return props
+
+    # --- Стилі ---
+
+    def style(self, style_id):
+        """(paragraph props, run props) of a style with its basedOn chain merged"""
+        if style_id in self._flat:
+            return self._flat[style_id]
+        self._flat[style_id] = ({}, {})  # захист від циклів basedOn
+        element = self._styles.get(style_id)
+        if element is None:
+            return self._flat[style_id]
+        based_on = element.find(W + 'basedOn')
+        parent = self.style(based_on.get(W_VAL)) if based_on is not None else ({}, {})
+        paragraph = merge_paragraph(parent[0], self.paragraph_properties(element.find(W_PPR)))
+        run = {**parent[1], **self.run_properties(element.find(W_RPR))}
+        self._flat[style_id] = (paragraph, run)
+        return self._flat[style_id]
+
+    def style_name(self, style_id):
+        element = self._styles.get(style_id)
+        name = element.find(W + 'name') if element is not None else None
+        return name.get(W_VAL) if name is not None else style_id
+
+    # --- Абзаци і run ---
+
+    def paragraph_style_id(self, p):
+        pPr = p.find(W_PPR)
+        style = pPr.find(W + 'pStyle') if pPr is not None else None
+        return style.get(W_VAL) if style is not None else self.default_paragraph_style
+
+    def paragraph(self, p):
+        """Effective paragraph properties of a w:p (or python-docx Paragraph)"""
+        p = getattr(p, '_p', p)
+        pPr = p.find(W_PPR)
+        key = signature(pPr)
+        self.lookups += 1
+        props = self._paragraphs.get(key)
+        if props is None:
+            self.misses += 1
+            style_id = self.paragraph_style_id(p)
+            props = merge_paragraph(self.defaults[0], self.style(style_id)[0], self.paragraph_properties(pPr),
+                                    {'style': style_id})
+            self._paragraphs[key] = props
+        return props
+
+    def _direct_run(self, key, rPr):
+        direct = self._direct_runs.get(key)
+        if direct is None:
+            style = rPr.find(W + 'rStyle') if rPr is not None else None
+            direct = (style.get(W_VAL) if style is not None else None, self.run_properties(rPr))
+            self._direct_runs[key] = direct
+        return direct
+
+    def run(self, r, paragraph_style=None):
+        """
+        Effective run properties of a w:r.
+
+        paragraph_style - style id of the enclosing paragraph if already known
+        (saves walking up to the w:p). The returned dict is shared between
+        runs with the same formatting and must not be modified.
+        """
+        r = getattr(r, '_r', r)
+        if paragraph_style is None:
+            p = next(r.iterancestors(W_P), None)
+            paragraph_style = self.paragraph_style_id(p) if p is not None else self.default_paragraph_style
+        rPr = r.find(W_RPR)
+        direct_key = signature(rPr)
+        key = (paragraph_style, direct_key)
+        self.lookups += 1
+        props = self._runs.get(key)
+        if props is None:
+            self.misses += 1
+            character_style, direct = self._direct_run(direct_key, rPr)
+            props = {**self.defaults[1], **self.style(paragraph_style)[1]}
+            if character_style:
+                props.update(self.style(character_style)[1])
+            props.update(direct)
+            self._runs[key] = props
+        return props
+
+    def runs(self, p):
+        """[(w:r, effective props)] of one paragraph"""
+        p = getattr(p, '_p', p)
+        style_id = self.paragraph(p)['style']
+        runs = [(r, self.run(r, style_id)) for r in own_runs(p)]
+        profiling.count('runs', len(runs))
+        return runs
+
+
+def iter_formatting(doc, resolver=None, tables=True):
+    """Yield (w:p, paragraph props, [(w:r, run props)]) for every paragraph of doc"""
+    from run_locator import iter_paragraphs
+
+    resolver = resolver or StyleResolver(doc)
+    for p in iter_paragraphs(doc, tables):
+        yield p, resolver.paragraph(p), resolver.runs(p)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    from docx import Document
+
+    if len(sys.argv) < 2:
+        print("Використання: python style_resolver.py документ.docx")
+        sys.exit(1)
+
+    doc = Document(sys.argv[1])
+    start = time.perf_counter()
+    resolver = StyleResolver(doc)
+    fonts = Counter()
+    run_count = 0
+    for p, paragraph, runs in iter_formatting(doc, resolver):
+        for r, props in runs:
+            run_count += 1
+            fonts[(props.get('font'), props.get('size'), props.get('bold', False))] += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Run: {run_count}, пошуків: {resolver.lookups}, обчислень: {resolver.misses} за {elapsed:.3f} с\n")
+    for (font, size, bold), count in fonts.most_common(15):
+        print(f"  {count:6}  {font} {size} пт{' жирний' if bold else ''}")
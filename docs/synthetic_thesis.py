@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Генератор синтетичної магістерської роботи для вимірювання продуктивності.
+
+Документ має структуру справжньої роботи: ВСТУП, розділи з підрозділами
+(Heading 1 / Heading 2), основний текст українською з довгими тире,
+рисунки (PNG) з підписами "Рисунок N.M – ...", таблиці з підписами,
+ВИСНОВКИ, СПИСОК ВИКОРИСТАНИХ ДЖЕРЕЛ з URL і датами звернення та ДОДАТКИ.
+Текст абзаців розбитий на кілька run з rsid-атрибутами і w:proofErr, як
+після редагування у Word; частина run має інший кегль або жирний шрифт.
+
+Розмір задається кількістю абзаців, таблиць, рисунків і джерел; той самий
+seed дає той самий вміст. Згенеровані файли кешуються в
+.cache/bench/ за параметрами.
+
+Використання:
+    python synthetic_thesis.py [-p 10000] [--tables 40] [--images 40]
+                               [--sources 200] [--fragmentation 4] [--seed 0]
+                               [-o робота.docx]
+"""
+
+from docx import Document
+from docx.oxml.shape import CT_Inline
+from docx.shared import Cm
+from lxml import etree
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+from style_resolver import W, W_P, W_PPR, W_R, W_RPR
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(DOCS_DIR, '.cache', 'bench')
+GENERATOR_VERSION = 1
+
+W_T = W + 't'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+WORDS = (
+    'система електронної комерції користувач інтерфейс застосунок сервер база даних запит відповідь '
+    'модуль архітектура компонент сторінка каталог товар кошик замовлення оплата доставка сповіщення '
+    'платформа мобільний веб розробка тестування безпека автентифікація авторизація токен кешування '
+    'продуктивність масштабованість надійність вимога функціональна нефункціональна діаграма клас '
+    'сутність колонка поле індекс транзакція черга повідомлення подія обробник маршрут контролер сервіс '
+    'репозиторій міграція схема адміністратор аналітика звіт фільтр пошук сортування категорія атрибут '
+    'відгук рейтинг знижка промокод програма лояльності чат підтримка інтеграція API документація'
+).split()
+CONNECTORS = ['що', 'який', 'та', 'і', 'для', 'у', 'з', 'на', 'за допомогою', 'завдяки', 'відповідно до']
+DASHES = ['—', '–']
+SITES = ['nestjs.com', 'nextjs.org', 'reactnative.dev', 'postgresql.org', 'redis.io', 'owasp.org',
+         'developer.mozilla.org', 'docs.docker.com', 'typeorm.io', 'martinfowler.com']
+
+# Різне пряме форматування run: основне, дрібніший кегль, жирний
+RUN_FORMATS = [(28, False)] * 8 + [(24, False), (28, True)]
+
+
+class _Writer:
+    """Appends generated paragraphs and tables to a python-docx Document in order"""
+
+    def __init__(self, doc, rng, fragmentation):
+        self.doc = doc
+        self.rng = rng
+        self.fragmentation = fragmentation
+        self.body = doc.element.body
+        # sectPr повертається в кінець у close(); доти абзаци додаються просто в кінець
+        # тіла, тож елементи створюються одразу в дереві документа
+        self.width = doc._block_width
+        self.sect_pr = self.body.find(W + 'sectPr')
+        self.body.remove(self.sect_pr)
+        self.rsids = [f'{rng.randrange(1 << 32):08X}' for _ in range(12)]
+        self.paragraphs = 0
+        self.shape_id = 0
+
+    def _rsid(self):
+        return self.rng.choice(self.rsids)
+
+    def _run(self, p, text, size=28, bold=False):
+        r = etree.SubElement(p, W_R, {W + 'rsidR': self._rsid()})
+        rPr = etree.SubElement(r, W_RPR)
+        etree.SubElement(rPr, W + 'rFonts', {W + 'ascii': 'Times New Roman', W + 'hAnsi': 'Times New Roman'})
+        if bold:
+            etree.SubElement(rPr, W + 'b')
+        etree.SubElement(rPr, W + 'sz', {W + 'val': str(size)})
+        t = etree.SubElement(r, W_T)
+        t.text = text
+        if text != text.strip():
+            t.set(XML_SPACE, 'preserve')
+
+    def paragraph(self, text, style=None, body=False, fragment=True):
+        """Append a w:p; its text is split into runs around random positions"""
+        p = etree.SubElement(self.body, W_P, {W + 'rsidR': self._rsid(), W + 'rsidRDefault': self._rsid()})
+        pPr = etree.SubElement(p, W_PPR)
+        if style:
+            etree.SubElement(pPr, W + 'pStyle', {W + 'val': style})
+        if body:
+            etree.SubElement(pPr, W + 'spacing', {W + 'line': '360', W + 'lineRule': 'auto'})
+            etree.SubElement(pPr, W + 'ind', {W + 'firstLine': '709'})
+            etree.SubElement(pPr, W + 'jc', {W + 'val': 'both'})
+
+        pieces = 1
+        if fragment and len(text) > 20:
+            pieces = max(1, int(self.rng.expovariate(1 / self.fragmentation)) + 1)
+        cuts = sorted(self.rng.sample(range(1, len(text)), min(pieces - 1, len(text) - 1))) if pieces > 1 else []
+        start = 0
+        for end in cuts + [len(text)]:
+            size, bold = self.rng.choice(RUN_FORMATS) if body else (28, False)
+            if cuts and self.rng.random() < 0.15:
+                etree.SubElement(p, W + 'proofErr', {W + 'type': 'spellStart'})
+            self._run(p, text[start:end], size, bold)
+            start = end
+        self.paragraphs += 1
+        return p
+
+    def picture(self, image):
+        # Run.add_picture шукає вільний id фігури по всьому документу (xpath) для
+        # кожного рисунка; тут id видаються лічильником
+        self.shape_id += 1
+        rel_id, picture = self.doc.part.get_or_add_image(image)
+        cx, cy = picture.scaled_dimensions(Cm(12), None)
+        inline = CT_Inline.new_pic_inline(self.shape_id, rel_id, picture.filename, cx, cy)
+        self.doc.add_paragraph().add_run()._r.add_drawing(inline)
+        self.paragraphs += 1
+
+    def table(self, rows, cols, texts):
+        table = self.doc._body.add_table(rows, cols, self.width)
+        table.style = 'Table Grid'
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.paragraphs[0].add_run(texts(r, c))
+        self.paragraphs += rows * cols
+
+    def close(self):
+        self.body.append(self.sect_pr)
+
+
+def _sentence(rng, words=(8, 18)):
+    count = rng.randint(*words)
+    parts = rng.choices(WORDS, k=count)
+    for position in rng.sample(range(1, count), count // 7):
+        parts[position] = rng.choice(CONNECTORS) + ' ' + parts[position]
+    if count > 6 and rng.random() < 0.4:
+        parts.insert(rng.randint(2, len(parts) - 2), rng.choice(DASHES))
+    sentence = ' '.join(parts)
+    return sentence[0].upper() + sentence[1:] + '.'
+
+
+def _body_text(rng):
+    return ' '.join(_sentence(rng) for _ in range(rng.randint(2, 6)))
+
+
+def _title(rng, words=(3, 7)):
+    text = ' '.join(rng.choices(WORDS, k=rng.randint(*words)))
+    return text[0].upper() + text[1:]
+
+
+def _image(rng, index):
+    from PIL import Image, ImageDraw
+    image = Image.new('RGB', (320, 200), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        box = sorted(rng.randrange(320) for _ in range(2)), sorted(rng.randrange(200) for _ in range(2))
+        draw.rectangle([box[0][0], box[1][0], box[0][1], box[1][1]], outline=(0, 0, 0), width=2)
+    draw.text((10, 10), f'image {index}', fill=(0, 0, 0))
+    stream = io.BytesIO()
+    image.save(stream, 'PNG')
+    stream.seek(0)
+    return stream
+
+
+def generate(path, paragraphs=1000, tables=10, images=10, sources=100, fragmentation=3.0, seed=0):
+    """Write a synthetic thesis to path; returns the number of paragraphs written"""
+    rng = random.Random(seed)
+    doc = Document()
+    section = doc.sections[0]
+    section.top_margin = section.bottom_margin = Cm(2)
+    section.left_margin, section.right_margin = Cm(3), Cm(1.5)
+    writer = _Writer(doc, rng, fragmentation)
+
+    chapters = max(3, min(6, paragraphs // 2000 + 3))
+    subsections = max(2, paragraphs // (chapters * 40))
+    slots = chapters * subsections
+    body_per_slot = max(1, (paragraphs - sources - slots) // slots)
+    tables_left, images_left = tables, images
+
+    writer.paragraph('ВСТУП', 'Heading1', fragment=False)
+    for _ in range(max(3, body_per_slot // 2)):
+        writer.paragraph(_body_text(rng), body=True)
+
+    for chapter in range(1, chapters + 1):
+        writer.paragraph(f'РОЗДІЛ {chapter} {_title(rng).upper()}', 'Heading1', fragment=False)
+        figure = table_number = 0
+        for sub in range(1, subsections + 1):
+            slot = (chapter - 1) * subsections + sub
+            writer.paragraph(f'{chapter}.{sub} {_title(rng)}', 'Heading2', fragment=False)
+            for _ in range(body_per_slot):
+                writer.paragraph(_body_text(rng), body=True)
+            # Рисунки і таблиці рівномірно розподіляються по підрозділах
+            for _ in range(images_left // (slots - slot + 1)):
+                figure += 1
+                images_left -= 1
+                writer.picture(_image(rng, images - images_left))
+                writer.paragraph(f'Рисунок {chapter}.{figure} {rng.choice(DASHES)} {_title(rng)}', 'Caption')
+            for _ in range(tables_left // (slots - slot + 1)):
+                table_number += 1
+                tables_left -= 1
+                writer.paragraph(f'Таблиця {chapter}.{table_number} {rng.choice(DASHES)} {_title(rng)}', 'Caption')
+                cols = rng.randint(3, 5)
+                header = [_title(rng, (1, 2)) for _ in range(cols)]
+                writer.table(rng.randint(4, 10), cols,
+                             lambda r, c: header[c] if r == 0 else _title(rng, (1, 4)))
+        writer.paragraph(f'Висновки до розділу {chapter}', 'Heading2', fragment=False)
+        writer.paragraph(_body_text(rng), body=True)
+
+    writer.paragraph('ВИСНОВКИ', 'Heading1', fragment=False)
+    for _ in range(max(3, body_per_slot // 2)):
+        writer.paragraph(_body_text(rng), body=True)
+
+    writer.paragraph('СПИСОК ВИКОРИСТАНИХ ДЖЕРЕЛ', 'Heading1', fragment=False)
+    for number in range(1, sources + 1):
+        site = rng.choice(SITES)
+        date = f'{rng.randint(1, 28):02d}.{rng.randint(9, 12):02d}.2025'
+        text = f'{_title(rng)} {rng.choice(DASHES)} {site}. URL: https://{site}/{rng.choice(WORDS)}'
+        if rng.random() < 0.7:
+            text += f' (дата звернення: {date}).'
+        writer.paragraph(f'{number}. {text}', body=True)
+
+    writer.paragraph('ДОДАТКИ', 'Heading1', fragment=False)
+    writer.paragraph(_body_text(rng), body=True)
+    writer.close()
+
+    doc.save(path)
+    return writer.paragraphs
+
+
+def cached_thesis(paragraphs=1000, tables=10, images=10, sources=100, fragmentation=3.0, seed=0,
+                  cache_dir=CACHE_DIR):
+    """Path of a generated thesis with these parameters, generating it on first use"""
+    name = f'thesis-v{GENERATOR_VERSION}-p{paragraphs}-t{tables}-i{images}-s{sources}-f{fragmentation:g}-{seed}.docx'
+    path = os.path.join(cache_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        partial = path + '.tmp'
+        generate(partial, paragraphs, tables, images, sources, fragmentation, seed)
+        os.replace(partial, path)
+    return path
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Generate a synthetic Ukrainian thesis docx')
+    parser.add_argument('-p', '--paragraphs', type=int, default=1000)
+    parser.add_argument('--tables', type=int, default=10)
+    parser.add_argument('--images', type=int, default=10)
+    parser.add_argument('--sources', type=int, default=100)
+    parser.add_argument('--fragmentation', type=float, default=3.0, help='mean runs per paragraph')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='output path (cached under .cache/bench by default)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    params = (args.paragraphs, args.tables, args.images, args.sources, args.fragmentation, args.seed)
+    if args.output:
+        generate(args.output, *params)
+        path = args.output
+    else:
+        path = cached_thesis(*params)
+    print(f"{path} ({os.path.getsize(path) / 1e6:.1f} МБ) за {time.perf_counter() - start:.2f} с")
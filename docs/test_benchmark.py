@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Перевірки позначення регресій у benchmark.compare."""
+
+from benchmark import is_regression
+
+
+def _stats(median, low, stdev):
+    return {'median': median, 'min': low, 'stdev': stdev, 'repeat': 5}
+
+
+def test_noise_is_not_a_regression():
+    # Медіана +46%, але min той самий і розкид великий
+    assert not is_regression(_stats(0.050, 0.045, 0.004), _stats(0.073, 0.046, 0.020))
+
+
+def test_consistent_slowdown_is_a_regression():
+    assert is_regression(_stats(0.050, 0.048, 0.001), _stats(0.070, 0.067, 0.002))
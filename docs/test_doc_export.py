@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Перевірки пошукового виразу і повторного експорту doc_export."""
+
+import pytest
+
+from doc_export import match_expression
+
+
+def test_terms_are_quoted():
+    assert match_expression('e-commerce "база даних" зап*') == '"e-commerce" "база даних" "зап"*'
+
+
+def test_not_keeps_exclusion():
+    assert match_expression('застосунок NOT тест') == '"застосунок" NOT "тест"'
+    with pytest.raises(ValueError):
+        match_expression('NOT застосунок')
+    with pytest.raises(ValueError):
+        match_expression('a OR NOT b')
+
+
+def test_outdated_export_is_refreshed(tmp_path):
+    from docx import Document
+
+    import doc_export
+
+    path = str(tmp_path / 'v1.docx')
+    document = Document()
+    document.add_paragraph('Автор\tНазва')
+    document.save(path)
+    connection = doc_export.connect(str(tmp_path / 'thesis.sqlite'))
+    assert doc_export.export(connection, [path], workers=1)['added'] == 1
+    assert doc_export.export(connection, [path], workers=1)['skipped'] == 1
+
+    connection.execute("UPDATE documents SET export_version = 0")
+    assert doc_export.export(connection, [path], workers=1)['updated'] == 1
+    assert connection.execute('SELECT text FROM paragraphs').fetchall() == [('Автор\tНазва',)]
+    assert connection.execute('SELECT export_version FROM documents').fetchone() == (doc_export.EXPORT_VERSION,)
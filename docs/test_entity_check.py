@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""Перевірки розбору сутностей TypeORM."""
+
+from entity_check import parse_entity_source
+
+SOURCE = r"""
+@Entity('products')
+export class Product {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ default: 'it\'s (x' })
+  note: string;
+
+  @Column({ default: 'http://example.com/a' }) // посилання
+  url: string;
+
+  /* @Column() ignored: string; */
+  @Column({ name: 'created_by' })
+  createdBy: string;
+}
+"""
+
+
+def test_escaped_quotes_and_urls_in_strings():
+    [entity] = parse_entity_source(SOURCE)
+    assert entity['table'] == 'products'
+    assert [column['property'] for column in entity['columns']] == ['id', 'note', 'url', 'createdBy']
+    assert entity['columns'][-1]['column'] == 'created_by'
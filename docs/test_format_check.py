@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Перевірки FormatChecker на синтетичних документах."""
+
+from docx import Document
+from docx.shared import Pt
+
+from format_check import FormatChecker, load_profile
+from style_resolver import StyleResolver
+
+
+def _body_document():
+    doc = Document()
+    normal = doc.styles['Normal']
+    normal.font.name = 'Times New Roman'
+    normal.font.size = Pt(14)
+    normal.paragraph_format.line_spacing = 1.5
+    normal.paragraph_format.first_line_indent = Pt(1.25 / 2.54 * 72)
+    normal.paragraph_format.alignment = 3  # justify
+    return doc
+
+
+def test_exact_spacing_under_multiple_style_is_flagged():
+    doc = _body_document()
+    doc.add_paragraph('Основний текст роботи.').paragraph_format.line_spacing = Pt(12)
+    violations = [v for v in FormatChecker(doc, load_profile()).check()[0] if v['scope'] == 'paragraph']
+    assert [(v['property'], v['actual']) for v in violations] == [('line_spacing', '12 pt')]
+
+
+def test_fix_restores_multiple_spacing():
+    doc = _body_document()
+    paragraph = doc.add_paragraph('Основний текст роботи.')
+    paragraph.paragraph_format.line_spacing = Pt(12)
+    FormatChecker(doc, load_profile()).fix()
+    assert StyleResolver(doc).paragraph(paragraph)['line_spacing'] == 1.5
+    assert not [v for v in FormatChecker(doc, load_profile()).check()[0] if v['scope'] == 'paragraph']
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Перевірки карти зміщень run_locator для табуляцій і розривів рядків."""
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+
+from run_locator import ParagraphText, paragraph_text
+
+
+def _paragraph(*runs):
+    paragraph = Document().add_paragraph()
+    for text in runs:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def test_text_matches_paragraph_text():
+    paragraph = _paragraph('Автор\tНазва', 'Рядок1\nРядок2')
+    assert ParagraphText(paragraph).text == paragraph.text
+    assert paragraph_text(paragraph._p) == paragraph.text
+
+
+def test_rewrite_tabbed_source_entry():
+    paragraph = _paragraph('Автор\tНазва')
+    ParagraphText(paragraph).rewrite('1. Автор\tНазва.')
+    assert paragraph.text == '1. Автор\tНазва.'
+    assert len(paragraph._p.xpath('.//w:tab')) == 1
+
+
+def test_rewrite_drops_replaced_break():
+    paragraph = _paragraph('Line1\nLine2')
+    ParagraphText(paragraph).rewrite('New')
+    assert paragraph.text == 'New'
+    assert not paragraph._p.xpath('.//w:br')
+
+
+def test_replace_tab_and_insert_around_it():
+    paragraph = _paragraph('A\tB\tC')
+    ParagraphText(paragraph).replace('\t', ' | ')
+    assert paragraph.text == 'A | B | C'
+
+    paragraph = _paragraph('X\t')
+    ParagraphText(paragraph).replace_span(2, 2, 'end')
+    assert paragraph.text == 'X\tend'
+    ParagraphText(paragraph).rewrite('\tX\tend')
+    assert paragraph.text == '\tX\tend'
+
+
+def test_page_break_is_kept():
+    paragraph = _paragraph('pg')
+    paragraph.runs[0].add_break(WD_BREAK.PAGE)
+    paragraph.add_run('two')
+    locator = ParagraphText(paragraph)
+    assert locator.text == 'pgtwo'
+    locator.rewrite('PGTWO')
+    assert paragraph.text == 'PGTWO'
+    assert len(paragraph._p.xpath('.//w:br')) == 1
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Перевірки злиття властивостей абзацу в StyleResolver."""
+
+from docx import Document
+from docx.shared import Pt
+
+from style_resolver import StyleResolver
+
+
+def test_direct_exact_spacing_replaces_style_multiple():
+    doc = Document()
+    doc.styles['Normal'].paragraph_format.line_spacing = 1.5
+    paragraph = doc.add_paragraph('Текст')
+    paragraph.paragraph_format.line_spacing = Pt(12)
+    props = StyleResolver(doc).paragraph(paragraph)
+    assert props['line_spacing_pt'] == 12.0
+    assert 'line_spacing' not in props
+
+
+def test_style_multiple_replaces_based_on_exact_spacing():
+    doc = Document()
+    doc.styles['Normal'].paragraph_format.line_spacing = Pt(12)
+    doc.styles['Heading 1'].paragraph_format.line_spacing = 1.5
+    props = StyleResolver(doc).paragraph(doc.add_paragraph('Заголовок', 'Heading 1'))
+    assert props['line_spacing'] == 1.5
+    assert 'line_spacing_pt' not in props
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Перевірки виразу FTS5 для пошукових запитів thesis_index."""
+
+import pytest
+
+from thesis_index import join_expression, match_expression
+
+
+def test_leading_not_is_rejected():
+    with pytest.raises(ValueError):
+        match_expression('NOT застосунок')
+
+
+def test_trailing_not_is_dropped():
+    assert match_expression('застосунок NOT') == match_expression('застосунок')
+
+
+def test_or_not_is_rejected():
+    with pytest.raises(ValueError):
+        match_expression('тест OR NOT застосунок')
+
+
+def test_operators_between_terms():
+    assert join_expression(['"a"', 'AND', 'NOT', '"b"']) == '"a" NOT "b"'
+    assert join_expression(['OR', '"a"', 'OR', 'AND', '"b"', 'AND']) == '"a" OR "b"'
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Перевірки розбиття тексту на речення."""
+
+from ukrainian_text import split_sentences
+
+
+def test_no_split_after_figure_reference():
+    text = 'Системи дотримуються наступних основних законів (рис. 1.2). Далі текст.'
+    assert split_sentences(text) == ['Системи дотримуються наступних основних законів (рис. 1.2).', 'Далі текст.']
+
+
+def test_no_split_after_abbreviations():
+    assert split_sentences('Див. табл. 2.1 на с. 25. Інше речення.') == ['Див. табл. 2.1 на с. 25.', 'Інше речення.']
+
+
+def test_split_after_ordinary_sentence():
+    assert split_sentences('Перше речення. Друге? Третє!') == ['Перше речення.', 'Друге?', 'Третє!']
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Виправлення друкарських помилок і термінології за словником за один прохід.
+
+Усі пари "помилка -> виправлення" (corrections.tsv, тисячі рядків) один раз
+збираються в автомат Ахо-Корасік. Текст кожного абзацу сканується один раз
+незалежно від розміру словника; зі збігів беруться найдовші цілі слова
+зліва направо, регістр збігу переноситься на виправлення, а заміна
+виконується через run_locator, тож помилка, розбита Word на кілька run,
+теж виправляється без втрати форматування.
+
+Використання:
+    python text_corrector.py документ.docx [-o результат.docx]
+                             [--dict corrections.tsv] [--dry-run]
+"""
+
+from collections import Counter, deque
+import argparse
+import json
+import os
+import sys
+import time
+
+from run_locator import ParagraphText, iter_paragraphs
+from ukrainian_text import APOSTROPHES
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DICTIONARY = os.path.join(DOCS_DIR, 'corrections.tsv')
+
+_FOLD_TABLE = str.maketrans({ch: "'" for ch in APOSTROPHES})
+
+
+def fold(text):
+    """Lower case with unified apostrophes; keeps the length of text"""
+    folded = text.translate(_FOLD_TABLE).lower()
+    if len(folded) == len(text):
+        return folded
+    # Рідкісні символи, у яких lower() змінює довжину (İ), лишаються як є
+    return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text.translate(_FOLD_TABLE))
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "'" or ch in APOSTROPHES
+
+
+def match_case(source, replacement):
+    """
+    Carry the case pattern of source (UPPER / Title / lower) onto replacement.
+
+    A replacement that has capitals of its own (names, acronyms) is kept as
+    written unless the source is all upper case.
+    """
+    letters = [ch for ch in source if ch.isalpha()]
+    if len(letters) > 1 and all(ch.isupper() for ch in letters):
+        return replacement.upper()
+    if replacement != replacement.lower():
+        return replacement
+    if letters and letters[0].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement
+
+
+def load_dictionary(path=DEFAULT_DICTIONARY):
+    """{wrong: right} from a TSV ("wrong<TAB>right", # comments) or a JSON object"""
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    pairs = {}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            wrong, _, right = line.partition('\t')
+            if right:
+                pairs[wrong.strip()] = right.strip()
+    return pairs
+
+
+class Corrector:
+    """Aho-Corasick automaton over the folded dictionary keys"""
+
+    def __init__(self, pairs):
+        self.patterns = []
+        self.replacements = []
+        # Вузол автомата: переходи, посилання-невдача, (довжина, номер шаблону)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+        self._dict_link = [0]
+
+        for wrong, right in pairs.items():
+            key = fold(wrong)
+            if not key:
+                continue
+            node = 0
+            for ch in key:
+                following = self._goto[node].get(ch)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[node][ch] = following
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                    self._dict_link.append(0)
+                node = following
+            if self._output[node] is None:
+                self._output[node] = (len(key), len(self.patterns))
+                self.patterns.append(wrong)
+                self.replacements.append(right)
+        self._link()
+
+    def _link(self):
+        """Failure and dictionary-suffix links, breadth first"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                state = self._fail[node]
+                while state and ch not in self._goto[state]:
+                    state = self._fail[state]
+                target = self._goto[state].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._dict_link[child] = fail if self._output[fail] is not None else self._dict_link[fail]
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def matches(self, text):
+        """All (start, end, pattern index) occurrences in text, any position"""
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        node = 0
+        for position, ch in enumerate(fold(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if output[node] is not None else dict_link[node]
+            while hit:
+                length, index = output[hit]
+                yield position + 1 - length, position + 1, index
+                hit = dict_link[hit]
+
+    def spans(self, text):
+        """Whole-word, non-overlapping, leftmost-longest [(start, end, replacement, index)]"""
+        candidates = []
+        for start, end, index in self.matches(text):
+            if start and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                continue
+            if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                continue
+            candidates.append((start, -end, index))
+        candidates.sort()
+
+        result = []
+        covered = 0
+        for start, negative_end, index in candidates:
+            if start < covered:
+                continue
+            end = -negative_end
+            result.append((start, end, match_case(text[start:end], self.replacements[index]), index))
+            covered = end
+        return result
+
+    def correct(self, text, hits=None):
+        """Corrected copy of a plain string; hits (Counter) collects pattern counts"""
+        pieces = []
+        previous = 0
+        for start, end, replacement, index in self.spans(text):
+            pieces.append(text[previous:start])
+            pieces.append(replacement)
+            previous = end
+            if hits is not None:
+                hits[self.patterns[index]] += 1
+        pieces.append(text[previous:])
+        return ''.join(pieces)
+
+    def apply(self, doc, tables=True, dry_run=False):
+        """
+        Correct every paragraph of doc in place.
+
+        Returns Counter {pattern: hits}; with dry_run the document is left
+        unchanged and only the report is built.
+        """
+        hits = Counter()
+        for p in iter_paragraphs(doc, tables):
+            paragraph = ParagraphText(p)
+            spans = self.spans(paragraph.text)
+            if not spans:
+                continue
+            for _, _, _, index in spans:
+                hits[self.patterns[index]] += 1
+            if not dry_run:
+                paragraph.replace_spans([(start, end, new) for start, end, new, _ in spans])
+        return hits
+
+
+def load_corrector(path=DEFAULT_DICTIONARY):
+    return Corrector(load_dictionary(path))
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    from docx import Document
+
+    parser = argparse.ArgumentParser(description='Fix typos and terminology in a docx from a dictionary')
+    parser.add_argument('docx')
+    parser.add_argument('-o', '--output', help='output path (the input is overwritten by default)')
+    parser.add_argument('--dict', default=DEFAULT_DICTIONARY, help='TSV or JSON dictionary')
+    parser.add_argument('--dry-run', action='store_true', help='only report hits')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    corrector = load_corrector(args.dict)
+    built = time.perf_counter()
+
+    doc = Document(args.docx)
+    hits = corrector.apply(doc, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - built
+
+    print(f"Словник: {len(corrector)} шаблонів, автомат за {(built - start) * 1000:.1f} мс")
+    print(f"Сканування: {elapsed:.3f} с\n")
+    fixes = dict(zip(corrector.patterns, corrector.replacements))
+    for pattern, count in hits.most_common():
+        print(f"  {count:4}  {pattern} -> {fixes[pattern]}")
+    print(f"\nВсього виправлень: {sum(hits.values())}")
+
+    if not args.dry_run and hits:
+        output = args.output or args.docx
+        doc.save(output)
+        print(f"Документ збережено: {output}")
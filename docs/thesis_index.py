@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Постійний повнотекстовий індекс версій роботи та документації (SQLite FTS5).
+
+Замість окремих скриптів пошуку (find_diagrams.py, find_sources.py, ...),
+які щоразу відкривають docx, абзаци всіх версій роботи і docs/*.md один раз
+записуються в FTS5-таблицю. Текст нормалізується через ukrainian_text:
+регістр, варіанти апострофа (' ʼ ’) і легкий стемінг, тож "застосунку"
+знаходить і "застосунки", "застосунків". Для кожного абзацу зберігаються версія, розділ
+і номер абзацу (як doc.paragraphs[i] у скриптах). Повторне індексування
+пропускає файли з незмінним хешем і переписує лише змінені.
+
+Використання:
+    python thesis_index.py update [файли ...]
+    python thesis_index.py search "запит" [-n 20] [--version UPDATED4]
+    python thesis_index.py list
+"""
+
+from docx import Document
+import argparse
+import glob
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from hashing import file_hash
+from markdown_blocks import tokenize_blocks
+from ukrainian_text import WORD_RE, normalize, stem, tokenize
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(DOCS_DIR, '.cache', 'search.sqlite')
+
+THESIS_GLOBS = [
+    r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА*.docx',
+    r'C:\Users\Iurii\Desktop\magister\*.docx',
+]
+
+SECTION_RE = re.compile(
+    r'^(РОЗДІЛ\s+\d+|\d+\.\d+(\.\d+)?\.?\s|ВСТУП|ВИСНОВКИ|СПИСОК ВИКОРИСТАНИХ ДЖЕРЕЛ|ДОДАТ)',
+    re.IGNORECASE,
+)
+MAX_SECTION_LENGTH = 150
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    version TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    paragraph_count INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS paragraphs USING fts5(
+    terms,
+    text UNINDEXED,
+    document_id UNINDEXED,
+    section UNINDEXED,
+    position UNINDEXED,
+    tokenize = "unicode61 tokenchars ''''"
+);
+"""
+
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+OPERATORS = ('OR', 'NOT', 'AND')
+
+
+def terms(text):
+    """Normalized, stemmed words of text joined for the FTS column"""
+    return ' '.join(tokenize(text, stemming=True, stopwords=False))
+
+
+def version_name(path):
+    """Short version label: file name without extension"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# --- Читання джерел: (position, section, text) ---
+
+def docx_paragraphs(path):
+    section = ''
+    for position, para in enumerate(Document(path).paragraphs):
+        text = para.text.strip()
+        if not text:
+            continue
+        if para.style.name.startswith('Heading') or \
+                (len(text) < MAX_SECTION_LENGTH and SECTION_RE.match(text)):
+            section = text
+        yield position, section, text
+
+
+def markdown_paragraphs(path):
+    section = ''
+    with open(path, 'r', encoding='utf-8') as f:
+        for position, block in enumerate(tokenize_blocks(f)):
+            text = block.get('text', '').strip()
+            if not text:
+                continue
+            if block['type'] == 'heading':
+                section = text
+            yield position, section, text
+
+
+READERS = {'.docx': docx_paragraphs, '.md': markdown_paragraphs}
+
+
+def default_sources():
+    sources = []
+    for pattern in THESIS_GLOBS:
+        sources.extend(sorted(glob.glob(pattern)))
+    sources.extend(sorted(glob.glob(os.path.join(DOCS_DIR, '*.md'))))
+    return sources
+
+
+# --- Індекс ---
+
+def connect(index_path=INDEX_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    connection = sqlite3.connect(index_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def update_index(connection, sources):
+    """
+    Index new and changed sources; unchanged files (same hash) are skipped.
+
+    Returns {'added': n, 'updated': n, 'skipped': n, 'paragraphs': n}.
+    """
+    stats = {'added': 0, 'updated': 0, 'skipped': 0, 'paragraphs': 0}
+    for path in sources:
+        path = os.path.abspath(path)
+        reader = READERS.get(os.path.splitext(path)[1].lower())
+        if reader is None or not os.path.exists(path):
+            continue
+        digest = file_hash(path)
+        row = connection.execute('SELECT id, hash FROM documents WHERE path = ?', (path,)).fetchone()
+        if row and row[1] == digest:
+            stats['skipped'] += 1
+            continue
+
+        rows = [(terms(text), text, section, position) for position, section, text in reader(path)]
+        with connection:
+            if row:
+                document_id = row[0]
+                connection.execute('DELETE FROM paragraphs WHERE document_id = ?', (document_id,))
+                connection.execute(
+                    'UPDATE documents SET hash = ?, paragraph_count = ?, indexed_at = ? WHERE id = ?',
+                    (digest, len(rows), time.time(), document_id),
+                )
+                stats['updated'] += 1
+            else:
+                document_id = connection.execute(
+                    'INSERT INTO documents (path, version, hash, paragraph_count, indexed_at) VALUES (?, ?, ?, ?, ?)',
+                    (path, version_name(path), digest, len(rows), time.time()),
+                ).lastrowid
+                stats['added'] += 1
+            connection.executemany(
+                'INSERT INTO paragraphs (terms, text, document_id, section, position) VALUES (?, ?, ?, ?, ?)',
+                [(t, text, document_id, section, position) for t, text, section, position in rows],
+            )
+        stats['paragraphs'] += len(rows)
+    return stats
+
+
+def join_expression(parts):
+    """
+    Join quoted FTS5 terms and operators.
+
+    OR / AND without a term on both sides (leading, trailing, repeated or
+    left by a dropped word) are dropped. NOT in FTS5 is binary "a NOT b", so
+    a NOT without a term on its left (leading or after OR) raises ValueError
+    instead of turning the excluded term into a required one; a trailing NOT
+    excludes nothing and is dropped.
+    """
+    expression = []
+    operators = []
+    for part in parts:
+        if part in OPERATORS:
+            operators.append(part)
+            continue
+        if 'NOT' in operators:
+            # AND NOT = NOT; OR NOT чи NOT без терміна зліва у FTS5 не виразити
+            if not expression or 'OR' in operators:
+                raise ValueError(f"NOT needs a term on its left: {' '.join(operators)} {part}")
+            expression.append('NOT')
+        elif operators and expression:
+            expression.append(operators[0])
+        operators = []
+        expression.append(part)
+    return ' '.join(expression)
+
+
+def match_expression(query):
+    """
+    FTS5 MATCH expression for a user query.
+
+    Words are normalized and stemmed and must all occur; "quoted text" is a
+    phrase; word* is a prefix search; OR / NOT / AND are kept between terms.
+    """
+    parts = []
+    for phrase, word in QUERY_RE.findall(query):
+        if word in OPERATORS:
+            parts.append(word)
+        elif phrase:
+            tokens = tokenize(phrase, stemming=True, stopwords=False)
+            if tokens:
+                parts.append('"' + ' '.join(tokens) + '"')
+        elif word.endswith('*'):
+            tokens = WORD_RE.findall(normalize(word[:-1]))
+            if tokens:
+                parts.append(f'"{tokens[0]}"*')
+        else:
+            parts.extend(f'"{token}"' for token in tokenize(word, stemming=True, stopwords=False))
+    return join_expression(parts)
+
+
+def search(connection, query, limit=20, version=None):
+    """[(version, section, position, text)] best matches first (bm25)"""
+    expression = match_expression(query)
+    if not expression:
+        return []
+    sql = (
+        'SELECT d.version, paragraphs.section, paragraphs.position, paragraphs.text FROM paragraphs '
+        'JOIN documents d ON d.id = paragraphs.document_id WHERE paragraphs MATCH ?'
+    )
+    params = [expression]
+    if version:
+        sql += ' AND d.version LIKE ?'
+        params.append(f'%{version}%')
+    sql += ' ORDER BY bm25(paragraphs) LIMIT ?'
+    params.append(limit)
+    return connection.execute(sql, params).fetchall()
+
+
+def excerpt(text, query, width=160):
+    """Part of text around the first word matching the query stems"""
+    stems = set(tokenize(query, stemming=True, stopwords=False))
+    normalized = normalize(text)
+    if len(normalized) != len(text):
+        normalized = ''
+    for match in WORD_RE.finditer(normalized):
+        if stem(match.group(0)) in stems:
+            start = max(0, match.start() - width // 3)
+            prefix = '...' if start else ''
+            suffix = '...' if start + width < len(text) else ''
+            return prefix + text[start:start + width] + suffix
+    return text[:width] + ('...' if len(text) > width else '')
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='Full-text index over thesis versions and docs')
+    parser.add_argument('--index', default=INDEX_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = commands.add_parser('update', help='index new or changed files')
+    update_parser.add_argument('sources', nargs='*')
+
+    search_parser = commands.add_parser('search', help='query the index')
+    search_parser.add_argument('query')
+    search_parser.add_argument('-n', '--limit', type=int, default=20)
+    search_parser.add_argument('--version', help='only versions containing this text')
+
+    commands.add_parser('list', help='indexed documents')
+    args = parser.parse_args()
+
+    connection = connect(args.index)
+
+    if args.command == 'update':
+        start = time.perf_counter()
+        stats = update_index(connection, args.sources or default_sources())
+        print(f"Додано: {stats['added']}, оновлено: {stats['updated']}, без змін: {stats['skipped']}, "
+              f"абзаців: {stats['paragraphs']} за {time.perf_counter() - start:.2f} с")
+
+    elif args.command == 'search':
+        start = time.perf_counter()
+        try:
+            hits = search(connection, args.query, args.limit, args.version)
+        except (ValueError, sqlite3.OperationalError) as e:
+            print(f"Некоректний запит: {e}")
+            sys.exit(1)
+        elapsed = (time.perf_counter() - start) * 1000
+        for version, section, position, text in hits:
+            print(f"[{version}] [{position}] {section[:60]}")
+            print(f"    {excerpt(text, args.query)}\n")
+        print(f"Знайдено: {len(hits)} за {elapsed:.1f} мс")
+
+    else:
+        for version, path, paragraphs in connection.execute(
+                'SELECT version, path, paragraph_count FROM documents ORDER BY version'):
+            print(f"{version:50} {paragraphs:6}  {path}")
+
+    connection.close()
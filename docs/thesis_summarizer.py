@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Екстрактивне резюмування магістерської роботи у пункти для слайдів.
+
+Текст групується за заголовками (як у create_presentation.read_thesis_content),
+розбивається на речення, для всіх речень будується розріджена TF-IDF матриця
+(SciPy CSR), і для кожного розділу обираються top-k речень за MMR
+(релевантність до центроїда розділу мінус схожість з уже обраними).
+Матриця кешується за хешем документа.
+"""
+
+from docx import Document
+from scipy import sparse
+import numpy as np
+import json
+import os
+import sys
+
+from hashing import file_hash
+from ukrainian_text import split_sentences, tokenize
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'tfidf')
+
+MIN_TOKENS = 5
+MAX_TOKENS = 40
+
+
+def read_sections(docx_path):
+    """Return [(heading, [sentences])] grouped by Heading styles"""
+    doc = Document(docx_path)
+    sections = []
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+        if para.style.name.startswith('Heading'):
+            sections.append((text, []))
+        elif sections:
+            sections[-1][1].extend(split_sentences(text))
+    return [(heading, sentences) for heading, sentences in sections if sentences]
+
+
+def build_tfidf(sentences):
+    """L2-normalized TF-IDF CSR matrix (sentences x vocabulary)"""
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    data = []
+    for sentence in sentences:
+        counts = {}
+        for token in tokenize(sentence):
+            column = vocabulary.setdefault(token, len(vocabulary))
+            counts[column] = counts.get(column, 0) + 1
+        indices.extend(counts.keys())
+        data.extend(counts.values())
+        indptr.append(len(indices))
+
+    tf = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+        shape=(len(sentences), len(vocabulary)),
+    )
+    tf.data = 1.0 + np.log(tf.data)
+
+    df = np.bincount(tf.indices, minlength=tf.shape[1])
+    idf = np.log((1.0 + tf.shape[0]) / (1.0 + df)) + 1.0
+    tfidf = tf.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ tfidf
+
+
+def load_matrix(docx_path, cache_dir=CACHE_DIR):
+    """Return (sections, tfidf) for the document, cached by document hash"""
+    entry = os.path.join(cache_dir, file_hash(docx_path))
+    matrix_path = entry + '.npz'
+    sections_path = entry + '.json'
+
+    if os.path.exists(matrix_path) and os.path.exists(sections_path):
+        with open(sections_path, 'r', encoding='utf-8') as f:
+            sections = json.load(f)
+        return sections, sparse.load_npz(matrix_path).tocsr()
+
+    sections = read_sections(docx_path)
+    tfidf = build_tfidf([s for _, sentences in sections for s in sentences])
+
+    os.makedirs(cache_dir, exist_ok=True)
+    sparse.save_npz(matrix_path, tfidf)
+    with open(sections_path, 'w', encoding='utf-8') as f:
+        json.dump(sections, f, ensure_ascii=False)
+    return sections, tfidf
+
+
+def mmr_select(matrix, candidates, k, diversity=0.3):
+    """Pick k rows of matrix (among candidates) by Maximal Marginal Relevance"""
+    if not candidates:
+        return []
+    rows = matrix[candidates]
+    centroid = np.asarray(rows.mean(axis=0)).ravel()
+    relevance = rows @ centroid
+    similarity = (rows @ rows.T).toarray()
+
+    selected = []
+    redundancy = np.zeros(len(candidates))
+    available = np.ones(len(candidates), dtype=bool)
+    for _ in range(min(k, len(candidates))):
+        score = (1 - diversity) * relevance - diversity * redundancy
+        score[~available] = -np.inf
+        best = int(np.argmax(score))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, similarity[best])
+
+    # Порядок як у тексті роботи
+    return [candidates[i] for i in sorted(selected)]
+
+
+def summarize(docx_path, k=4, diversity=0.3, cache_dir=CACHE_DIR):
+    """Return [(heading, [sentences])] with up to k sentences per section"""
+    sections, tfidf = load_matrix(docx_path, cache_dir)
+
+    summary = []
+    offset = 0
+    for heading, sentences in sections:
+        candidates = [
+            offset + i for i, sentence in enumerate(sentences)
+            if MIN_TOKENS <= len(tokenize(sentence, stemming=False)) <= MAX_TOKENS
+        ]
+        chosen = mmr_select(tfidf, candidates, k, diversity)
+        summary.append((heading, [sentences[i - offset] for i in chosen]))
+        offset += len(sentences)
+    return summary
+
+
+def to_slide_specs(summary, size=14):
+    """Convert a summary to manifest entries for the content slide builder"""
+    return [
+        {
+            'type': 'content',
+            'title': heading,
+            'content_items': [{'text': sentence, 'level': 0, 'size': size} for sentence in sentences],
+        }
+        for heading, sentences in summary if sentences
+    ]
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    docx_path = r"C:\Users\Iurii\Desktop\magister\ФКНТ_2025_121_магістр_Хоменко Ю.Ю..docx"
+
+    for heading, sentences in summarize(docx_path):
+        print(f"\n{heading}")
+        for sentence in sentences:
+            print(f"  - {sentence}")
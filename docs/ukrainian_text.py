@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Нормалізація та токенізація українського тексту.
+
+Спільні правила для аналітичних скриптів: приведення регістру, уніфікація
+апострофів (' ʼ ’), розбиття на речення та слова, стоп-слова і легкий
+стемінг відкиданням типових закінчень.
+"""
+
+import re
+import unicodedata
+
+APOSTROPHES = "'ʼ’‘`´"
+_APOSTROPHE_TABLE = str.maketrans({ch: "'" for ch in APOSTROPHES})
+
+WORD_RE = re.compile(r"[0-9a-zа-щьюяєіїґ]+(?:'[а-щьюяєіїґ]+)*")
+
+SENTENCE_RE = re.compile(r'(?<=[.!?…])\s+(?=[«"(\[]?[A-ZА-ЩЬЮЯЄІЇҐ0-9])')
+
+# Скорочення, після яких крапка не закінчує речення ("рис. 1.2", "с. 25", "т. д.")
+ABBREVIATION_RE = re.compile(
+    r'(?:^|[\s(«"\[])(?:рис|табл|мал|див|розд|підрозд|с|п|пп|ст|напр|ім|т\.\s?[дп]|і\s?т\.\s?ін|та\s?ін|ін)\.$',
+    re.IGNORECASE)
+
+STOPWORDS = frozenset("""
+а або але би був була були було бути в вже від він вона вони воно все всі
+всіх для до є же з за и із її їх й його як яка яке які який якщо і інших
+к коли крім лише між ми на над навіть не нею ним них ні но о об обо однак
+основі по при про та так також там те тим тих то того тому тощо у це цей
+ці цим цих цієї цього чи що щоб ця під після перед саме своїх своє свій
+своя свої себе ще уже шляхом рамках тобто оскільки можна може можуть має
+мають
+the a an and or of to in on for with is are be by as at from this that
+""".split())
+
+# Закінчення для легкого стемінгу, від довших до коротших
+SUFFIXES = sorted(set("""
+ювання ування ання ення іння ття ість ості істю
+ами ями ові еві ого ього ому ьому ими іми их іх ий ій ою ею ої
+ам ям ах ях ів їв ем ом ой ей ую юю ає ить ать ють уть ити ати
+а я о е у ю і ї и є ь й
+""".split()), key=len, reverse=True)
+
+MIN_STEM = 3
+
+
+def normalize(text):
+    """Case-fold, unify apostrophes and Unicode composition"""
+    text = unicodedata.normalize('NFC', text)
+    return text.translate(_APOSTROPHE_TABLE).casefold()
+
+
+def stem(word):
+    """Strip the longest known ending, keeping at least MIN_STEM letters"""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text, stemming=True, stopwords=True):
+    """Normalized word tokens of text"""
+    words = WORD_RE.findall(normalize(text))
+    if stopwords:
+        words = [w for w in words if w not in STOPWORDS]
+    if stemming:
+        words = [stem(w) for w in words]
+    return words
+
+
+def split_sentences(text):
+    """Split a paragraph into sentences (not after abbreviations like "рис.")"""
+    sentences = []
+    glued = False
+    for piece in SENTENCE_RE.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if glued:
+            sentences[-1] += ' ' + piece
+        else:
+            sentences.append(piece)
+        glued = bool(ABBREVIATION_RE.search(piece))
+    return sentences
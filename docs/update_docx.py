@@ -4,6 +4,8 @@ from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from text_corrector import load_corrector
+
 doc_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED.docx'
 output_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED2.docx'
 
@@ -49,6 +51,16 @@ figure_descriptions = {
     'Рисунок 3.16. Еелктронний лист зі сповіщенням про оновлення товарів у кошику': 'Електронний лист зі сповіщенням про залишені товари у кошику демонструє шаблон email-повідомлення, яке надсилається користувачам для нагадування про незавершене замовлення. Лист містить логотип магазину, персоналізоване звернення до клієнта, список товарів у кошику із зображеннями та цінами, загальну суму та помітну кнопку заклику до дії "Завершити покупку". Також може включати промокод на знижку для стимулювання завершення замовлення.'
 }
 
+# Fix typos and terminology (corrections.tsv) in the document and in the
+# 3.2-3.4 dictionary, so captions like 'Діаграма перцедентів' still match
+corrector = load_corrector()
+hits = corrector.apply(doc)
+print(f'Corrections in document: {sum(hits.values())}')
+figure_descriptions_32_34 = {
+    corrector.correct(caption): corrector.correct(description)
+    for caption, description in figure_descriptions_32_34.items()
+}
+
 # Process document - insert descriptions after figure captions
 in_section_32_34 = False
 in_section_36 = False
@@ -11,8 +11,13 @@ from datetime import datetime, timedelta
 import re
 import copy
 
+from doc_transaction import DocumentTransaction
+
 doc = Document(r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED4.docx')
 
+# Проміжні стани зберігаються в пам'яті, на диск пишеться лише результат
+transaction = DocumentTransaction(doc, verbose=True)
+
 # ===== КОНФІГУРАЦІЯ =====
 
 # Висновки до розділів
@@ -176,19 +181,15 @@ if section_36_start and section_36_end:
             doc.paragraphs[i].text = new_text
             print(f"[{i}] {new_text[:70]}...")
 
-# ===== КРОК 3: ЗБЕРІГАЄМО ПРОМІЖНИЙ РЕЗУЛЬТАТ =====
+# ===== КРОК 3: ТОЧКА ЗБЕРЕЖЕННЯ ПЕРЕД ВСТАВКОЮ =====
 
-intermediate_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_TEMP.docx'
-doc.save(intermediate_path)
-print(f"\n=== Збережено проміжний результат: {intermediate_path} ===")
+# Замість ..._TEMP.docx: до цього стану можна повернутися transaction.rollback('підписи')
+transaction.savepoint('підписи')
 
 # ===== КРОК 4: ДОДАЄМО ВИСНОВКИ ДО РОЗДІЛІВ =====
 
 print("\n=== ДОДАВАННЯ ВИСНОВКІВ ДО РОЗДІЛІВ ===\n")
 
-# Завантажуємо документ знову для вставки
-doc = Document(intermediate_path)
-
 # Функція для вставки параграфа з текстом
 def insert_conclusion(doc, position, conclusion_text, style_name='Дефолт1'):
     """Вставляє висновок перед вказаною позицією"""
@@ -249,14 +250,6 @@ if section_1_end:
 # ===== ЗБЕРІГАЄМО ФІНАЛЬНИЙ РЕЗУЛЬТАТ =====
 
 output_path = r'C:\Users\Iurii\Downloads\ХОМЕНКО_521_МАГІСТЕРСЬКА_UPDATED5.docx'
-doc.save(output_path)
+transaction.commit(output_path)
 
 print(f"\n=== ГОТОВО! Збережено: {output_path} ===")
-
-# Видаляємо тимчасовий файл
-import os
-try:
-    os.remove(intermediate_path)
-    print(f"Видалено тимчасовий файл: {intermediate_path}")
-except:
-    pass